@@ -0,0 +1,55 @@
+import os
+
+# Arayüz ve motor sürecinin ortak yapılandırması. Bu modül yalnızca standart kütüphaneyi kullanır;
+# arayüz süreci buradan okuyarak Pandas, Selenium ve aiohttp'yi yüklemez.
+
+# --- Global Yapılandırma ve Sabitler ---
+# Chrome kullanıcı verilerinin saklanacağı yol. QR kodunu tekrar okutmamak için.
+CHROME_PROFILE_PATH = os.path.join(os.path.expanduser("~"), "whatsapp_profile")
+
+# Ardışık hazırlık (pipeline) modu: hız sınırlayıcıdan gönderim hakkı Enter'dan hemen önce alınır.
+# Bir sonraki alıcının sohbeti açılıp mesajı yazılırken kovalar dolmaya devam eder; böylece
+# gezinme ve yazma gecikmesi tempo beklemesinin içinde gizlenir.
+PIPELINE_MODE = True
+
+# Gönderim motoru: "selenium" (varsayılan), "playwright" (async API, aynı Chrome profili;
+# 'pip install playwright' gerektirir) veya "cloud_api" (resmi Business Cloud API; 'pip install aiohttp'
+# ve WA_CLOUD_* ortam değişkenleri gerektirir) veya "multi_profile" (profiles.json'daki her profil için
+# bir Selenium oturumu, ortak kuyruk ve profil başına hız sınırı). Motor her gönderimin başında seçilir.
+ENGINE = "selenium"
+ENGINES = ["selenium", "playwright", "cloud_api", "multi_profile"]
+
+# Hız modları birer ön ayardır: dakika/saat/gün başına en fazla mesaj ve dakika kovasının patlama
+# kapasitesi (beklemeden art arda gönderilebilecek mesaj). 'fail_interval', gönderilemeyen
+# (ör. geçersiz numara) alıcılar arasında bırakılan asgari süredir (sn).
+RATE_PRESETS = {
+    "SAFE": {'per_minute': 6, 'per_hour': 200, 'per_day': 1000, 'burst': 1, 'fail_interval': 7},
+    "FAST": {'per_minute': 10, 'per_hour': 400, 'per_day': 2000, 'burst': 2, 'fail_interval': 4},
+    "TURBO": {'per_minute': 18, 'per_hour': 600, 'per_day': 3000, 'burst': 3, 'fail_interval': 2},
+}
+DEFAULT_PRESET = "FAST"
+
+# Tarayıcı ayarlarının varsayılanları. SessionManager.settings üzerinden değiştirilebilir;
+# değişiklikler bir sonraki tarayıcı başlatılışında geçerli olur.
+DEFAULT_BROWSER_SETTINGS = {
+    'lean_mode': False,   # Ağır kaynakları (görsel, medya, yazı tipi) engelleyen hafif mod
+    # Sayfa yükleme stratejisi: "normal" (load olayı), "eager" (DOMContentLoaded), "none" (hemen döner).
+    # Erken dönen stratejilerde güvenlik, SessionManager'daki DOM hazır olma kontrolleriyle sağlanır.
+    'page_load_strategy': "eager",
+    'page_load_timeout': 30,   # driver.get için azami süre (sn); aşılırsa yükleme durdurulup devam edilir
+    'script_timeout': 15,      # execute_async_script için azami süre (sn)
+    # Görünmez (headless) çalışma: aynı CHROME_PROFILE_PATH ile, ekran olmadan.
+    # WA_HEADLESS=1 ortam değişkeniyle varsayılan olarak açılabilir (sunucular için).
+    'headless': os.environ.get("WA_HEADLESS", "").lower() in ("1", "true", "yes"),
+    # Görünmez modda sabit görünüm alanı; XPath seçicilerinin masaüstü düzenine göre çözülmesi için.
+    'window_size': (1920, 1080),
+}
+# Geçerli sayfa yükleme stratejileri.
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+# Oturum durumları (arayüzde gösterilir).
+STATE_CLOSED = "closed"        # Tarayıcı kapalı
+STATE_LAUNCHING = "launching"  # Tarayıcı başlatılıyor / oturum bekleniyor
+STATE_QR_REQUIRED = "qr"       # QR kodunun okutulması bekleniyor
+STATE_READY = "ready"          # Oturum açık, gönderime hazır
+STATE_FAILED = "failed"        # Son başlatma denemesi başarısız oldu
@@ -2,54 +2,88 @@ import pandas as pd
 import time
 import os
 import re
+import csv
+import threading
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import xlsxwriter # Pandas'ın Excel raporlama için kullandığı kütüphane
 
+# Tarayıcı oturumu (Chrome profili, başlatma, sağlık kontrolü) SessionManager'a aittir.
+from session_manager import SessionManager
+# Mesaj iletimi Transport arayüzünün arkasındadır; döngü yalnızca bu arayüze bağlıdır.
+from transport import BroadcastCancelled, FakeTransport, DELIVERED_OUTCOMES, STOP_POLL_INTERVAL
+from selenium_transport import SeleniumTransport
+from playwright_engine import PlaywrightTransport
+from cloud_api_transport import CloudApiTransport
+from worker_pool import ProfileWorkerPool
+# Gönderimler arasındaki tempo dakika/saat/gün jeton kovalarıyla belirlenir (hız modları birer ön ayardır).
+from rate_limiter import RateLimiter, rate_state_path
+# Motor seçimi ve ardışık hazırlık varsayılanı arayüzle ortaktır.
+from app_config import ENGINE, PIPELINE_MODE
+# Cloud API teslim/okunma durumlarını alan gömülü webhook sunucusu (aiohttp gerektirir).
+from webhook_receiver import WebhookReceiver, STATUS_RANK
+
 # --- Global Yapılandırma ve Sabitler ---
-# Chrome kullanıcı verilerinin saklanacağı yol. QR kodunu tekrar okutmamak için.
-CHROME_PROFILE_PATH = os.path.join(os.path.expanduser("~"), "whatsapp_profile") 
 
 # Raporların kaydedileceği ana klasör yolu.
 REPORT_BASE_DIR = os.path.join(os.path.expanduser("~"), "Documents", "WhatsAppBroadcastRuns")
 os.makedirs(REPORT_BASE_DIR, exist_ok=True)
 
+# Motor adından iletim sınıfına eşleme. "fake" tarayıcısız deneme/ölçüm içindir ve arayüzde gösterilmez.
+TRANSPORTS = {
+    "selenium": SeleniumTransport,
+    "playwright": PlaywrightTransport,
+    "cloud_api": CloudApiTransport,
+    "multi_profile": ProfileWorkerPool,
+    "fake": FakeTransport,
+}
+
+# Webhook ile gelen durumların listede gösterimi: (metin, renk anahtarı).
+DELIVERY_STATUS_LABELS = {
+    'sent': ("İLETİLDİ", "sent"),
+    'delivered': ("TESLİM EDİLDİ", "sent"),
+    'read': ("OKUNDU", "sent"),
+    'failed': ("TESLİM EDİLEMEDİ", "failed"),
+}
+# Durumlar geldikçe results.xlsx en fazla bu aralıkla (sn) yeniden yazılır.
+REPORT_REFRESH_INTERVAL = 30
+
 
 class BroadcasterLogic:
     """
-    Tüm Selenium otomasyonu, veri işleme (Pandas) ve raporlama mantığını içerir.
+    Gönderim döngüsü, veri işleme (Pandas) ve raporlama mantığını içerir. Mesajların
+    iletimi seçilen Transport'a (Selenium, Playwright, sahte) bırakılır.
     Arayüz (GUI) sınıfı, bu sınıfın metotlarını çağırarak arka plan işlemlerini yönetir.
     """
-    def __init__(self, gui_app):
+    def __init__(self, gui_app, session=None):
         # GUI (Arayüz) referansını tutar, böylece durum güncellemeleri arayüze gönderilebilir.
         self.gui_app = gui_app 
-        self.driver = None             # Selenium WebDriver nesnesi
+        # Tarayıcı oturumu uygulamaya aittir; verilmezse bu nesneye özel bir yönetici oluşturulur.
+        self.session = session if session is not None else SessionManager(self._log_to_gui)
+        self.transport = None          # Bu gönderimde kullanılan iletim (Transport)
         self.is_running = False        # Gönderim sürecinin aktif olup olmadığını tutar
+        self._stop_event = threading.Event()  # Tüm beklemeleri kesen ortak durdurma sinyali
+        self.is_paused = False         # Gönderimin duraklatılıp duraklatılmadığını tutar
+        self._resume_event = threading.Event()  # Duraklatmada temizlenir, devam edilince kurulur
+        self._resume_event.set()
         self.df_data = None            # Excel'den okunan Pandas DataFrame
         self.failed_log = []           # Başarısız gönderim kayıtları
         self.sent_log = []             # Başarılı gönderim kayıtları
         self.total_recipients = 0      # Toplam alıcı sayısı
+        self._log_lock = threading.Lock()  # Eşzamanlı iletimlerde sonuç kayıtlarını sıraya sokar
+        self.webhook = None            # Teslim/okunma durumlarını alan webhook sunucusu (ilk ihtiyaçta açılır)
+        self.delivery_statuses = {}    # message_id -> teslim/okunma kaydı (rapordaki ek sütunlar)
+        self._message_rows = {}        # message_id -> listedeki satır (index)
+        self._report_generated = False # results.xlsx bu çalıştırma için yazıldı mı
+        self._report_refresh_timer = None  # Durum güncellemelerinden sonra raporu yeniden yazan zamanlayıcı
         self.current_run_dir = None    # Mevcut çalıştırma için oluşturulan rapor klasörü
+        self.run_metrics = {}          # Çalıştırma ölçümleri (rapordaki 'Metrikler' sayfası)
+        self.recycle_log = []          # Tarayıcı geri dönüşüm kayıtları (öncesi/sonrası bellek)
+        self.pipeline_mode = PIPELINE_MODE  # Tempo beklemesini sonraki alıcının hazırlığıyla örtüştürür
+        self.rate_limiter = None       # Gönderim hakkını veren hız sınırlayıcı (None: tempo uygulanmaz)
+        self.engine = ENGINE           # Gönderim motoru ("selenium" / "playwright" / "fake")
 
     # --- Yardımcı Fonksiyonlar ---
 
-    def _get_delays(self, mode):
-        """Seçilen hıza göre bekleme sürelerini (saniye) döndürür."""
-        # Dönüş sırası: WA_OPEN_DELAY, SEND_DELAY, SEARCH_SUCCESS_DELAY, SEARCH_FAIL_DELAY
-        if mode == "SAFE":
-            return 8, 15, 4, 7
-        elif mode == "FAST":
-            return 5, 8, 2, 4
-        elif mode == "TURBO":
-            return 3, 5, 1, 2
-        return 5, 8, 2, 4
-
     def _clean_phone_number(self, phone):
         """Telefon numarasını sadece rakamları içerecek ve '90' ile başlayacak şekilde temizler."""
         # Önceki kodda zaten string'e dönüştürüyordu ancak daha güvenli hale getirildi.
@@ -61,7 +95,27 @@ class BroadcasterLogic:
     def _log_to_gui(self, message, tag="info"):
         """Mesajı GUI'nin terminal alanına iletir."""
         self.gui_app._log_to_terminal(message, tag)
-    
+
+    def _sleep(self, seconds):
+        """Durdurma sinyaliyle kesilebilen bekleme. İptal edilirse BroadcastCancelled fırlatır."""
+        if seconds > 0 and self._stop_event.wait(seconds):
+            raise BroadcastCancelled()
+        if self._stop_event.is_set():
+            raise BroadcastCancelled()
+
+    def _wait_if_paused(self, index):
+        """
+        Duraklatma istendiyse döngüyü alıcı sınırında bekletir. Tarayıcı oturumu açık kalır;
+        devam edildiğinde aynı 'index'ten sürülür. Beklerken iptal edilirse BroadcastCancelled fırlatır.
+        """
+        if self._resume_event.is_set():
+            return
+        self._log_to_gui(f"Gönderim {index + 1}. kişide duraklatıldı. Tarayıcı oturumu açık tutuluyor.", "info")
+        while not self._resume_event.wait(STOP_POLL_INTERVAL):
+            if self._stop_event.is_set():
+                raise BroadcastCancelled()
+        self._log_to_gui(f"Gönderim {index + 1}. kişiden devam ediyor.", "info")
+
     # --- Veri Yükleme ---
 
     def load_data(self, file_path):
@@ -90,53 +144,12 @@ class BroadcasterLogic:
 
     # --- Otomasyon Çekirdeği ---
 
-    def _init_browser(self):
-        """Chrome tarayıcısını başlatır ve WhatsApp Web oturumunu kontrol eder."""
-        options = webdriver.ChromeOptions()
-        options.add_argument(f"user-data-dir={CHROME_PROFILE_PATH}") 
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        
-        try:
-            self._log_to_gui("Chrome sürücüsü indiriliyor ve başlatılıyor...", "info")
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.get("https://web.whatsapp.com")
-
-            # Başarılı giriş kontrolü için arama kutusunun yüklenmesini bekler.
-            SEARCH_INPUT_XPATH = '//*[@id="side"]//div[@role="textbox"]'
-            self._log_to_gui("Tarayıcı başlatıldı. Oturum kontrol ediliyor (60sn bekleniyor)...")
-            
-            WebDriverWait(self.driver, 60).until(
-                EC.presence_of_element_located((By.XPATH, SEARCH_INPUT_XPATH)) 
-            )
-            
-            self._log_to_gui("WhatsApp Web oturumu başarıyla açıldı. Gönderim başlıyor...", "success")
-            return True
+    def _wait_pacing_floor(self, started_at, min_interval):
+        """Alıcı işlemi başlangıcından itibaren en az 'min_interval' saniye geçmesini sağlar."""
+        self._sleep(min_interval - (time.monotonic() - started_at))
 
-        except Exception as e:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
-            self._log_to_gui(f"WhatsApp Web oturumu açılamadı. Hata: {e}", "error")
-            return False
-
-    def _check_number_invalid(self):
-        """Geçersiz numara pop-up'ını kontrol eder."""
-        try:
-            invalid_popup_xpath = '//*[contains(text(), "telefon numarası geçersiz")] | //*[contains(text(), "WhatsApp kullanıcısı değil")]'
-            WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located((By.XPATH, invalid_popup_xpath))
-            )
-            return True
-        except:
-            return False
-
-    def _send_message(self, index, row, message_template, delays):
-        """Belirli bir kişiye mesajı gönderir (Çift yazma sorununu temizleme ile çözer)."""
-        
-        WA_OPEN_DELAY, SEND_DELAY, SEARCH_SUCCESS_DELAY, SEARCH_FAIL_DELAY = delays
-        
+    def _prepare_recipient(self, row, message_template):
+        """Satırdan telefon, isim ve kişiselleştirilmiş mesajı hazırlar."""
         phone_raw = row['phone']
         
         # Düzeltme: 'name' sütunu boş olsa bile (load_data'da doldurulduğu için) güvenle alınır.
@@ -150,110 +163,249 @@ class BroadcasterLogic:
         # Kişiselleştirme sırasında 'name' değişkeninin boş dize olması sorun teşkil etmez, sadece {name} kalkar.
         message_content = str(msg_template_to_use).replace('{name}', name).strip()
 
-        phone_clean = self._clean_phone_number(phone_raw)
+        return phone_raw, name, message_content, self._clean_phone_number(phone_raw)
+
+    def _create_rate_limiter(self, speed_mode):
+        """
+        Hız modu ön ayarından sınırlayıcı oluşturur. Chrome profilindeki numarayla gönderen iletimlerde
+        kovalar profile özgü dosyada saklanır; aynı numaranın saatlik/günlük hakkı çalıştırmalar arasında sürer.
+        """
+        state_path = rate_state_path(self.session.profile_path) if self.transport.uses_profile else None
+        return RateLimiter.from_preset(speed_mode, state_path)
+
+    def _report_rate_status(self):
+        """Etkin hızı ve bir sonraki gönderim anını arayüze bildirir."""
+        if self.rate_limiter is not None:
+            self.gui_app.update_rate_status(self.rate_limiter.status())
+
+    def _acquire_send_slot(self):
+        """Hız sınırlayıcıdan gönderim hakkı alınana kadar bekler (iptal edilirse BroadcastCancelled)."""
+        if self.rate_limiter is None:
+            return
+        self.rate_limiter.acquire(self._sleep)
+        self._report_rate_status()
+
+    def _wait_send_slot(self):
+        """Gönderim hakkı doğana kadar jeton harcamadan bekler (iptal edilirse BroadcastCancelled)."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(self._sleep)
+
+    def _before_send(self):
+        """
+        İletim tarafından geri alınamaz gönderim adımından hemen önce çağrılır; jeton yalnızca burada,
+        sohbet hazır ve mesaj yazılmışken harcanır. Pipeline modunda tempo beklemesi de buradadır.
+        """
+        self._acquire_send_slot()
+
+    def _process_recipient(self, index, row, message_template):
+        """Bir kişiye mesajı iletim üzerinden gönderir, sonucu kaydeder ve asgari tempoyu uygular."""
+        phone_raw, name, message_content, phone_clean = self._prepare_recipient(row, message_template)
         self.gui_app._update_list_status(index, "Gönderiliyor...", "sending")
-        
-        link = f"https://web.whatsapp.com/send?phone={phone_clean}"
-        
-        try:
-            self.driver.get(link)
-            time.sleep(WA_OPEN_DELAY) 
-            
-            try:
-                # Mesaj kutusunu bulma
-                message_box_xpath = '//*[@id="main"]//footer//*[@contenteditable="true"]'
-                message_box = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, message_box_xpath))
-                )
-                
-                # 1. Kutu içeriğini temizle (Çift yazma sorununu çözer)
-                message_box.click() 
-                message_box.send_keys(Keys.CONTROL, 'a') 
-                message_box.send_keys(Keys.BACKSPACE) 
-                
-                # 2. Mesajı satır satır yaz ve gönder
-                lines = message_content.split('\n')
-                for i, line in enumerate(lines):
-                    message_box.send_keys(line)
-                    if i < len(lines) - 1:
-                        message_box.send_keys(Keys.SHIFT, Keys.ENTER)
-                
-                message_box.send_keys(Keys.ENTER)
-                
-                self._log_success(index, phone_raw, name, message_content)
-                time.sleep(SEND_DELAY) 
-            
-            except Exception as e:
-                if self._check_number_invalid():
-                    self._log_fail(index, phone_raw, name, "Numara WhatsApp kullanıcısı değil veya geçersiz.", None)
-                    time.sleep(SEARCH_FAIL_DELAY)
-                else:
-                    self._log_fail(index, phone_raw, name, f"Mesaj kutusu bulunamadı/Gönderim hatası: {e}", None)
-                    time.sleep(SEARCH_FAIL_DELAY)
-                    
-        except Exception as e:
-            self._log_fail(index, phone_raw, name, f"Genel Gönderim Hatası: {e}", e)
-            time.sleep(SEARCH_FAIL_DELAY)
+
+        recipient = {'index': index, 'phone': phone_raw, 'name': name, 'phone_clean': phone_clean}
+        if self.transport.concurrent:
+            # Sonuç geldiğinde kaydedilir; tempo eşzamanlılık sınırı ve API hız sınırıyla belirlenir.
+            self.transport.submit(recipient, message_content, self._record_outcome)
+            return
+
+        if not self.pipeline_mode:
+            # Ardışık hazırlık kapalıyken sohbet ancak gönderim hakkı doğduktan sonra açılır; jeton yine
+            # Enter'dan hemen önce harcanır, geçersiz numara ve açılamayan sohbet hak harcamaz.
+            self._wait_send_slot()
+        started_at = time.monotonic()
+
+        outcome = self.transport.deliver(recipient, message_content)
+        self._record_outcome(recipient, message_content, outcome)
+        if outcome['status'] not in DELIVERED_OUTCOMES and self.rate_limiter is not None:
+            # Gönderilemeyen alıcılar jeton harcamaz; sohbet açma denemeleri yine de aralıklandırılır.
+            self._wait_pacing_floor(started_at, self.rate_limiter.limits.get('fail_interval', 0))
+
+    def _record_outcome(self, recipient, message_content, outcome):
+        """İletimden dönen sonucu gönderim kayıtlarına işler (eşzamanlı iletimlerde döngü iş parçacığından çağrılır)."""
+        with self._log_lock:
+            if outcome['status'] in DELIVERED_OUTCOMES:
+                self._log_success(recipient['index'], recipient['phone'], recipient['name'], message_content,
+                                  status=outcome['status'], confirm_latency=outcome['confirm_latency'],
+                                  message_id=outcome['message_id'])
+            else:
+                self._log_fail(recipient['index'], recipient['phone'], recipient['name'], outcome['reason'],
+                               outcome['exception'], retryable=outcome['retryable'])
+
+    def _create_transport(self):
+        """Seçili motora karşılık gelen iletimi oluşturur."""
+        return TRANSPORTS[self.engine](self._log_to_gui, self.session)
 
     # --- Ana Çalıştırma Döngüsü ---
 
-    def start_broadcast(self, message_template, speed_mode):
-        """Ana gönderim döngüsünü çalıştırır."""
+    def start_broadcast(self, message_template, speed_mode, transport=None):
+        """
+        Ana gönderim döngüsünü çalıştırır. 'transport' verilmezse seçili motorun iletimi kullanılır
+        (ör. karşılaştırma için bir FakeTransport verilebilir).
+        """
+        self.transport = transport if transport is not None else self._create_transport()
+        self.transport.before_send = self._before_send
         self.is_running = True
+        self._stop_event.clear()
+        self.is_paused = False
+        self._resume_event.set()
         self.failed_log = []
         self.sent_log = []
+        self.run_metrics = {'started_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                            'speed_mode': speed_mode,
+                            'lean_mode': self.session.settings['lean_mode'],
+                            'pipeline_mode': self.pipeline_mode,
+                            'engine': self.transport.name}
+        self.recycle_log = []
+        self._reset_delivery_tracking()
+        self._prepare_run_dir()
+        # Eşzamanlı iletimler kendi sınırlarını uygular (API hız sınırı, profil başına sınırlar).
+        self.rate_limiter = None if self.transport.concurrent else self._create_rate_limiter(speed_mode)
+        if self.rate_limiter is not None:
+            for key, value in self.rate_limiter.limits.items():
+                self.run_metrics[f'rate_{key}'] = value
         self.gui_app._reset_list_colors() # GUI'deki listeyi sıfırla
 
         # Tarayıcıyı başlat (QR kod kontrolü burada yapılır)
-        if not self._init_browser():
+        if not self.transport.open_session(self._stop_event):
             self.gui_app.cancel_broadcast(hard_stop=True)
             return 
 
-        delays = self._get_delays(speed_mode)
+        if self.transport.status_webhooks:
+            self._ensure_webhook_receiver()
+
+        # Tarayıcı yenileme kayıtları iletim tarafından tutulur.
+        self.recycle_log = self.transport.recycle_log
+        self._report_rate_status()
+        self._record_resource_metrics('start')
         
         try:
             for index, (_, row) in enumerate(self.df_data.iterrows()):
+                # Duraklatıldıysa bir sonraki kişiye geçmeden burada beklenir.
+                self._wait_if_paused(index)
                 if not self.is_running:
                     break # Kullanıcı iptal ettiyse döngüyü kır
-                
-                self._send_message(index, row, message_template, delays)
+
+                self._process_recipient(index, row, message_template)
+
+            # Eşzamanlı iletimlerde uçuştaki son gönderimlerin sonuçları beklenir.
+            if self.transport.concurrent:
+                self.transport.drain()
+
+        except BroadcastCancelled:
+            pass # Bir bekleme sırasında iptal edildi
                 
         except Exception as e:
             self._log_to_gui(f"Beklenmedik bir hata oluştu: {e}", "error")
             
         finally:
-            if self.driver:
-                self.driver.quit()
+            self._record_resource_metrics('end')
+            # Selenium iletimi tarayıcıyı kapatmaz; oturum yöneticisinde bir sonraki gönderim için açık tutulur.
+            self.transport.close()
             self.gui_app._finish_broadcast(cancelled=(not self.is_running))
 
+    def _record_resource_metrics(self, phase):
+        """Tarayıcı kaynak kullanımını ölçer ve 'phase' önekiyle run_metrics'e ekler."""
+        try:
+            metrics = self.transport.collect_metrics()
+        except Exception:
+            return
+        for key, value in metrics.items():
+            self.run_metrics[f'{phase}_{key}'] = value
+
+        if phase == 'end':
+            self.run_metrics['browser_recycles'] = len(self.recycle_log)
+            # Hafif mod karşılaştırması için alıcı başına düşen veri aktarımı.
+            processed = len(self.sent_log) + len(self.failed_log)
+            start_kb = self.run_metrics.get('start_transferred_kb')
+            end_kb = self.run_metrics.get('end_transferred_kb')
+            if processed and start_kb is not None and end_kb is not None and end_kb >= start_kb:
+                self.run_metrics['transferred_kb_per_recipient'] = round((end_kb - start_kb) / processed, 1)
+
+    def close(self):
+        """Uygulama kapanırken webhook sunucusunu ve bekleyen rapor yenilemesini durdurur."""
+        if self._report_refresh_timer is not None:
+            self._report_refresh_timer.cancel()
+        if self.webhook is not None:
+            self.webhook.stop()
+
     def cancel_broadcast(self):
-        """Gönderimi durdurur ve tarayıcıyı kapatır."""
+        """
+        Gönderimi durdurur. Devam eden tüm beklemeler durdurma sinyaliyle en geç
+        STOP_POLL_INTERVAL içinde kesilir; tarayıcı bir sonraki gönderim için açık kalır.
+        """
         self.is_running = False
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
-            self.driver = None
+        self._stop_event.set()
+
+    def pause_broadcast(self):
+        """Gönderimi bir sonraki alıcı sınırında duraklatır (tarayıcı kapatılmaz)."""
+        if self.is_running:
+            self.is_paused = True
+            self._resume_event.clear()
+
+    def resume_broadcast(self):
+        """Duraklatılmış gönderimi kaldığı kişiden, sayaç ve loglar korunarak sürdürür."""
+        self.is_paused = False
+        self._resume_event.set()
 
     # --- Loglama ve Raporlama ---
 
-    def _log_success(self, index, phone, name, message):
-        """Başarılı gönderimi kaydeder ve GUI'ye bilgi gönderir."""
+    def _prepare_run_dir(self):
+        """Çalıştırma için rapor klasörünü oluşturur (ara kayıtlar gönderim sürerken buraya yazılır)."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.current_run_dir = os.path.join(REPORT_BASE_DIR, f"run_{timestamp}")
+        os.makedirs(self.current_run_dir, exist_ok=True)
+
+    def _checkpoint(self, record):
+        """
+        Her sonucu anında 'progress_log.csv' dosyasına ekler. Uygulama çökse veya
+        kapatılmak zorunda kalınsa bile o ana kadarki sonuçlar kaybolmaz.
+        """
+        if not self.current_run_dir:
+            return
+        path = os.path.join(self.current_run_dir, "progress_log.csv")
+        fieldnames = ['timestamp', 'result', 'phone', 'name', 'status', 'reason', 'confirm_latency_ms', 'retryable', 'message_id']
+        try:
+            is_new = not os.path.exists(path)
+            with open(path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                if is_new:
+                    writer.writeheader()
+                writer.writerow(record)
+        except OSError:
+            pass
+
+    def _log_success(self, index, phone, name, message, status='SENT', confirm_latency=None, message_id=None):
+        """
+        Başarılı gönderimi kaydeder ve GUI'ye bilgi gönderir.
+        'UNCONFIRMED' durumu, mesajın gönderildiği ancak tik onayının zaman aşımına uğradığı anlamına gelir.
+        """
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        latency_ms = int(confirm_latency * 1000) if confirm_latency is not None else ''
         self.sent_log.append({
             'timestamp': now, 
             'phone': phone, 
             'name': name, 
             'message': message, 
-            'status': 'SENT'
+            'status': status,
+            'confirm_latency_ms': latency_ms,
+            'message_id': message_id or ''
         })
+        self._checkpoint(dict(self.sent_log[-1], result='SENT'))
         self.gui_app.update_progress()
-        self.gui_app._update_list_status(index, "BAŞARILI", "sent")
-        self._log_to_gui(f"BAŞARILI: {name} ({phone}) kişisine mesaj gönderildi.", "success")
-
-    def _log_fail(self, index, phone, name, reason, exception):
-        """Başarısız gönderimi kaydeder ve GUI'ye bilgi gönderir."""
+        if message_id:
+            self._message_rows[message_id] = index
+        if status == 'SENT':
+            self.gui_app._update_list_status(index, f"BAŞARILI ({latency_ms} ms)", "sent")
+            self._log_to_gui(f"BAŞARILI: {name} ({phone}) kişisine mesaj gönderildi. Onay süresi: {latency_ms} ms", "success")
+        else:
+            self.gui_app._update_list_status(index, "GÖNDERİLDİ (Onay bekleniyor)", "sent")
+            self._log_to_gui(f"UYARI: {name} ({phone}) mesajı gönderildi ancak onayı zamanında gelmedi.", "error")
+
+    def _log_fail(self, index, phone, name, reason, exception, retryable=False):
+        """
+        Başarısız gönderimi kaydeder ve GUI'ye bilgi gönderir.
+        'retryable' işaretli kayıtlar (ör. tarayıcı takılması) sonraki bir çalıştırmada yeniden denenebilir.
+        """
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         error_detail = str(exception) if exception else reason
         self.failed_log.append({
@@ -261,38 +413,141 @@ class BroadcasterLogic:
             'phone': phone, 
             'name': name, 
             'reason': reason, 
-            'error_detail': error_detail
+            'error_detail': error_detail,
+            'retryable': retryable
         })
+        self._checkpoint(dict(self.failed_log[-1], result='FAILED', status='FAILED'))
         self.gui_app.update_progress()
         self.gui_app._update_list_status(index, f"BAŞARISIZ ({reason})", "failed")
         self._log_to_gui(f"BAŞARISIZ: {name} ({phone}). Sebep: {reason}", "error")
 
+    # --- Teslim ve Okunma Durumları (Webhook) ---
+
+    def _reset_delivery_tracking(self):
+        """Yeni çalıştırma için webhook durum kayıtlarını ve bekleyen rapor yenilemesini sıfırlar."""
+        if self._report_refresh_timer is not None:
+            self._report_refresh_timer.cancel()
+            self._report_refresh_timer = None
+        with self._log_lock:
+            self.delivery_statuses = {}
+            self._message_rows = {}
+            self._report_generated = False
+
+    def _ensure_webhook_receiver(self):
+        """Webhook sunucusunu ilk ihtiyaçta başlatır; açılamazsa gönderim durumsuz sürer."""
+        try:
+            if self.webhook is None:
+                self.webhook = WebhookReceiver(self.apply_status_batch, self._log_to_gui)
+            self.webhook.start()
+        except Exception as e:
+            self._log_to_gui(f"Webhook alıcısı başlatılamadı; teslim/okunma durumları izlenmeyecek. Hata: {e}", "error")
+
+    def apply_status_batch(self, batch):
+        """
+        Webhook alıcısından gelen toplu durumları (mesaj başına birleştirilmiş) kayıtlara işler,
+        listedeki satırları günceller, 'status_log.csv' dosyasına ekler ve raporu yenilemeyi planlar.
+        """
+        updated = []
+        with self._log_lock:
+            for item in batch:
+                index = self._message_rows.get(item['message_id'])
+                if index is None:
+                    continue # Bu çalıştırmaya ait olmayan mesaj
+                record = self.delivery_statuses.setdefault(item['message_id'], {
+                    'delivery_status': '', 'delivered_at': '', 'read_at': '', 'delivery_error': ''})
+                if STATUS_RANK[item['status']] >= STATUS_RANK.get(record['delivery_status'], 0):
+                    record['delivery_status'] = item['status']
+                for status, field in (('delivered', 'delivered_at'), ('read', 'read_at')):
+                    if item['timestamps'].get(status):
+                        record[field] = self._format_unix_time(item['timestamps'][status])
+                if item['error']:
+                    record['delivery_error'] = item['error']
+                updated.append((index, item['message_id'], dict(record)))
+
+        if not updated:
+            return
+        self._append_status_log(updated)
+        for index, _, record in updated:
+            text, color_key = DELIVERY_STATUS_LABELS[record['delivery_status']]
+            self.gui_app._update_list_status(index, text, color_key)
+        self._schedule_report_refresh()
+
+    def _format_unix_time(self, value):
+        """Webhook'taki unix zaman damgasını rapor biçimine çevirir."""
+        try:
+            return datetime.fromtimestamp(int(value)).strftime("%Y-%m-%d %H:%M:%S")
+        except (TypeError, ValueError, OverflowError, OSError):
+            return str(value)
+
+    def _append_status_log(self, updated):
+        """Güncellenen durumları çalıştırma klasöründeki 'status_log.csv' dosyasına ekler."""
+        if not self.current_run_dir:
+            return
+        path = os.path.join(self.current_run_dir, "status_log.csv")
+        fieldnames = ['timestamp', 'index', 'message_id', 'delivery_status', 'delivered_at', 'read_at', 'delivery_error']
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            is_new = not os.path.exists(path)
+            with open(path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                if is_new:
+                    writer.writeheader()
+                for index, message_id, record in updated:
+                    writer.writerow(dict(record, timestamp=now, index=index, message_id=message_id))
+        except OSError:
+            pass
+
+    def _schedule_report_refresh(self):
+        """Rapor yazıldıysa, gelen durumları results.xlsx'e yansıtmak için yeniden yazmayı planlar."""
+        if not self._report_generated:
+            return
+        if self._report_refresh_timer is not None and self._report_refresh_timer.is_alive():
+            return
+        self._report_refresh_timer = threading.Timer(REPORT_REFRESH_INTERVAL, self.generate_reports)
+        self._report_refresh_timer.daemon = True
+        self._report_refresh_timer.start()
+
     def generate_reports(self):
         """Gönderim sonuçlarını rapor dosyalarına (Excel, CSV) kaydeder."""
         if not self.sent_log and not self.failed_log:
             return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.current_run_dir = os.path.join(REPORT_BASE_DIR, f"run_{timestamp}")
-        os.makedirs(self.current_run_dir, exist_ok=True)
+        # Klasör gönderim başında oluşturulur (ara kayıtlar için); yoksa şimdi oluşturulur.
+        if not self.current_run_dir:
+            self._prepare_run_dir()
         
         # ... (Raporlama Mantığı aynı kalır) ...
         final_df = self.df_data.copy()
         
-        sent_df = pd.DataFrame(self.sent_log)
-        failed_df = pd.DataFrame(self.failed_log)
+        with self._log_lock:
+            sent_df = pd.DataFrame(list(self.sent_log))
+            failed_df = pd.DataFrame(list(self.failed_log))
+            delivery_statuses = {key: dict(value) for key, value in self.delivery_statuses.items()}
         
         final_df['status'] = 'PENDING'
         final_df['log_time'] = ''
         final_df['reason'] = ''
+        # Onay süresi tamsayıdır; sütun 'object' olarak açılır (boş dize ile açılan 'str' sütununa sayı yazılamaz).
+        final_df['confirm_latency_ms'] = None
+        # Mesaj kimliği veren iletimlerde (Cloud API) webhook ile gelen teslim/okunma sütunları eklenir.
+        track_delivery = 'message_id' in sent_df and sent_df['message_id'].astype(bool).any()
+        if track_delivery:
+            for column in ['message_id', 'delivery_status', 'delivered_at', 'read_at', 'delivery_error']:
+                final_df[column] = ''
 
         for index, row in final_df.iterrows():
             phone_raw = row['phone']
             
             match_sent = sent_df[sent_df['phone'] == phone_raw]
             if not match_sent.empty:
-                final_df.loc[index, 'status'] = 'SENT'
+                final_df.loc[index, 'status'] = match_sent.iloc[0]['status']
                 final_df.loc[index, 'log_time'] = match_sent.iloc[0]['timestamp']
+                final_df.loc[index, 'confirm_latency_ms'] = match_sent.iloc[0]['confirm_latency_ms']
+                if track_delivery:
+                    message_id = match_sent.iloc[0]['message_id']
+                    final_df.loc[index, 'message_id'] = message_id
+                    for column, value in delivery_statuses.get(message_id, {}).items():
+                        final_df.loc[index, column] = value
                 continue
 
             match_failed = failed_df[failed_df['phone'] == phone_raw]
@@ -318,6 +573,13 @@ class BroadcasterLogic:
             worksheet.conditional_format('A1:Z' + str(len(final_df) + 1), 
                                         {'type': 'text', 'criteria': 'containing', 'value': 'FAILED', 'format': failed_format})
             
+            # Çalıştırma ölçümleri (hafif mod tasarrufunun karşılaştırılması vb.)
+            if self.run_metrics:
+                metrics_df = pd.DataFrame(list(self.run_metrics.items()), columns=['metric', 'value'])
+                metrics_df.to_excel(writer, sheet_name='Metrikler', index=False)
+            if self.recycle_log:
+                pd.DataFrame(self.recycle_log).to_excel(writer, sheet_name='Tarayıcı Yenileme', index=False)
+            
             writer.close()
 
             sent_csv_path = os.path.join(self.current_run_dir, "sent_log.csv")
@@ -328,6 +590,7 @@ class BroadcasterLogic:
             if not failed_df.empty:
                 failed_df.to_csv(failed_csv_path, index=False, encoding='utf-8')
 
+            self._report_generated = True
             return True, self.current_run_dir
         
         except Exception as e:
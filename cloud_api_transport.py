@@ -0,0 +1,269 @@
+import os
+import time
+import random
+import asyncio
+import threading
+
+try:
+    import aiohttp
+except ImportError: # aiohttp opsiyoneldir: pip install aiohttp
+    aiohttp = None
+
+from transport import (Transport, AsyncLoopRunner, BroadcastCancelled, delivery_outcome, OUTCOME_SENT,
+                       OUTCOME_UNCONFIRMED, OUTCOME_INVALID, OUTCOME_FAILED, INVALID_NUMBER_REASON, STOP_POLL_INTERVAL)
+
+# --- Global Yapılandırma ve Sabitler ---
+# WhatsApp Business Cloud API bağlantı bilgileri ortam değişkenlerinden okunur.
+# Yerel sahte sunucu için: WA_CLOUD_API_BASE=http://127.0.0.1:8089/v19.0 (bkz. tools/mock_cloud_api.py)
+CLOUD_API_BASE = os.environ.get("WA_CLOUD_API_BASE", "https://graph.facebook.com/v19.0")
+CLOUD_API_TOKEN = os.environ.get("WA_CLOUD_TOKEN", "")
+CLOUD_API_PHONE_NUMBER_ID = os.environ.get("WA_CLOUD_PHONE_NUMBER_ID", "")
+
+# Aynı anda uçuşta olabilecek en fazla istek sayısı (bağlantı havuzu da bu boyuttadır).
+CLOUD_API_CONCURRENCY = int(os.environ.get("WA_CLOUD_CONCURRENCY", "8"))
+# Tek bir HTTP isteğinin azami süresi (sn) ve boşta tutulan bağlantıların ömrü (sn).
+HTTP_TIMEOUT = 30
+KEEPALIVE_TIMEOUT = 60
+# Kapanışta (ör. iptal sonrası) uçuştaki isteklerin tamamlanması için beklenen azami süre (sn).
+# API'nin kabul etmiş olabileceği istekler sessizce düşürülmez; süre dolarsa 'UNCONFIRMED' kaydedilir.
+CLOSE_DRAIN_TIMEOUT = HTTP_TIMEOUT
+
+# Hız sınırı (429) ve geçici hatalarda yeniden deneme: üstel geri çekilme, Retry-After başlığı varsa o kullanılır.
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60
+
+# Cloud API hata kodları.
+RATE_LIMIT_ERROR_CODES = {4, 80007, 130429, 131048, 131056}   # Uygulama/hesap/çift hız sınırları
+INVALID_RECIPIENT_ERROR_CODES = {131026, 131030}              # Alıcı WhatsApp kullanmıyor / izinli değil
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+
+
+class CloudApiError(Exception):
+    """Cloud API'nin 4xx/5xx yanıtı. 'code' Graph API hata kodudur (varsa)."""
+    def __init__(self, status, data, retry_after=None):
+        error = data.get('error', {}) if isinstance(data, dict) else {}
+        self.status = status
+        self.code = error.get('code')
+        self.retry_after = retry_after
+        super().__init__(f"HTTP {status} (kod {self.code}): {error.get('message', 'bilinmeyen hata')}")
+
+
+class CloudApiTransport(Transport):
+    """
+    Mesajları resmi WhatsApp Business Cloud API üzerinden gönderir. Tek bir kalıcı (keep-alive)
+    aiohttp oturumu ve sınırlı boyutlu bağlantı havuzu kullanılır; en fazla 'concurrency' istek
+    aynı anda uçuştadır. Hız sınırı yanıtlarında tüm gönderimler ortak bir süre bekletilir.
+
+    Burada 'SENT', mesajın API tarafından kabul edildiği anlamına gelir; teslim ve okunma
+    durumları daha sonra webhook ile gelir.
+    """
+    name = "cloud_api"
+    concurrent = True
+    status_webhooks = True
+
+    def __init__(self, log_callback, session=None, api_base=None, token=None, phone_number_id=None, concurrency=None):
+        super().__init__(log_callback, session)
+        self.api_base = (api_base or CLOUD_API_BASE).rstrip('/')
+        self.token = token or CLOUD_API_TOKEN
+        self.phone_number_id = phone_number_id or CLOUD_API_PHONE_NUMBER_ID
+        self.concurrency = concurrency or CLOUD_API_CONCURRENCY
+        self._runner = None            # HTTP oturumunun bağlı olduğu olay döngüsü iş parçacığı
+        self._http = None              # aiohttp.ClientSession (bağlantı havuzu)
+        self._slots = threading.BoundedSemaphore(self.concurrency)  # Uçuştaki istek sınırı
+        self._pending = set()          # Sonucu henüz gelmemiş gönderimler (Future)
+        self._pending_lock = threading.Lock()
+        self._throttled_until = 0.0    # Hız sınırı nedeniyle tüm isteklerin bekletileceği an (loop.time)
+        self.stats = {}                # İstek, yeniden deneme ve hız sınırı sayaçları
+
+    # --- Oturum ---
+
+    def open_session(self, stop_event):
+        """HTTP oturumunu açar ve numara kimliğini API'den doğrular."""
+        self.stop_event = stop_event
+        self.stats = {'http_requests': 0, 'http_retries': 0, 'rate_limited': 0, 'accepted': 0}
+        if aiohttp is None:
+            self._log("Cloud API iletimi için 'aiohttp' paketi gerekli: pip install aiohttp", "error")
+            return False
+        if not self.token or not self.phone_number_id:
+            self._log("Cloud API bilgileri eksik: WA_CLOUD_TOKEN ve WA_CLOUD_PHONE_NUMBER_ID ortam değişkenlerini ayarlayın.", "error")
+            return False
+        try:
+            self._runner = AsyncLoopRunner()
+            self._runner.run(self._open_http())
+            info = self._runner.run(self._request_json("GET", f"{self.api_base}/{self.phone_number_id}"))
+            number = info.get('display_phone_number') or self.phone_number_id
+            self._log(f"Cloud API oturumu açıldı ({number}, eşzamanlılık {self.concurrency}). Gönderim başlıyor...", "success")
+            return True
+        except Exception as e:
+            self._log(f"Cloud API oturumu açılamadı. Hata: {e}", "error")
+            self.close()
+            return False
+
+    async def _open_http(self):
+        """Keep-alive bağlantı havuzlu HTTP oturumunu oluşturur (olay döngüsü içinde çağrılmalıdır)."""
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=KEEPALIVE_TIMEOUT, ttl_dns_cache=300)
+        self._http = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+            headers={'Authorization': f"Bearer {self.token}", 'Content-Type': 'application/json'})
+
+    async def _close_http(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    def close(self):
+        """
+        Uçuştaki gönderimlerin sonucunu CLOSE_DRAIN_TIMEOUT boyunca bekler (yeni deneme başlatılmaz),
+        kalanları iptal edip 'UNCONFIRMED' kaydeder; ardından HTTP oturumunu ve olay döngüsünü kapatır.
+        """
+        with self._pending_lock:
+            pending = list(self._pending)
+        if pending:
+            self._log(f"Uçuştaki {len(pending)} Cloud API isteğinin sonucu bekleniyor...", "info")
+            deadline = time.monotonic() + CLOSE_DRAIN_TIMEOUT
+            while time.monotonic() < deadline:
+                with self._pending_lock:
+                    if not self._pending:
+                        break
+                time.sleep(STOP_POLL_INTERVAL)
+            with self._pending_lock:
+                pending = list(self._pending)
+            for future in pending:
+                future.cancel()
+        try:
+            if self._runner is not None:
+                self._runner.run(self._close_http(), timeout=HTTP_TIMEOUT)
+        except Exception:
+            pass
+        finally:
+            if self._runner is not None:
+                self._runner.stop()
+            self._runner = None
+
+    def collect_metrics(self):
+        return dict(self.stats)
+
+    # --- HTTP ---
+
+    async def _request_json(self, method, url, payload=None):
+        """Tek bir istek gönderir; başarısız yanıtlarda CloudApiError fırlatır."""
+        self.stats['http_requests'] += 1
+        async with self._http.request(method, url, json=payload) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = {}
+            if response.status >= 400:
+                raise CloudApiError(response.status, data or {}, response.headers.get('Retry-After'))
+            return data or {}
+
+    def _backoff_seconds(self, attempt, retry_after=None):
+        """Yeniden deneme öncesi bekleme süresi: Retry-After varsa o, yoksa rastgele sapmalı üstel süre."""
+        if retry_after:
+            try:
+                return min(float(retry_after), BACKOFF_MAX)
+            except ValueError:
+                pass
+        return min(BACKOFF_BASE * (2 ** (attempt - 1)), BACKOFF_MAX) * random.uniform(0.8, 1.2)
+
+    async def _wait_if_throttled(self):
+        """Başka bir istek hız sınırına takıldıysa ortak bekleme süresi dolana kadar (iptal edilmedikçe) bekler."""
+        loop = asyncio.get_running_loop()
+        while self._throttled_until > loop.time() and not self.stop_event.is_set():
+            await asyncio.sleep(min(self._throttled_until - loop.time(), STOP_POLL_INTERVAL))
+
+    async def _send(self, recipient, text):
+        """Metin mesajını gönderir; hız sınırı ve geçici hatalarda geri çekilerek yeniden dener."""
+        url = f"{self.api_base}/{self.phone_number_id}/messages"
+        payload = {
+            'messaging_product': 'whatsapp',
+            'recipient_type': 'individual',
+            'to': recipient['phone_clean'],
+            'type': 'text',
+            'text': {'preview_url': False, 'body': text},
+        }
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        last_error = None
+
+        for attempt in range(1, MAX_RETRIES + 1):
+            await self._wait_if_throttled()
+            if self.stop_event.is_set():
+                # İptalden sonra yeni istek (veya yeniden deneme) gönderilmez.
+                return delivery_outcome(OUTCOME_FAILED, "Gönderim iptal edildi; istek API'ye gönderilmedi.",
+                                        last_error, retryable=True)
+            try:
+                data = await self._request_json("POST", url, payload)
+                self.stats['accepted'] += 1
+                message_id = (data.get('messages') or [{}])[0].get('id')
+                return delivery_outcome(OUTCOME_SENT, confirm_latency=loop.time() - started, message_id=message_id)
+
+            except CloudApiError as e:
+                last_error = e
+                if e.code in INVALID_RECIPIENT_ERROR_CODES:
+                    return delivery_outcome(OUTCOME_INVALID, INVALID_NUMBER_REASON, e)
+                if e.status == 429 or e.code in RATE_LIMIT_ERROR_CODES:
+                    self.stats['rate_limited'] += 1
+                    delay = self._backoff_seconds(attempt, e.retry_after)
+                    self._throttled_until = max(self._throttled_until, loop.time() + delay)
+                elif e.status in TRANSIENT_STATUS_CODES:
+                    await asyncio.sleep(self._backoff_seconds(attempt, e.retry_after))
+                else:
+                    return delivery_outcome(OUTCOME_FAILED, f"Cloud API hatası: {e}", e)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+                await asyncio.sleep(self._backoff_seconds(attempt))
+
+            self.stats['http_retries'] += 1
+
+        return delivery_outcome(OUTCOME_FAILED, f"Cloud API yanıt vermedi veya hız sınırı sürdü: {last_error}",
+                                last_error, retryable=True)
+
+    # --- Gönderim ---
+
+    def deliver(self, recipient, text):
+        """Tek bir mesajı gönderir ve sonucu bekler."""
+        return self._runner.run(self._send(recipient, text))
+
+    def submit(self, recipient, text, on_done):
+        """
+        Gönderimi olay döngüsünde başlatır ve hemen döner. Eşzamanlılık sınırı doluysa yer açılana
+        kadar (durdurma sinyali gözetilerek) bekler; böylece gönderim döngüsü API'den hızlı ilerlemez.
+        """
+        while not self._slots.acquire(timeout=STOP_POLL_INTERVAL):
+            if self.stop_event.is_set():
+                raise BroadcastCancelled()
+        if self.stop_event.is_set():
+            self._slots.release()
+            raise BroadcastCancelled()
+
+        future = self._runner.submit(self._send(recipient, text))
+        with self._pending_lock:
+            self._pending.add(future)
+
+        def _done(f):
+            with self._pending_lock:
+                self._pending.discard(f)
+            self._slots.release()
+            if f.cancelled():
+                # İstek API'ye ulaşmış olabilir; kayıttan düşürülmez, tekrar gönderilmemesi için onaysız sayılır.
+                on_done(recipient, text, delivery_outcome(OUTCOME_UNCONFIRMED))
+                return
+            error = f.exception()
+            outcome = f.result() if error is None else delivery_outcome(
+                OUTCOME_FAILED, f"Genel Gönderim Hatası: {error}", error, retryable=True)
+            on_done(recipient, text, outcome)
+
+        future.add_done_callback(_done)
+
+    def drain(self):
+        """Uçuştaki tüm gönderimlerin tamamlanmasını bekler; iptal edilirse BroadcastCancelled fırlatır."""
+        while True:
+            with self._pending_lock:
+                if not self._pending:
+                    return
+            if self.stop_event.wait(STOP_POLL_INTERVAL):
+                raise BroadcastCancelled()
+
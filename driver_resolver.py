@@ -0,0 +1,139 @@
+import os
+import re
+import json
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+
+# --- Global Yapılandırma ve Sabitler ---
+# Kurulu Chrome ana sürümü ve eşleşen chromedriver yolunun saklandığı küçük önbellek dosyası.
+DRIVER_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".whatsapp_broadcaster", "driver_cache.json")
+
+# Sürüm sorgulanacak olası Chrome/Chromium çalıştırılabilir dosyaları (Linux ve macOS).
+CHROME_BINARY_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+# Sürüm komutları için zaman aşımı (sn).
+VERSION_COMMAND_TIMEOUT = 5
+
+
+def _run_version_command(command):
+    """Verilen komutu çalıştırır ve çıktıdaki ilk sürüm numarasını (ör. '120.0.6099.109') döndürür."""
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=VERSION_COMMAND_TIMEOUT).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r'(\d+)\.(\d+)\.(\d+)\.(\d+)', output or '')
+    return match.group(0) if match else None
+
+
+def _detect_windows_chrome_version():
+    """Windows kayıt defterinden Chrome sürümünü okur."""
+    try:
+        import winreg
+    except ImportError:
+        return None
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+def detect_chrome_version():
+    """Kurulu Chrome sürümünü ağ erişimi olmadan tespit eder. Bulunamazsa None döndürür."""
+    if sys.platform.startswith("win"):
+        return _detect_windows_chrome_version()
+    for candidate in CHROME_BINARY_CANDIDATES:
+        if os.path.isabs(candidate):
+            if not os.path.exists(candidate):
+                continue
+        elif not shutil.which(candidate):
+            continue
+        version = _run_version_command([candidate, "--version"])
+        if version:
+            return version
+    return None
+
+
+def _major(version):
+    """'120.0.6099.109' gibi bir sürümün ana sürüm numarasını döndürür."""
+    return version.split('.')[0] if version else None
+
+
+def _load_cache():
+    """Önbellek dosyasını okur; yoksa veya bozuksa boş sözlük döndürür."""
+    try:
+        with open(DRIVER_CACHE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(chrome_version, driver_path):
+    """Chrome sürümünü ve eşleşen sürücü yolunu önbelleğe yazar."""
+    os.makedirs(os.path.dirname(DRIVER_CACHE_PATH), exist_ok=True)
+    with open(DRIVER_CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump({
+            'chrome_version': chrome_version,
+            'chrome_major': _major(chrome_version),
+            'driver_path': driver_path,
+            'resolved_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }, f, indent=2)
+
+
+def _path_driver_matching(chrome_major):
+    """PATH üzerindeki chromedriver, kurulu Chrome ile aynı ana sürümdeyse yolunu döndürür."""
+    driver_path = shutil.which("chromedriver")
+    if not driver_path:
+        return None
+    driver_version = _run_version_command([driver_path, "--version"])
+    if chrome_major is None or _major(driver_version) == chrome_major:
+        return driver_path
+    return None
+
+
+def resolve_chromedriver(log=None):
+    """
+    Kurulu Chrome ile eşleşen chromedriver yolunu döndürür.
+    Sıra: önbellek (ağ erişimi yok) -> PATH'teki uyumlu chromedriver -> ChromeDriverManager (ağ).
+    Yalnızca Chrome ana sürümü değiştiğinde yeniden çözümlenir. Hiçbiri olmazsa None döner
+    (Selenium'un kendi sürücü yöneticisine bırakılır).
+    """
+    log = log or (lambda message, tag="info": None)
+    chrome_version = detect_chrome_version()
+    chrome_major = _major(chrome_version)
+
+    cache = _load_cache()
+    cached_path = cache.get('driver_path')
+    if cached_path and os.path.isfile(cached_path):
+        # Chrome sürümü tespit edilemezse (ör. taşınabilir kurulum) önbellek yine de kullanılır.
+        if chrome_major is None or cache.get('chrome_major') == chrome_major:
+            log(f"Önbellekteki chromedriver kullanılıyor (Chrome {cache.get('chrome_major')}).", "info")
+            return cached_path
+        log(f"Chrome sürümü değişti ({cache.get('chrome_major')} -> {chrome_major}). Sürücü yeniden çözümleniyor...", "info")
+
+    driver_path = _path_driver_matching(chrome_major)
+    if driver_path:
+        log(f"PATH üzerindeki chromedriver kullanılıyor: {driver_path}", "info")
+    else:
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            log("Chrome sürücüsü indiriliyor...", "info")
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            log(f"Chrome sürücüsü indirilemedi ({e}). Selenium'un sürücü yöneticisi denenecek.", "error")
+            return None
+
+    try:
+        _save_cache(chrome_version, driver_path)
+    except OSError:
+        pass
+    return driver_path
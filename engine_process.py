@@ -0,0 +1,233 @@
+import time
+import queue
+import threading
+import multiprocessing
+
+# Gönderim motoru (BroadcasterLogic + tarayıcı oturumu) arayüzden ayrı bir alt süreçte çalışır.
+# Arayüz komut gönderir; motor kısa olay demetleri (tuple) yayınlar. Böylece Pandas/rapor üretimi
+# ve ChromeDriver G/Ç'si arayüzle GIL paylaşmaz; sürücü yığınındaki bir çökme yalnızca motoru düşürür.
+
+# Arayüzün olay kuyruğunu boşalttığı aralık (ms) ve bir turda işlenecek en fazla olay.
+EVENT_POLL_INTERVAL_MS = 50
+MAX_EVENTS_PER_POLL = 200
+# Alt süreç her platformda 'spawn' ile başlatılır; Tk sürecinin çatallanması (fork) güvenli değildir.
+MP_CONTEXT = multiprocessing.get_context("spawn")
+# Motor kapatılırken alt sürecin kendiliğinden çıkması için beklenen süre (sn).
+ENGINE_STOP_TIMEOUT = 10
+# Süre aşımında sonlandırma (terminate) sinyaline uymayan süreç bu kadar sonra öldürülür (sn).
+ENGINE_KILL_GRACE = 1
+
+# Arayüzden motora komutlar: (komut, *argümanlar)
+CMD_LOAD_DATA = "load_data"            # (dosya_yolu)
+CMD_START = "start"                    # (şablon, hız_modu, motor, ardışık_hazırlık)
+CMD_PAUSE = "pause"
+CMD_RESUME = "resume"
+CMD_CANCEL = "cancel"
+CMD_SETTINGS = "settings"              # ({tarayıcı ayarları})
+CMD_WARM_UP = "warm_up"
+CMD_SHUTDOWN_BROWSER = "shutdown_browser"
+CMD_MAINTAIN_PROFILE = "maintain_profile"
+CMD_STOP = "stop"
+
+# Motordan arayüze olaylar: (olay, *argümanlar)
+EVT_LOG = "log"                        # (mesaj, etiket)
+EVT_ROW = "row"                        # (index, durum_metni, renk_anahtarı)
+EVT_RESET_ROWS = "reset_rows"
+EVT_PROGRESS = "progress"              # (başarılı, başarısız, toplam)
+EVT_RATE = "rate"                      # ({effective_per_minute, bucket_rates, next_slot_at, limited_by})
+EVT_SESSION_STATE = "session_state"    # (durum)
+EVT_QR = "qr"                          # (png_bayt veya None)
+EVT_DATA_LOADED = "data_loaded"        # (başarılı_mı, hata, [(isim, telefon, durum)], mesaj_sütunu_var_mı)
+EVT_STARTED = "started"
+EVT_FINISHED = "finished"              # (iptal_mi, rapor_sonucu veya None)
+EVT_MAINTENANCE_DONE = "maintenance_done"  # (sonuç veya None, hata)
+
+
+class EngineEvents:
+    """
+    Alt süreçte BroadcasterLogic'e verilen arayüz vekili. Logic'in çağırdığı arayüz metotlarını
+    olay kuyruğuna yazılan kısa demetlere çevirir (hangi iş parçacığından çağrıldığı önemli değildir).
+    """
+    def __init__(self, events):
+        self._events = events
+        self.logic = None              # Vekilin bağlı olduğu BroadcasterLogic (sayaçlar için)
+
+    def emit(self, *event):
+        self._events.put(event)
+
+    def _log_to_terminal(self, message, tag="info"):
+        self.emit(EVT_LOG, message, tag)
+
+    def _update_list_status(self, index, status_text, color_key="pending"):
+        self.emit(EVT_ROW, index, status_text, color_key)
+
+    def _reset_list_colors(self):
+        self.emit(EVT_RESET_ROWS)
+
+    def update_progress(self):
+        self.emit(EVT_PROGRESS, len(self.logic.sent_log), len(self.logic.failed_log), self.logic.total_recipients)
+
+    def update_rate_status(self, status):
+        self.emit(EVT_RATE, status)
+
+    def on_session_state(self, state):
+        self.emit(EVT_SESSION_STATE, state)
+
+    def on_qr_code(self, png_bytes):
+        self.emit(EVT_QR, png_bytes)
+
+    def cancel_broadcast(self, hard_stop=False):
+        """Logic, oturum açılamadığında gönderimi buradan sonlandırır."""
+        self.logic.cancel_broadcast()
+        if hard_stop:
+            self._finish_broadcast(cancelled=True)
+
+    def _finish_broadcast(self, cancelled=False):
+        """Raporlar motor sürecinde üretilir; arayüze yalnızca sonucu bildirilir."""
+        report = None
+        if self.logic.sent_log or self.logic.failed_log:
+            report = self.logic.generate_reports()
+        self.emit(EVT_FINISHED, cancelled, report)
+
+
+def _run_engine(commands, events):
+    """Alt sürecin giriş noktası: komutları okur ve motoru yönetir."""
+    # Ağır bağımlılıklar (Pandas, Selenium) yalnızca motor sürecinde yüklenir.
+    from broadcaster_logic import BroadcasterLogic
+    from session_manager import SessionManager
+
+    proxy = EngineEvents(events)
+    session = SessionManager(proxy._log_to_terminal, state_callback=proxy.on_session_state,
+                             qr_callback=proxy.on_qr_code)
+    logic = BroadcasterLogic(proxy, session)
+    proxy.logic = logic
+    broadcast_thread = None
+
+    def _load_data(path):
+        ok, error = logic.load_data(path)
+        rows, has_message_col = [], False
+        if ok:
+            df = logic.df_data
+            rows = [(row['name'] if 'name' in row and row['name'] else '(İsimsiz Kişi)', row['phone'],
+                     row['status'] if 'status' in row and row['status'] else 'Bekliyor')
+                    for _, row in df.iterrows()]
+            has_message_col = 'message' in df.columns and not df['message'].eq('').all()
+        proxy.emit(EVT_DATA_LOADED, ok, error, rows, has_message_col)
+
+    def _maintain_profile():
+        try:
+            proxy.emit(EVT_MAINTENANCE_DONE, session.maintain_profile(), None)
+        except Exception as e:
+            proxy.emit(EVT_MAINTENANCE_DONE, None, str(e))
+
+    while True:
+        command, *args = commands.get()
+        try:
+            if command == CMD_STOP:
+                break
+            elif command == CMD_LOAD_DATA:
+                _load_data(*args)
+            elif command == CMD_START:
+                if broadcast_thread is not None and broadcast_thread.is_alive():
+                    proxy._log_to_terminal("Gönderim zaten devam ediyor veya durduruluyor.", "error")
+                    continue
+                message_template, speed_mode, logic.engine, logic.pipeline_mode = args
+                broadcast_thread = threading.Thread(target=logic.start_broadcast, args=(message_template, speed_mode),
+                                                    daemon=True)
+                broadcast_thread.start()
+                proxy.emit(EVT_STARTED)
+            elif command == CMD_PAUSE:
+                logic.pause_broadcast()
+            elif command == CMD_RESUME:
+                logic.resume_broadcast()
+            elif command == CMD_CANCEL:
+                logic.cancel_broadcast()
+            elif command == CMD_SETTINGS:
+                session.settings.update(args[0])
+            elif command == CMD_WARM_UP:
+                if broadcast_thread is None or not broadcast_thread.is_alive():
+                    session.warm_up()
+            elif command == CMD_SHUTDOWN_BROWSER:
+                threading.Thread(target=session.shutdown, daemon=True).start()
+            elif command == CMD_MAINTAIN_PROFILE:
+                threading.Thread(target=_maintain_profile, daemon=True).start()
+        except Exception as e:
+            proxy._log_to_terminal(f"Motor komutu işlenemedi ({command}): {e}", "error")
+
+    # Kapanış: gönderim durdurulur, webhook ve tarayıcı kapatılır.
+    logic.cancel_broadcast()
+    if broadcast_thread is not None:
+        broadcast_thread.join(timeout=ENGINE_STOP_TIMEOUT / 2)
+    logic.close()
+    session.close()
+
+
+class EngineProcess:
+    """
+    Arayüz tarafındaki motor istemcisi. Alt süreci başlatır, komutları iletir ve olayları
+    bloklamadan toplar. Motor çökerse veya yeniden başlatılırsa arayüz çalışmaya devam eder.
+    """
+    def __init__(self):
+        self._process = None
+        self._commands = None
+        self._events = None
+        self._stop_deadline = None     # Kapanma istendiyse sürecin kendiliğinden çıkması gereken an
+
+    @property
+    def is_alive(self):
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """Motor sürecini yeni kuyruklarla başlatır."""
+        self._commands = MP_CONTEXT.Queue()
+        self._events = MP_CONTEXT.Queue()
+        self._process = MP_CONTEXT.Process(target=_run_engine, args=(self._commands, self._events),
+                                                name="broadcast-engine", daemon=True)
+        self._process.start()
+
+    def send(self, command, *args):
+        """Motora komut gönderir (bloklamaz)."""
+        if self._commands is not None:
+            self._commands.put((command, *args))
+
+    def poll(self, limit=MAX_EVENTS_PER_POLL):
+        """Birikmiş olayları (en fazla 'limit' adet) bloklamadan döndürür."""
+        events = []
+        while self._events is not None and len(events) < limit:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def request_stop(self, timeout=ENGINE_STOP_TIMEOUT):
+        """Motora kapanma komutu gönderir ve beklemeden döner; kapanış poll_stopped() ile izlenir."""
+        if self._process is not None and self._process.is_alive() and self._stop_deadline is None:
+            self.send(CMD_STOP)
+            self._stop_deadline = time.monotonic() + timeout
+
+    def poll_stopped(self):
+        """
+        Motor süreci çıktıysa True döndürür (bloklamaz). Süre içinde çıkmayan süreç sonlandırılır,
+        sinyale de uymazsa öldürülür; arayüz bunu after() ile yoklayarak yeniden başlatmayı bekler.
+        """
+        if self._process is None:
+            return True
+        if self._process.is_alive():
+            now = time.monotonic()
+            if self._stop_deadline is not None and now >= self._stop_deadline:
+                if now < self._stop_deadline + ENGINE_KILL_GRACE:
+                    self._process.terminate()
+                else:
+                    self._process.kill()
+            return False
+        self._process.join()           # Çıkmış süreç toplanır (beklemez)
+        self._process = None
+        self._stop_deadline = None
+        return True
+
+    def stop(self, timeout=ENGINE_STOP_TIMEOUT):
+        """Motoru kapatıp çıkmasını bekler (uygulama kapanışında kullanılır)."""
+        self.request_stop(timeout)
+        while not self.poll_stopped():
+            time.sleep(EVENT_POLL_INTERVAL_MS / 1000)
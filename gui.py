@@ -2,23 +2,45 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 from PIL import Image
-from threading import Thread
 from datetime import datetime
-import pandas as pd # Sadece type hint'ler ve pd.notna kontrolü için
-
-# BroadcasterLogic sınıfını import ediyoruz.
-from broadcaster_logic import BroadcasterLogic
+from io import BytesIO
+
+# Gönderim motoru (BroadcasterLogic ve tarayıcı oturumu) ayrı bir süreçte çalışır; arayüz onunla
+# yalnızca komut ve olay kuyrukları üzerinden konuşur.
+# Ortak sabitler hafif app_config modülündedir; arayüz süreci motorun ağır bağımlılıklarını yüklemez.
+from app_config import (ENGINES, ENGINE, PIPELINE_MODE, RATE_PRESETS, CHROME_PROFILE_PATH, DEFAULT_BROWSER_SETTINGS,
+                        PAGE_LOAD_STRATEGIES, STATE_CLOSED, STATE_LAUNCHING, STATE_QR_REQUIRED, STATE_READY, STATE_FAILED)
+from engine_process import (EngineProcess, EVENT_POLL_INTERVAL_MS, CMD_LOAD_DATA, CMD_START, CMD_PAUSE, CMD_RESUME,
+                            CMD_CANCEL, CMD_SETTINGS, CMD_WARM_UP, CMD_SHUTDOWN_BROWSER, CMD_MAINTAIN_PROFILE,
+                            EVT_LOG, EVT_ROW, EVT_RESET_ROWS, EVT_PROGRESS, EVT_RATE, EVT_SESSION_STATE, EVT_QR,
+                            EVT_DATA_LOADED, EVT_STARTED, EVT_FINISHED, EVT_MAINTENANCE_DONE)
+from rate_limiter import RateLimiter, rate_state_path
 
 # --- Global Yapılandırma ---
 VERSION = "ViperaDev Versiyon 2.3 Beta"
 LOGO_PATH = "assets/logo.png"
+# Motor süreci hiç olay yayınlamadan art arda bu kadar çökerse otomatik yeniden başlatma durur.
+ENGINE_MAX_CRASH_RESTARTS = 3
+
+# Hız modu ön ayarlarının kısa açıklamaları ve gönderimi bekleten kovanın adı.
+RATE_PRESET_NOTES = {"SAFE": "Güvenli, Önerilir", "FAST": "Dengeli", "TURBO": "Çok Hızlı, Riskli"}
+RATE_BUCKET_LABELS = {'minute': "dakika", 'hour': "saat", 'day': "gün"}
+
+# Tarayıcı oturumu durumlarının kenar çubuğundaki metin ve renkleri.
+SESSION_STATE_LABELS = {
+    STATE_CLOSED: ("Tarayıcı: Kapalı", "gray"),
+    STATE_LAUNCHING: ("Tarayıcı: Başlatılıyor...", "orange"),
+    STATE_QR_REQUIRED: ("Tarayıcı: QR okutulmalı", "#3498db"),
+    STATE_READY: ("Tarayıcı: Hazır", "#2ecc71"),
+    STATE_FAILED: ("Tarayıcı: Başlatılamadı", "#e74c3c"),
+}
 
 
 class WhatsAppGUI(ctk.CTk):
     """
     Ana Arayüz Sınıfı.
     Görsel bileşenleri oluşturur, kullanıcı etkileşimlerini (düğme tıklamaları) yakalar
-    ve BroadcasterLogic sınıfı ile iletişim kurar.
+    ve ayrı süreçteki gönderim motoruyla (EngineProcess) komut/olay kuyrukları üzerinden iletişim kurar.
     """
     def __init__(self):
         super().__init__()
@@ -35,11 +57,26 @@ class WhatsAppGUI(ctk.CTk):
         ctk.set_appearance_mode("System") 
         ctk.set_default_color_theme("blue")
 
-        # Broadcaster mantığını başlatır ve GUI'ye referansını verir.
-        self.logic = BroadcasterLogic(self)
+        # Motor süreci; tarayıcı oturumu motorun içindedir ve gönderimler arasında açık tutulur.
+        self.engine = EngineProcess()
+        self.engine.start()
+        self.qr_window = None          # QR kodunu gösteren pencere (gerektiğinde açılır)
         
         # --- Durum ve Veri Değişkenleri ---
-        self.current_thread = None     # Arka planda çalışan gönderim iş parçacığı
+        # Motorun durumu olaylardan izlenir; arayüz motorun nesnelerine doğrudan erişmez.
+        self.browser_settings = dict(DEFAULT_BROWSER_SETTINGS)  # Motora iletilen tarayıcı ayarları
+        self.engine_name = ENGINE      # Seçili gönderim motoru
+        self.pipeline_mode = PIPELINE_MODE
+        self.is_running = False        # Motorda gönderim sürüyor mu
+        self.is_paused = False
+        self.data_path = None          # Motora yüklenen Excel dosyası (motor yeniden başlarsa tekrar yüklenir)
+        self.total_recipients = 0
+        self.sent_count = 0
+        self.failed_count = 0
+        self.has_message_col = False   # Excel'de dolu bir 'message' sütunu var mı
+        self._closing = False          # Pencere kapanırken motor çökmesi olarak algılanmaz
+        self._engine_crashes = 0       # Olay alınmadan art arda yaşanan motor çökmeleri
+        self._engine_restarting = False  # Eski motorun kapanması bekleniyor (çökme sayılmaz)
         self.recipient_widgets = {}    # Kişi listesi arayüz öğeleri
         
         # --- Arayüz Bileşenlerini Oluşturma Sırası ---
@@ -52,11 +89,108 @@ class WhatsAppGUI(ctk.CTk):
         
         self._log_to_terminal(f"[{self.title()}] Uygulama başlatıldı. Lütfen Excel dosyasını seçin.", "info")
 
+        # Operatör kampanyayı hazırlarken tarayıcı arka planda önceden başlatılır.
+        self._maybe_warm_up_browser()
+
+        # Pencere kapatılırken açık tutulan tarayıcı da kapatılır.
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Motor olayları Tk ana döngüsünde düzenli aralıklarla işlenir.
+        self._event_handlers = {
+            EVT_LOG: self._log_to_terminal,
+            EVT_ROW: self._update_list_status,
+            EVT_RESET_ROWS: self._reset_list_colors,
+            EVT_PROGRESS: self.update_progress,
+            EVT_RATE: self.update_rate_status,
+            EVT_SESSION_STATE: self._on_session_state_change,
+            EVT_QR: self._show_qr_window,
+            EVT_DATA_LOADED: self._on_data_loaded,
+            EVT_STARTED: self._on_broadcast_started,
+            EVT_FINISHED: self._finish_broadcast,
+            EVT_MAINTENANCE_DONE: self._on_profile_maintenance_done,
+        }
+        self.after(EVENT_POLL_INTERVAL_MS, self._poll_engine_events)
+
+    def _on_close(self):
+        """Uygulama kapanırken motoru (gönderim, webhook ve tarayıcı oturumuyla birlikte) kapatır."""
+        self._closing = True
+        self.withdraw()                # Motor kapanırken donmuş pencere gösterilmez
+        self.engine.stop()
+        self.destroy()
+
+    # --- Motor Süreci ---
+
+    def _poll_engine_events(self):
+        """Motorun olay kuyruğunu boşaltır ve arayüzü günceller; motor düştüyse yeniden başlatır."""
+        if self._closing:
+            return
+        events = self.engine.poll()
+        for event, *args in events:
+            handler = self._event_handlers.get(event)
+            if handler:
+                handler(*args)
+        if events:
+            self._engine_crashes = 0
+        if (not self._engine_restarting and not self.engine.is_alive
+                and self._engine_crashes <= ENGINE_MAX_CRASH_RESTARTS):
+            self._on_engine_crash()
+        self.after(EVENT_POLL_INTERVAL_MS, self._poll_engine_events)
+
+    def _on_engine_crash(self):
+        """Motor süreci beklenmedik şekilde sonlandı: gönderim iptal sayılır ve motor yeniden başlatılır."""
+        self._engine_crashes += 1
+        if self.is_running:
+            self._finish_broadcast(cancelled=True)
+        if self._engine_crashes > ENGINE_MAX_CRASH_RESTARTS:
+            self._log_to_terminal("Gönderim motoru art arda başlatılamadı. 'Motoru Yeniden Başlat' ile tekrar deneyin.", "error")
+            return
+        self._log_to_terminal("Gönderim motoru beklenmedik şekilde kapandı. Yeniden başlatılıyor...", "error")
+        self.restart_engine()
+
+    def restart_engine(self):
+        """
+        Motoru yeniden başlatır. Eski süreçten çıkması istenir ve kapanışı after() ile yoklanır;
+        arayüz beklerken donmaz. Yeni süreç açılınca tarayıcı ayarları ve yüklü Excel tekrar iletilir.
+        """
+        if self._engine_restarting:
+            return
+        if self._engine_crashes > ENGINE_MAX_CRASH_RESTARTS:
+            self._engine_crashes = 0
+        self._engine_restarting = True
+        self.restart_engine_button.configure(state="disabled")
+        self.engine.request_stop()
+        self._wait_engine_stopped()
+
+    def _wait_engine_stopped(self):
+        """Eski motor çıkana kadar yoklar, ardından yeni motoru başlatır."""
+        if self._closing:
+            return
+        if not self.engine.poll_stopped():
+            self.after(EVENT_POLL_INTERVAL_MS, self._wait_engine_stopped)
+            return
+        self.engine.start()
+        self._engine_restarting = False
+        self.restart_engine_button.configure(state="normal")
+        self._on_session_state_change(STATE_CLOSED)
+        self.engine.send(CMD_SETTINGS, dict(self.browser_settings))
+        if self.data_path:
+            self.engine.send(CMD_LOAD_DATA, self.data_path)
+        else:
+            self._maybe_warm_up_browser()
+        self._log_to_terminal("Gönderim motoru yeniden başlatıldı.", "info")
+
+    def _on_restart_engine_click(self):
+        """'Motoru Yeniden Başlat' düğmesi (gönderim sürerken kullanılamaz)."""
+        if self.is_running:
+            messagebox.showwarning("Uyarı", "Motor gönderim sürerken yeniden başlatılamaz.")
+            return
+        self.restart_engine()
+
     def _create_sidebar(self):
         """Sol taraftaki navigasyon ve yapılandırma çubuğunu oluşturur."""
         self.sidebar_frame = ctk.CTkFrame(self, width=140, corner_radius=0, fg_color=("gray85", "gray15"))
         self.sidebar_frame.grid(row=0, column=0, rowspan=5, sticky="nsew") 
-        self.sidebar_frame.grid_rowconfigure(8, weight=1)
+        self.sidebar_frame.grid_rowconfigure(9, weight=1)
 
         # --- LOGO VE BAŞLIK ALANI ---
         logo_frame = ctk.CTkFrame(self.sidebar_frame, fg_color=("gray80", "gray18"), corner_radius=0, height=80)
@@ -83,12 +217,12 @@ class WhatsAppGUI(ctk.CTk):
         ctk.CTkLabel(self.sidebar_frame, text="Hız Modu:", anchor="w", 
                      font=ctk.CTkFont(weight="bold")).grid(row=2, column=0, padx=20, pady=(10, 0), sticky="w")
         self.speed_mode = ctk.StringVar(value="FAST")
-        self.mode_optionemenu = ctk.CTkOptionMenu(self.sidebar_frame, values=["SAFE", "FAST", "TURBO"], command=self._show_delay_info)
+        self.mode_optionemenu = ctk.CTkOptionMenu(self.sidebar_frame, values=list(RATE_PRESETS), command=self._show_rate_info)
         self.mode_optionemenu.grid(row=3, column=0, padx=20, pady=(5, 5), sticky="ew")
         
-        # Hız moduna ilişkin açıklayıcı bilgi etiketi
-        self.delay_info_label = ctk.CTkLabel(self.sidebar_frame, text="Gecikme: 5-8 sn", font=ctk.CTkFont(size=10), text_color="gray")
-        self.delay_info_label.grid(row=4, column=0, padx=20, pady=(0, 15), sticky="n") 
+        # Hız modu ön ayarının sınırlarını gösteren bilgi etiketi
+        self.rate_info_label = ctk.CTkLabel(self.sidebar_frame, text="", font=ctk.CTkFont(size=10), text_color="gray")
+        self.rate_info_label.grid(row=4, column=0, padx=20, pady=(0, 15), sticky="n") 
         
         # Tema Seçimi Kontrolleri
         ctk.CTkLabel(self.sidebar_frame, text="Tema:", anchor="w", 
@@ -100,24 +234,193 @@ class WhatsAppGUI(ctk.CTk):
                                                             command=self.change_appearance_mode_event,
                                                             variable=ctk.StringVar(value=initial_appearance)) 
         self.appearance_mode_optionemenu.grid(row=6, column=0, padx=20, pady=(5, 5), sticky="ew")
+
+        self._create_engine_frame()
         
         ctk.CTkLabel(self.sidebar_frame, text="ViperaDev ©", 
-                     font=ctk.CTkFont(size=11, slant="italic", weight="bold")).grid(row=7, column=0, padx=20, pady=(20, 0), sticky="s")
+                     font=ctk.CTkFont(size=11, slant="italic", weight="bold")).grid(row=8, column=0, padx=20, pady=(20, 0), sticky="s")
         ctk.CTkLabel(self.sidebar_frame, text=VERSION, 
-                     font=ctk.CTkFont(size=10)).grid(row=8, column=0, padx=20, pady=(0, 20), sticky="s")
+                     font=ctk.CTkFont(size=10)).grid(row=9, column=0, padx=20, pady=(0, 20), sticky="s")
         
-        self._show_delay_info(self.speed_mode.get())
-
-    def _show_delay_info(self, mode):
-        """Seçilen hız moduna göre gecikme bilgisini günceller."""
-        if mode == "SAFE":
-            info = "Gecikme: 8-15 sn (Güvenli, Önerilir)"
-        elif mode == "FAST":
-            info = "Gecikme: 5-8 sn (Dengeli)"
-        elif mode == "TURBO":
-            info = "Gecikme: 3-5 sn (Çok Hızlı, Riskli)"
-        self.delay_info_label.configure(text=info)
+        self._show_rate_info(self.speed_mode.get())
+
+    def _create_engine_frame(self):
+        """Kenar çubuğunda tarayıcı oturumu durumunu ve motor ayarlarını gösteren bölümü oluşturur."""
+        self.engine_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
+        self.engine_frame.grid(row=7, column=0, padx=20, pady=(15, 0), sticky="ew")
+        self.engine_frame.grid_columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(self.engine_frame, text="Tarayıcı:", anchor="w", 
+                     font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, pady=(0, 0), sticky="w")
+
+        self.session_state_label = ctk.CTkLabel(self.engine_frame, text=SESSION_STATE_LABELS[STATE_CLOSED][0], anchor="w",
+                                                font=ctk.CTkFont(size=11, weight="bold"), text_color=SESSION_STATE_LABELS[STATE_CLOSED][1])
+        self.session_state_label.grid(row=1, column=0, pady=(0, 5), sticky="w")
+
+        self.prelaunch_var = ctk.BooleanVar(value=True)
+        self.prelaunch_switch = ctk.CTkSwitch(self.engine_frame, text="Önceden başlat", variable=self.prelaunch_var,
+                                              command=self._maybe_warm_up_browser, font=ctk.CTkFont(size=11))
+        self.prelaunch_switch.grid(row=2, column=0, pady=(0, 5), sticky="w")
+
+        self.lean_mode_var = ctk.BooleanVar(value=self.browser_settings['lean_mode'])
+        self.lean_mode_switch = ctk.CTkSwitch(self.engine_frame, text="Hafif mod", variable=self.lean_mode_var,
+                                              command=self._on_lean_mode_toggle, font=ctk.CTkFont(size=11))
+        self.lean_mode_switch.grid(row=3, column=0, pady=(0, 5), sticky="w")
+
+        self.headless_var = ctk.BooleanVar(value=self.browser_settings['headless'])
+        self.headless_switch = ctk.CTkSwitch(self.engine_frame, text="Görünmez (headless)", variable=self.headless_var,
+                                             command=self._on_headless_toggle, font=ctk.CTkFont(size=11))
+        self.headless_switch.grid(row=4, column=0, pady=(0, 5), sticky="w")
+
+        self.pipeline_var = ctk.BooleanVar(value=self.pipeline_mode)
+        self.pipeline_switch = ctk.CTkSwitch(self.engine_frame, text="Ardışık hazırlık", variable=self.pipeline_var,
+                                             command=self._on_pipeline_toggle, font=ctk.CTkFont(size=11))
+        self.pipeline_switch.grid(row=5, column=0, pady=(0, 5), sticky="w")
+
+        ctk.CTkLabel(self.engine_frame, text="Sayfa yükleme:", anchor="w", 
+                     font=ctk.CTkFont(size=11)).grid(row=6, column=0, pady=(5, 0), sticky="w")
+        self.page_load_optionmenu = ctk.CTkOptionMenu(self.engine_frame, values=list(PAGE_LOAD_STRATEGIES),
+                                                      command=self._on_page_load_strategy_change,
+                                                      variable=ctk.StringVar(value=self.browser_settings['page_load_strategy']))
+        self.page_load_optionmenu.grid(row=7, column=0, pady=(0, 5), sticky="ew")
+
+        ctk.CTkLabel(self.engine_frame, text="Motor:", anchor="w", 
+                     font=ctk.CTkFont(size=11)).grid(row=8, column=0, pady=(5, 0), sticky="w")
+        self.engine_optionmenu = ctk.CTkOptionMenu(self.engine_frame, values=ENGINES,
+                                                   command=self._on_engine_change,
+                                                   variable=ctk.StringVar(value=self.engine_name))
+        self.engine_optionmenu.grid(row=9, column=0, pady=(0, 5), sticky="ew")
+
+        self.profile_maintenance_button = ctk.CTkButton(self.engine_frame, text="Profili Temizle", height=26,
+                                                        command=self.start_profile_maintenance, font=ctk.CTkFont(size=11),
+                                                        fg_color="gray40", hover_color="gray30")
+        self.profile_maintenance_button.grid(row=10, column=0, pady=(5, 5), sticky="ew")
+
+        self.restart_engine_button = ctk.CTkButton(self.engine_frame, text="Motoru Yeniden Başlat", height=26,
+                                                   command=self._on_restart_engine_click, font=ctk.CTkFont(size=11),
+                                                   fg_color="gray40", hover_color="gray30")
+        self.restart_engine_button.grid(row=11, column=0, pady=(0, 5), sticky="ew")
+
+    def _update_browser_setting(self, key, value):
+        """Tarayıcı ayarını saklar ve motora iletir."""
+        self.browser_settings[key] = value
+        self.engine.send(CMD_SETTINGS, {key: value})
+
+    def _on_lean_mode_toggle(self):
+        """Hafif modu (görsel/medya/yazı tipi engelleme) açar veya kapatır."""
+        self._update_browser_setting('lean_mode', self.lean_mode_var.get())
+        state_text = "açıldı" if self.lean_mode_var.get() else "kapatıldı"
+        self._log_to_terminal(f"Hafif mod {state_text}. Değişiklik bir sonraki tarayıcı başlatılışında geçerli olur.", "info")
+
+    def _on_headless_toggle(self):
+        """Tarayıcının görünmez (headless) çalışmasını açar veya kapatır."""
+        self._update_browser_setting('headless', self.headless_var.get())
+        state_text = "açıldı" if self.headless_var.get() else "kapatıldı"
+        self._log_to_terminal(f"Görünmez mod {state_text}. Değişiklik bir sonraki tarayıcı başlatılışında geçerli olur.", "info")
+
+    def _on_pipeline_toggle(self):
+        """Ardışık hazırlık modunu açar/kapatır (sonraki kişinin sohbeti tempo beklemesi sırasında hazırlanır)."""
+        self.pipeline_mode = self.pipeline_var.get()
+        state_text = "açıldı" if self.pipeline_var.get() else "kapatıldı"
+        self._log_to_terminal(f"Ardışık hazırlık {state_text}.", "info")
+
+    def _on_page_load_strategy_change(self, strategy):
+        """Sayfa yükleme stratejisini (normal/eager/none) değiştirir."""
+        self._update_browser_setting('page_load_strategy', strategy)
+        self._log_to_terminal(f"Sayfa yükleme stratejisi '{strategy}' olarak ayarlandı. Bir sonraki tarayıcı başlatılışında geçerli olur.", "info")
+
+    def _on_engine_change(self, engine):
+        """Gönderim motorunu (selenium/playwright/cloud_api/multi_profile) değiştirir; bir sonraki gönderimde geçerli olur."""
+        self.engine_name = engine
+        self._log_to_terminal(f"Gönderim motoru '{engine}' olarak ayarlandı. Bir sonraki gönderimde geçerli olur.", "info")
+        if engine == "playwright":
+            # Playwright aynı profili kendi tarayıcısıyla açar; önceden başlatılan Selenium tarayıcısı kapatılır.
+            self.engine.send(CMD_SHUTDOWN_BROWSER)
+        elif engine in ("selenium", "multi_profile"):
+            self._maybe_warm_up_browser()
+
+    def start_profile_maintenance(self):
+        """Chrome profilindeki önbellekleri motor sürecinde temizler (gönderim sürerken yapılamaz)."""
+        if self.is_running:
+            messagebox.showwarning("Uyarı", "Profil bakımı gönderim sürerken yapılamaz.")
+            return
+        self.profile_maintenance_button.configure(state="disabled", text="Temizleniyor...")
+        self._log_to_terminal("Profil bakımı başlatıldı. Tarayıcı açıksa kapatılıp yeniden başlatılacak...", "info")
+        self.engine.send(CMD_MAINTAIN_PROFILE)
+
+    def _on_profile_maintenance_done(self, result, error):
+        """Motordan gelen profil bakımı sonucunu terminale yazar."""
+        if result is not None:
+            self._log_to_terminal(
+                f"Profil bakımı tamamlandı: {result['size_before_mb']} MB -> {result['size_after_mb']} MB "
+                f"({result['freed_mb']} MB boşaltıldı, {len(result['removed'])} önbellek klasörü silindi). "
+                f"Başlatma süresi: {result['startup_before_s']} sn -> {result['startup_after_s']} sn.", "success")
+        else:
+            self._log_to_terminal(f"Profil bakımı başarısız oldu: {error}", "error")
+        self.profile_maintenance_button.configure(state="normal", text="Profili Temizle")
+
+    def _on_session_state_change(self, state):
+        """Motordaki oturum yöneticisinin durum değişikliğini kenar çubuğunda gösterir."""
+        text, color = SESSION_STATE_LABELS.get(state, SESSION_STATE_LABELS[STATE_CLOSED])
+        if hasattr(self, 'session_state_label'):
+            self.session_state_label.configure(text=text, text_color=color)
+
+    def _show_qr_window(self, png_bytes):
+        """Motordan gelen QR kodunu ayrı bir pencerede gösterir; None gelirse pencereyi kapatır."""
+        if png_bytes is None:
+            if self.qr_window is not None:
+                self.qr_window.destroy()
+                self.qr_window = None
+            return
+
+        pil_image = Image.open(BytesIO(png_bytes))
+        qr_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=(280, 280))
+
+        if self.qr_window is None or not self.qr_window.winfo_exists():
+            self.qr_window = ctk.CTkToplevel(self)
+            self.qr_window.title("WhatsApp Web - QR Kodu")
+            self.qr_window.resizable(False, False)
+            ctk.CTkLabel(self.qr_window, text="Telefonunuzda WhatsApp > Bağlı Cihazlar > Cihaz Bağla\nmenüsünden bu kodu okutun.",
+                         font=ctk.CTkFont(size=13, weight="bold")).pack(padx=20, pady=(20, 10))
+            self.qr_label = ctk.CTkLabel(self.qr_window, text="")
+            self.qr_label.pack(padx=20, pady=(0, 20))
+            self.qr_window.attributes("-topmost", True)
+
+        self.qr_label.configure(image=qr_image)
+        self.qr_label.image = qr_image # Görüntünün çöp toplayıcı tarafından silinmemesi için
+
+    def _maybe_warm_up_browser(self):
+        """'Önceden başlat' açıksa tarayıcıyı motor sürecinde arka planda başlatır (gönderim sürerken dokunulmaz)."""
+        # Önceden başlatma yalnızca Selenium motorları içindir (oturum yöneticisinin tarayıcısı).
+        if self.prelaunch_var.get() and not self.is_running and self.engine_name in ("selenium", "multi_profile"):
+            self.engine.send(CMD_WARM_UP)
+
+    def _show_rate_info(self, mode):
+        """Seçilen hız modu ön ayarının sınırlarını ve profilin kayıtlı kovalarına göre sonraki gönderim anını gösterir."""
+        preset = RATE_PRESETS[mode]
+        self.rate_info_label.configure(
+            text=f"{preset['per_minute']}/dk · {preset['per_hour']}/sa · {preset['per_day']}/gün "
+                 f"(patlama {preset['burst']})\n{RATE_PRESET_NOTES[mode]}")
         self.speed_mode.set(mode)
+        if not self.is_running and hasattr(self, 'rate_status_label'):
+            self.update_rate_status(RateLimiter.from_preset(mode, rate_state_path(CHROME_PROFILE_PATH)).status())
+
+    def update_rate_status(self, status):
+        """
+        Gönderimi şu an sınırlayan kovanın hızını, uzun vadeli ortalamayı ve bir sonraki gönderim
+        anını gösterir (motorun 'rate' olayı). Bekleten kova yoksa tempoyu dakika kovası belirler.
+        """
+        average = status['effective_per_minute']
+        if average is None:
+            self.rate_status_label.configure(text="Hız sınırı: yok")
+            return
+        bucket_rates = status['bucket_rates']
+        limiting = status['limited_by'] or ('minute' if 'minute' in bucket_rates else min(bucket_rates, key=bucket_rates.get))
+        next_slot = datetime.fromtimestamp(status['next_slot_at'])
+        slot_text = "hemen" if next_slot <= datetime.now() else next_slot.strftime("%H:%M:%S")
+        self.rate_status_label.configure(
+            text=f"Şu anki sınır: {bucket_rates[limiting]:.1f} mesaj/dk ({RATE_BUCKET_LABELS[limiting]} kovası) | "
+                 f"Uzun vadeli ortalama: {average:.1f} mesaj/dk | Sonraki gönderim: {slot_text}")
 
     def _create_main_frames(self):
         """Ana içerik çerçevelerini (Dosya Yolu ve Mesaj Şablonu) oluşturur."""
@@ -166,7 +469,7 @@ class WhatsAppGUI(ctk.CTk):
         """Başlatma/İptal etme düğmelerini içeren kontrol çerçevesini oluşturur."""
         self.controls_frame = ctk.CTkFrame(self, corner_radius=10)
         self.controls_frame.grid(row=2, column=1, columnspan=2, padx=(20, 20), pady=(10, 10), sticky="ew")
-        self.controls_frame.grid_columnconfigure((0, 1), weight=1)
+        self.controls_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
         self.start_button = ctk.CTkButton(self.controls_frame, text="Gönderimi BAŞLAT", command=self.start_broadcast_thread, height=45, 
                                           font=ctk.CTkFont(size=15, weight="bold"),
@@ -176,7 +479,12 @@ class WhatsAppGUI(ctk.CTk):
         self.cancel_button = ctk.CTkButton(self.controls_frame, text="Gönderimi İPTAL ET", command=self.cancel_broadcast, height=45, 
                                            font=ctk.CTkFont(size=15, weight="bold"),
                                            fg_color="#e74c3c", hover_color="#c0392b", state="disabled")
-        self.cancel_button.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
+        self.pause_button = ctk.CTkButton(self.controls_frame, text="DURAKLAT", command=self.toggle_pause, height=45, 
+                                          font=ctk.CTkFont(size=15, weight="bold"),
+                                          fg_color="#f39c12", hover_color="#d68910", state="disabled")
+        self.pause_button.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
+
+        self.cancel_button.grid(row=0, column=2, padx=10, pady=10, sticky="ew")
     
     def _create_progress_frame(self):
         """İlerleme çubuğunu ve sayaçları içeren durumu gösteren çerçeveyi oluşturur."""
@@ -194,6 +502,11 @@ class WhatsAppGUI(ctk.CTk):
         self.status_label = ctk.CTkLabel(self.progress_frame, text="Durum: Bekleniyor...", anchor="e", font=ctk.CTkFont(weight="bold"))
         self.status_label.grid(row=1, column=1, padx=20, pady=(0, 15), sticky="e")
 
+        self.rate_status_label = ctk.CTkLabel(self.progress_frame, text="", anchor="w", font=ctk.CTkFont(size=11),
+                                              text_color="gray")
+        self.rate_status_label.grid(row=2, column=0, columnspan=2, padx=20, pady=(0, 10), sticky="w")
+        self._show_rate_info(self.speed_mode.get())
+
     def _create_log_frame(self):
         """Uygulama mesajlarını ve durumunu gösteren terminal alanını oluşturur."""
         self.log_frame = ctk.CTkFrame(self, corner_radius=10, border_width=2)
@@ -244,18 +557,29 @@ class WhatsAppGUI(ctk.CTk):
             self.preview_data_ui(file_path)
 
     def preview_data_ui(self, file_path):
-        """Veri okuma mantığını çağırır ve arayüzü günceller."""
-        success, error_msg = self.logic.load_data(file_path)
-        
+        """Excel dosyasını motora yükletir; sonuç 'data_loaded' olayıyla gelir."""
+        if self.is_running:
+            messagebox.showwarning("Uyarı", "Gönderim sürerken yeni veri yüklenemez.")
+            return
+        self.status_label.configure(text="Durum: Veri Yükleniyor...")
+        self.engine.send(CMD_LOAD_DATA, file_path)
+        self.data_path = file_path
+
+    def _on_data_loaded(self, success, error_msg, rows, has_message_col):
+        """Motordan gelen veri yükleme sonucunu arayüze yansıtır."""
         if success:
-            total = self.logic.total_recipients
+            total = len(rows)
+            self.total_recipients = total
+            self.has_message_col = has_message_col
             self.counter_label.configure(text=f"Hazır | Toplam Kişi: {total}")
             self.status_label.configure(text="Durum: Veri Yüklendi.")
-            self._populate_list(self.logic.df_data)
+            self._populate_list(rows)
             self._log_to_terminal(f"Excel verisi başarıyla yüklendi. Toplam {total} kişi.", "info")
+            self._maybe_warm_up_browser()
         else:
             messagebox.showerror("Hata", error_msg)
-            self.logic.df_data = None
+            self.data_path = None
+            self.total_recipients = 0
             self.counter_label.configure(text="Hazır | Toplam Kişi: 0")
             self._clear_list()
             self._log_to_terminal(f"Dosya okuma hatası: {error_msg}", "error")
@@ -267,17 +591,13 @@ class WhatsAppGUI(ctk.CTk):
         self.recipient_widgets = {}
         self.list_scroll_frame.configure(label_text="Yüklenen Kişiler (0 Kişi)")
 
-    def _populate_list(self, df):
-        """DataFrame'den kişileri okur ve arayüzdeki listeye doldurur."""
+    def _populate_list(self, rows):
+        """Motordan gelen (isim, telefon, durum) satırlarını arayüzdeki listeye doldurur."""
         self._clear_list()
-        total_recipients = len(df)
+        total_recipients = len(rows)
         self.list_scroll_frame.configure(label_text=f"Yüklenen Kişiler ({total_recipients} Kişi)")
         
-        for list_row_index, (_, row) in enumerate(df.iterrows()):
-            phone_raw = row['phone']
-            # pandas.notna kontrolünü kullanmadan güvenli erişim (logic dosyasında fillna yapıldı)
-            name = row['name'] if 'name' in row and row['name'] else '(İsimsiz Kişi)'
-            status = row['status'] if 'status' in row and row['status'] else 'Bekliyor'
+        for list_row_index, (name, phone_raw, status) in enumerate(rows):
             
             person_frame = ctk.CTkFrame(self.list_scroll_frame, border_width=1, corner_radius=5)
             person_frame.grid(row=list_row_index, column=0, padx=5, pady=3, sticky="ew")
@@ -297,7 +617,7 @@ class WhatsAppGUI(ctk.CTk):
             }
 
     def _update_list_status(self, index, status_text, color_key="pending"):
-        """Kişi listesindeki bir öğenin durumunu ve rengini anlık olarak günceller (Logic tarafından çağrılır)."""
+        """Kişi listesindeki bir öğenin durumunu ve rengini anlık olarak günceller (motor olayı)."""
         if index in self.recipient_widgets:
             status_widget = self.recipient_widgets[index]['status_label']
             frame_widget = self.recipient_widgets[index]['frame']
@@ -319,17 +639,17 @@ class WhatsAppGUI(ctk.CTk):
             frame_widget.configure(fg_color=frame_bg)
 
     def _reset_list_colors(self):
-        """Gönderim başlamadan listeyi 'Bekliyor' durumuna ve rengine sıfırlar (Logic tarafından çağrılır)."""
+        """Gönderim başlamadan listeyi 'Bekliyor' durumuna ve rengine sıfırlar (motor olayı)."""
         for index, widgets in self.recipient_widgets.items():
             widgets['status_label'].configure(text="Durum: Bekliyor", text_color="gray")
             widgets['frame'].configure(fg_color=self.list_scroll_frame.cget("fg_color"))
 
-    def update_progress(self):
-        """İlerleme çubuğunu ve sayaçları anlık olarak günceller (Logic tarafından çağrılır)."""
-        sent_count = len(self.logic.sent_log)
-        failed_count = len(self.logic.failed_log)
+    def update_progress(self, sent_count=None, failed_count=None, total=None):
+        """İlerleme çubuğunu ve sayaçları günceller; sayaçlar motorun 'progress' olayıyla gelir."""
+        if sent_count is not None:
+            self.sent_count, self.failed_count, self.total_recipients = sent_count, failed_count, total
+        sent_count, failed_count, total = self.sent_count, self.failed_count, self.total_recipients
         processed_count = sent_count + failed_count
-        total = self.logic.total_recipients
         
         progress_value = processed_count / total if total > 0 else 0
         
@@ -342,22 +662,20 @@ class WhatsAppGUI(ctk.CTk):
     # --- Kontrol Fonksiyonları ---
 
     def start_broadcast_thread(self):
-        """Gönderim işlemini ayrı bir Thread'de başlatır."""
-        if self.logic.is_running:
-            messagebox.showwarning("Uyarı", "Gönderim zaten devam ediyor.")
+        """Gönderim işlemini motor sürecinde başlatır (motor kendi iş parçacığında yürütür)."""
+        if self.is_running:
+            messagebox.showwarning("Uyarı", "Gönderim zaten devam ediyor veya durduruluyor.")
             return
 
         file_path = self.file_path_entry.get()
         message_template = self.message_textbox.get("0.0", "end-1c")
 
-        if not file_path or self.logic.df_data is None or self.logic.total_recipients == 0: 
+        if not file_path or self.data_path is None or self.total_recipients == 0: 
             messagebox.showerror("Hata", "Lütfen geçerli bir Excel dosyası seçin ve veriyi yükleyin.")
             self._log_to_terminal("HATA: Gönderim başlatılamadı. Dosya seçimi veya veri yüklemesi eksik.", "error")
             return
         
-        # logic.df_data zaten fillna() ile temizlendiği için doğrudan kontrol edilebilir.
-        has_message_col = 'message' in self.logic.df_data.columns and not self.logic.df_data['message'].eq('').all()
-        if not message_template.strip() and not has_message_col:
+        if not message_template.strip() and not self.has_message_col:
              messagebox.showerror("Hata", "Lütfen bir mesaj şablonu girin veya Excel dosyanızdaki 'message' sütununu doldurun.")
              self._log_to_terminal("HATA: Gönderim başlatılamadı. Mesaj içeriği eksik.", "error")
              return
@@ -365,34 +683,66 @@ class WhatsAppGUI(ctk.CTk):
         # Arayüz durumunu güncelle
         self.start_button.configure(state="disabled", text="Gönderim Başladı")
         self.cancel_button.configure(state="normal")
+        self.pause_button.configure(state="normal", text="DURAKLAT")
         self.progress_bar.set(0)
+        self.is_running = True
+        self.is_paused = False
+        self.sent_count = self.failed_count = 0
         self.update_progress()
         self._log_to_terminal(f"Gönderim işlemi başlatılıyor. Hız Modu: {self.speed_mode.get()}", "info")
 
-        # Logic'i ayrı bir Thread'de başlat
-        self.current_thread = Thread(target=self.logic.start_broadcast, args=(message_template, self.speed_mode.get()))
-        self.current_thread.start()
+        self.engine.send(CMD_START, message_template, self.speed_mode.get(), self.engine_name, self.pipeline_mode)
+
+    def _on_broadcast_started(self):
+        """Motor gönderimi başlattı."""
+        self.is_running = True
 
     def cancel_broadcast(self, hard_stop=False):
-        """Gönderimi durdurur ve Logic'i çağırır."""
-        if self.logic.is_running or hard_stop:
+        """
+        Motora iptal komutu gönderir. Beklenmez; döngü durunca motor 'finished' olayını yayınlar.
+        """
+        if self.is_running or hard_stop:
             self.status_label.configure(text="Durum: İptal Ediliyor...")
-            self._log_to_terminal("Kullanıcı isteği üzerine iptal ediliyor. Tarayıcı kapatılıyor...", "info")
-            
-            self.logic.cancel_broadcast()
+            self._log_to_terminal("Kullanıcı isteği üzerine iptal ediliyor. Tarayıcı bir sonraki gönderim için açık tutulacak...", "info")
+            self.cancel_button.configure(state="disabled")
+            self.pause_button.configure(state="disabled", text="DURAKLAT")
             
-            if not hard_stop and self.current_thread and self.current_thread.is_alive():
-                self.current_thread.join(timeout=5)
+            self.engine.send(CMD_CANCEL)
             
             if hard_stop:
                 self._finish_broadcast(cancelled=True)
         else:
             messagebox.showinfo("Bilgi", "Gönderim zaten durdurulmuş.")
 
-    def _finish_broadcast(self, cancelled=False):
-        """Gönderim tamamlandığında veya iptal edildiğinde son işlemleri yapar (Logic tarafından çağrılır)."""
+    def toggle_pause(self):
+        """Gönderimi duraklatır veya kaldığı kişiden devam ettirir."""
+        if not self.is_running:
+            return
+        if self.is_paused:
+            self.is_paused = False
+            self.engine.send(CMD_RESUME)
+            self.pause_button.configure(text="DURAKLAT")
+            self.status_label.configure(text="Durum: Devam Ediliyor...")
+            self._log_to_terminal("Gönderime devam ediliyor.", "info")
+        else:
+            self.is_paused = True
+            self.engine.send(CMD_PAUSE)
+            self.pause_button.configure(text="DEVAM ET")
+            self.status_label.configure(text="Durum: DURAKLATILDI (Tarayıcı açık)")
+            self._log_to_terminal("Duraklatma istendi. Mevcut kişi tamamlanınca gönderim bekletilecek.", "info")
+
+    def _finish_broadcast(self, cancelled=False, report=None):
+        """
+        Gönderim tamamlandığında veya iptal edildiğinde son işlemleri yapar (motor olayı).
+        Raporlar motor sürecinde üretilir; 'report' (başarılı_mı, klasör/hata) veya None olarak gelir.
+        """
+        if not self.is_running:
+            return
+        self.is_running = False
+        self.is_paused = False
         self.start_button.configure(state="normal", text="Gönderimi BAŞLAT")
         self.cancel_button.configure(state="disabled")
+        self.pause_button.configure(state="disabled", text="DURAKLAT")
 
         if cancelled:
             self.status_label.configure(text="Durum: GÖNDERİM İPTAL EDİLDİ.")
@@ -401,13 +751,13 @@ class WhatsAppGUI(ctk.CTk):
             self.status_label.configure(text="Durum: GÖNDERİM TAMAMLANDI.")
             self._log_to_terminal("Gönderim başarıyla TAMAMLANDI.", "success")
 
-        if self.logic.sent_log or self.logic.failed_log:
-            success, report_path = self.logic.generate_reports()
+        if report is not None:
+            success, report_path = report
             if success:
                  self._log_to_terminal(f"Raporlar oluşturuldu ve '{report_path}' klasörüne kaydedildi.", "info")
                  messagebox.showinfo("Tamamlandı", f"Gönderim tamamlandı.\nRaporlar şu klasöre kaydedildi: \n{report_path}")
             else:
-                 self._log_to_terminal(f"Rapor oluşturulurken kritik hata oluştu.", "error")
+                 self._log_to_terminal("Rapor oluşturulurken kritik hata oluştu.", "error")
         elif not cancelled:
              messagebox.showinfo("Bilgi", "İşlenecek veri yok veya işlem başlatılamadı.")
              self._log_to_terminal("İşlenecek veri kalmadı, işlem sonlandı.", "info")
@@ -1,5 +1,9 @@
+import multiprocessing
+
 from gui import WhatsAppGUI
 
 if __name__ == "__main__":
+    # Gönderim motoru ayrı bir süreçte çalışır (paketlenmiş Windows sürümü için gerekli).
+    multiprocessing.freeze_support()
     app = WhatsAppGUI()
     app.mainloop()
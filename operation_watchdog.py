@@ -0,0 +1,79 @@
+import time
+import threading
+from contextlib import contextmanager
+
+# İzleme iş parçacığının süreleri kontrol etme aralığı (sn).
+WATCHDOG_POLL_INTERVAL = 0.2
+
+
+class OperationTimeout(Exception):
+    """Bir WebDriver işlemi kendisine tanınan süreyi aştığında (watchdog müdahalesiyle) fırlatılır."""
+
+
+class OperationWatchdog:
+    """
+    Tek tek WebDriver işlemlerine son tarih (deadline) uygular.
+    İşlem guard() bloğu içinde çalışır; süre aşılırsa arka plandaki izleme iş parçacığı
+    'on_breach' fonksiyonunu çağırır (ör. tarayıcıyı öldürür). Böylece askıda kalan çağrı
+    bağlantı hatasıyla döner ve blok OperationTimeout fırlatır.
+    """
+    def __init__(self, on_breach):
+        self._on_breach = on_breach    # Süre aşımında çağrılır: on_breach(etiket)
+        self._lock = threading.Lock()
+        self._deadline = None          # Kurulu işlemin son tarihi (time.monotonic)
+        self._label = None             # Kurulu işlemin adı (loglar için)
+        self._breached = False         # Kurulu işlem süreyi aştı mı
+        self._thread = None
+        self._stop = threading.Event()  # Çalışan izleme iş parçacığının durdurma sinyali (stop() kurar)
+
+    def _ensure_thread(self):
+        """İzleme iş parçacığını ilk kullanımda başlatır."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._monitor, args=(self._stop,), daemon=True)
+            self._thread.start()
+
+    def _monitor(self, stop):
+        """Kurulu işlemin süresini izler; aşılırsa on_breach'i bir kez çağırır."""
+        while not stop.wait(WATCHDOG_POLL_INTERVAL):
+            with self._lock:
+                expired = (self._deadline is not None and not self._breached
+                           and time.monotonic() > self._deadline)
+                if expired:
+                    self._breached = True
+                    label = self._label
+            if expired:
+                try:
+                    self._on_breach(label)
+                except Exception:
+                    pass
+
+    def stop(self):
+        """İzleme iş parçacığını durdurur; sonraki guard() onu yeniden başlatır."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=WATCHDOG_POLL_INTERVAL * 2)
+        self._thread = None
+
+    @contextmanager
+    def guard(self, label, timeout):
+        """
+        Blok içindeki işleme 'timeout' saniyelik son tarih uygular.
+        Süre aşılırsa blok, içeride oluşan hatadan bağımsız olarak OperationTimeout fırlatır.
+        """
+        self._ensure_thread()
+        with self._lock:
+            self._deadline = time.monotonic() + timeout
+            self._label = label
+            self._breached = False
+        try:
+            yield
+        finally:
+            with self._lock:
+                breached = self._breached
+                self._deadline = None
+                self._label = None
+                self._breached = False
+            if breached:
+                raise OperationTimeout(f"'{label}' işlemi {timeout} sn içinde tamamlanmadı.")
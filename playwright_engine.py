@@ -0,0 +1,378 @@
+import time
+import asyncio
+import concurrent.futures
+
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+except ImportError: # Playwright opsiyoneldir: pip install playwright
+    async_playwright = None
+    PlaywrightTimeoutError = TimeoutError
+
+from app_config import CHROME_PROFILE_PATH, DEFAULT_BROWSER_SETTINGS
+from session_manager import (SessionCancelled, LEAN_CHROME_FLAGS, LOGIN_TIMEOUT, QR_CANVAS_CSS, QR_SCAN_TIMEOUT,
+                             LOGIN_PROBE_INTERVAL, SEARCH_INPUT_XPATH, WHATSAPP_WEB_URL)
+from transport import (Transport, AsyncLoopRunner, BroadcastCancelled, delivery_outcome, OUTCOME_SENT, OUTCOME_UNCONFIRMED,
+                       OUTCOME_INVALID, OUTCOME_FAILED, INVALID_NUMBER_REASON, STOP_POLL_INTERVAL)
+from whatsapp_selectors import (MESSAGE_BOX_XPATH, INVALID_NUMBER_XPATH, INVALID_DIALOG_BUTTON_XPATH, IN_APP_NAV_FUNCTION,
+                                PASTE_MESSAGE_FUNCTION, OUTGOING_BUBBLE_XPATH, PENDING_ICON_CSS, SENT_ICON_CSS)
+
+# --- Global Yapılandırma ve Sabitler ---
+# Sohbetin (veya geçersiz numara uyarısının) görünmesi için azami bekleme süresi (ms).
+CHAT_READY_TIMEOUT_MS = 20000
+# Uygulama içi sohbet geçişi için beklenen süre (ms); aşılırsa page.goto'ya düşülür.
+IN_APP_NAV_TIMEOUT_MS = 5000
+# Geçersiz numara uyarısının kapatıldıktan sonra ekrandan kalkması için beklenen süre (ms).
+INVALID_DIALOG_DISMISS_TIMEOUT_MS = 3000
+# Mesajın tik ile onaylanması için azami bekleme süresi (ms).
+SEND_CONFIRM_TIMEOUT_MS = 30000
+# Motorun tek bir işleminin (sohbet açma, yazma, gönderme) senkron taraftan beklenen azami süresi (sn).
+PLAYWRIGHT_OPERATION_TIMEOUT = 60
+# Hafif modda Playwright yönlendirmesiyle hiç indirilmeyen kaynak türleri.
+LEAN_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# Son giden balonun sayısı 'before'dan büyük ve saat simgesi yerine tik taşıyorsa true döner.
+SEND_CONFIRMED_FUNCTION = """([xpath, before, pendingCss, sentCss]) => {
+const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+if (result.snapshotLength <= before) return false;
+const last = result.snapshotItem(result.snapshotLength - 1);
+return !last.querySelector(pendingCss) && !!last.querySelector(sentCss);
+}"""
+
+# QR tuvalinin bağlı olduğu kodun kimliği (data-ref); yalnızca kod değiştiğinde görüntü alınır.
+QR_REF_FUNCTION = """(canvas) => {
+const el = canvas.closest('[data-ref]');
+return el ? el.getAttribute('data-ref') : null;
+}"""
+
+# Açık sohbet panelini ve ekranda kalan uyarıları işaretler; işaretsiz yeni bir panel sohbetin
+# değiştiğini, işaretsiz bir uyarı ise bu gezinmede numaranın geçersiz çıktığını gösterir.
+MARK_CURRENT_CHAT_FUNCTION = """(invalidXpath) => {
+const main = document.getElementById('main');
+if (main) main.dataset.broadcasterSeen = '1';
+const result = document.evaluate(invalidXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < result.snapshotLength; i++) result.snapshotItem(i).dataset.broadcasterSeen = '1';
+}"""
+# Yeni (işaretsiz) bir sohbet paneli veya geçersiz numara uyarısı görünürse true döner.
+CHAT_SWITCHED_FUNCTION = """(invalidXpath) => {
+const result = document.evaluate(invalidXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < result.snapshotLength; i++) if (!result.snapshotItem(i).dataset.broadcasterSeen) return true;
+const main = document.getElementById('main');
+return !!main && !main.dataset.broadcasterSeen;
+}"""
+
+
+class PlaywrightEngine:
+    """
+    Playwright'ın async API'si üzerine kurulu WhatsApp Web motoru. Metotları coroutine'dir;
+    senkron gönderim döngüsünden AsyncLoopRunner üzerinden çağrılır.
+    BroadcasterLogic'in Selenium ile yaptığı işlemlerin aynısını sunar: oturum açma, sohbet açma,
+    metin yerleştirme, gönderme ve geçersiz numara tespiti. Aynı CHROME_PROFILE_PATH kullanılır.
+    Kalıcı CDP bağlantısı ve otomatik bekleme sayesinde komut başına gecikme daha düşüktür.
+    """
+    def __init__(self, log_callback, profile_path=CHROME_PROFILE_PATH, settings=None, qr_callback=None):
+        if async_playwright is None:
+            raise RuntimeError("Playwright motoru için 'playwright' paketi gerekli: pip install playwright")
+        self._log = log_callback
+        self._qr_callback = qr_callback
+        self.profile_path = profile_path
+        self.settings = dict(DEFAULT_BROWSER_SETTINGS, **(settings or {}))
+        self._playwright = None
+        self.context = None
+        self.page = None
+        self.enter_pressed = False     # Mevcut alıcı için Enter'a basıldı mı (tekrar göndermeyi önler)
+
+    # --- Oturum ---
+
+    async def init_session(self, stop_event=None):
+        """
+        Kalıcı profil ile Chrome'u başlatır ve WhatsApp Web oturumunun hazır olmasını bekler.
+        Beklerken durdurma sinyali gelirse BroadcastCancelled fırlatır.
+        """
+        width, height = self.settings['window_size']
+        args = ["--disable-blink-features=AutomationControlled"]
+        if self.settings['lean_mode']:
+            args.extend(LEAN_CHROME_FLAGS)
+
+        self._log("Playwright ile Chrome başlatılıyor...", "info")
+        self._playwright = await async_playwright().start()
+        self.context = await self._playwright.chromium.launch_persistent_context(
+            self.profile_path, channel="chrome", headless=self.settings['headless'],
+            viewport={"width": width, "height": height}, args=args)
+        self.context.set_default_timeout(self.settings['page_load_timeout'] * 1000)
+        if self.settings['lean_mode']:
+            await self.context.route("**/*", self._block_heavy_resources)
+
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+        await self.page.goto(WHATSAPP_WEB_URL, wait_until="domcontentloaded")
+        await self._wait_for_login(stop_event)
+        self._log("WhatsApp Web oturumu hazır (Playwright).", "success")
+
+    async def _block_heavy_resources(self, route):
+        """Hafif modda görsel, medya ve yazı tipi isteklerini iptal eder."""
+        if route.request.resource_type in LEAN_BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _wait_for_login(self, stop_event=None):
+        """
+        Giriş durumunu yoklar; QR gerekiyorsa görüntüsünü arayüze iletir ve okutulmasını bekler.
+        QR görüntüsü yalnızca kod (data-ref) değiştiğinde yeniden alınır. Durdurma sinyali gelirse
+        BroadcastCancelled fırlatılır.
+        """
+        search = self.page.locator(f"xpath={SEARCH_INPUT_XPATH}")
+        qr = self.page.locator(QR_CANVAS_CSS)
+        qr_shown = False
+        last_qr_ref = None
+        deadline = time.monotonic() + LOGIN_TIMEOUT
+        try:
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    raise BroadcastCancelled()
+                if await search.count():
+                    return
+                if await qr.count():
+                    qr_ref = await qr.first.evaluate(QR_REF_FUNCTION)
+                    if not qr_shown:
+                        self._log("Oturum açık değil: QR kodunu telefonunuzdaki WhatsApp ile okutun.", "info")
+                        deadline = time.monotonic() + QR_SCAN_TIMEOUT
+                    if self._qr_callback and (not qr_shown or qr_ref != last_qr_ref):
+                        self._qr_callback(await qr.first.screenshot())
+                    qr_shown = True
+                    last_qr_ref = qr_ref
+                if time.monotonic() > deadline:
+                    raise PlaywrightTimeoutError("WhatsApp Web oturumu zamanında açılmadı.")
+                await asyncio.sleep(LOGIN_PROBE_INTERVAL)
+        finally:
+            if qr_shown and self._qr_callback:
+                self._qr_callback(None)
+
+    async def close(self):
+        """Tarayıcı bağlamını ve Playwright sürecini kapatır."""
+        try:
+            if self.context is not None:
+                await self.context.close()
+        finally:
+            self.context = None
+            self.page = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    # --- Gönderim İşlemleri ---
+
+    async def open_chat(self, phone_clean):
+        """
+        Sohbeti açar: önce uygulama içi wa.me geçişi, olmazsa send?phone= adresi.
+        Mesaj kutusu ile geçersiz numara uyarısı yarıştırılır; 'ready' veya 'invalid' döner.
+        """
+        composer = self.page.locator(f"xpath={MESSAGE_BOX_XPATH}")
+        invalid = self.page.locator(f"xpath={INVALID_NUMBER_XPATH}")
+        either = composer.or_(invalid).first
+
+        opened_in_app = False
+        # Önceki alıcıdan kalan uyarı kapatılamazsa sayfa yeniden yüklenir (yükleme uyarıyı temizler).
+        if (self.page.url.startswith(WHATSAPP_WEB_URL) and await self.page.locator("#side").count()
+                and await self.dismiss_invalid_dialog()):
+            await self.page.evaluate(MARK_CURRENT_CHAT_FUNCTION, INVALID_NUMBER_XPATH)
+            await self.page.evaluate(IN_APP_NAV_FUNCTION, f"https://wa.me/{phone_clean}")
+            try:
+                await self.page.wait_for_function(CHAT_SWITCHED_FUNCTION, arg=INVALID_NUMBER_XPATH,
+                                                  timeout=IN_APP_NAV_TIMEOUT_MS, polling=200)
+                opened_in_app = True
+            except PlaywrightTimeoutError:
+                opened_in_app = False
+
+        if not opened_in_app:
+            await self.page.goto(f"{WHATSAPP_WEB_URL}/send?phone={phone_clean}", wait_until="domcontentloaded")
+
+        await either.wait_for(state="visible", timeout=CHAT_READY_TIMEOUT_MS)
+        return "invalid" if await invalid.count() else "ready"
+
+    async def insert_text(self, text):
+        """Metni tek çağrıda yapıştırır; doğrulanamazsa satır satır (Shift+Enter ile) yazar."""
+        composer = self.page.locator(f"xpath={MESSAGE_BOX_XPATH}").first
+        box_text = await composer.evaluate(PASTE_MESSAGE_FUNCTION, text)
+        if "".join((box_text or "").split()) == "".join(text.split()):
+            return
+        await composer.click()
+        await self.page.keyboard.press("Control+A")
+        await self.page.keyboard.press("Backspace")
+        lines = text.split("\n")
+        for i, line in enumerate(lines):
+            await self.page.keyboard.insert_text(line)
+            if i < len(lines) - 1:
+                await self.page.keyboard.press("Shift+Enter")
+
+    async def reset_page(self):
+        """Yarıda kesilen bir işlemden sonra sayfayı baştan yükler; sonraki alıcı temiz sayfayla başlar."""
+        await self.page.goto(WHATSAPP_WEB_URL, wait_until="domcontentloaded")
+
+    async def send(self):
+        """Enter'a basar ve mesajın tik ile onaylanmasını bekler. Onay süresini (sn) veya None döndürür."""
+        before = await self.page.locator(f"xpath={OUTGOING_BUBBLE_XPATH}").count()
+        self.enter_pressed = True      # Basış yarıda kesilse de mesaj gitmiş olabilir
+        await self.page.locator(f"xpath={MESSAGE_BOX_XPATH}").first.press("Enter")
+        sent_at = time.monotonic()
+        try:
+            await self.page.wait_for_function(
+                SEND_CONFIRMED_FUNCTION, arg=[OUTGOING_BUBBLE_XPATH, before, PENDING_ICON_CSS, SENT_ICON_CSS],
+                timeout=SEND_CONFIRM_TIMEOUT_MS, polling=100)
+            return time.monotonic() - sent_at
+        except PlaywrightTimeoutError:
+            return None
+
+    async def is_number_invalid(self):
+        """Geçersiz numara uyarısının ekranda olup olmadığını beklemeden kontrol eder."""
+        return await self.page.locator(f"xpath={INVALID_NUMBER_XPATH}").count() > 0
+
+    async def dismiss_invalid_dialog(self):
+        """
+        Geçersiz numara uyarısını OK düğmesiyle (yoksa Escape ile) kapatır. Uyarı yoksa veya
+        kapandıysa True, kapatılamadıysa False döndürür.
+        """
+        invalid = self.page.locator(f"xpath={INVALID_NUMBER_XPATH}")
+        if not await invalid.count():
+            return True
+        try:
+            buttons = self.page.locator(f"xpath={INVALID_DIALOG_BUTTON_XPATH}")
+            if await buttons.count():
+                await buttons.last.click(timeout=INVALID_DIALOG_DISMISS_TIMEOUT_MS)
+            else:
+                await self.page.keyboard.press("Escape")
+            await invalid.first.wait_for(state="hidden", timeout=INVALID_DIALOG_DISMISS_TIMEOUT_MS)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+
+class PlaywrightTransport(Transport):
+    """
+    PlaywrightEngine'i Transport arayüzüne uyarlar. Aynı Chrome profili iki tarayıcı tarafından
+    aynı anda kullanılamayacağı için oturum açılmadan önce SessionManager'ın tarayıcısı kapatılır.
+    """
+    name = "playwright"
+    uses_profile = True
+
+    def __init__(self, log_callback, session):
+        super().__init__(log_callback, session)
+        self._runner = None            # Playwright olay döngüsü iş parçacığı (yalnızca gönderim süresince)
+        self._engine = None            # Playwright motoru (yalnızca gönderim süresince)
+        self._page_dirty = False       # Yarıda kesilen işlem sayfayı belirsiz bir durumda bıraktı mı
+
+    def _run(self, coro, cancellable=True):
+        """
+        Coroutine'i motorun döngüsünde çalıştırır. Sonuç STOP_POLL_INTERVAL dilimleriyle beklenir;
+        durdurma sinyali gelirse BroadcastCancelled, PLAYWRIGHT_OPERATION_TIMEOUT aşılırsa
+        TimeoutError fırlatılır. Her iki durumda da coroutine iptal edilir ve sayfa sonraki alıcıdan
+        önce yeniden yüklenmek üzere işaretlenir; takılan işlem sayfayı sürmeye devam etmez.
+        """
+        future = self._runner.submit(coro)
+        deadline = time.monotonic() + PLAYWRIGHT_OPERATION_TIMEOUT
+        while True:
+            done, _ = concurrent.futures.wait([future], timeout=STOP_POLL_INTERVAL)
+            if done:
+                return future.result()
+            if cancellable and self.stop_event is not None and self.stop_event.is_set():
+                future.cancel()
+                self._page_dirty = True
+                raise BroadcastCancelled()
+            if time.monotonic() >= deadline:
+                future.cancel()
+                self._page_dirty = True
+                raise TimeoutError(f"Playwright işlemi {PLAYWRIGHT_OPERATION_TIMEOUT} sn içinde tamamlanmadı.")
+
+    def open_session(self, stop_event):
+        self.stop_event = stop_event
+        self._page_dirty = False
+        try:
+            # Aynı profil iki tarayıcıda açılamaz: süren Selenium ön başlatması (QR beklemesi dahil)
+            # kesilir ve tarayıcısı kapatılır; kilit beklemesi iptalle kesilebilir.
+            self.session.cancel_warm_up()
+            self.session.shutdown(stop_event)
+        except SessionCancelled:
+            return False
+        try:
+            self._runner = AsyncLoopRunner()
+            self._engine = PlaywrightEngine(self._log, self.session.profile_path, self.session.settings,
+                                            qr_callback=self.session._notify_qr)
+            self._runner.run(self._engine.init_session(stop_event))
+            self._log("WhatsApp Web oturumu başarıyla açıldı. Gönderim başlıyor...", "success")
+            return True
+        except BroadcastCancelled:
+            self.close()
+            return False
+        except Exception as e:
+            self._log(f"Playwright oturumu açılamadı. Hata: {e}", "error")
+            self.close()
+            return False
+
+    def close(self):
+        """Playwright tarayıcısını ve olay döngüsünü kapatır."""
+        try:
+            if self._engine is not None:
+                self._run(self._engine.close(), cancellable=False)
+        except Exception:
+            pass
+        finally:
+            if self._runner is not None:
+                self._runner.stop()
+            self._engine = None
+            self._runner = None
+
+    def _invalid_outcome(self):
+        """Alıcıyı geçersiz sayar ve uyarıyı kapatır; sonraki alıcı eski uyarıya takılmaz."""
+        try:
+            self._run(self._engine.dismiss_invalid_dialog())
+        except BroadcastCancelled:
+            raise
+        except Exception:
+            pass
+        return delivery_outcome(OUTCOME_INVALID, INVALID_NUMBER_REASON)
+
+    def deliver(self, recipient, text):
+        """
+        Sohbeti açar, metni yerleştirir, tempo kancasından sonra gönderir ve tik onayını bekler.
+        Enter'a basıldıktan sonraki hata, zaman aşımı veya iptalde mesaj tekrar gönderilmesin
+        diye sonuç 'UNCONFIRMED' olur.
+        """
+        self._engine.enter_pressed = False
+        if self._page_dirty:
+            try:
+                self._run(self._engine.reset_page())
+                self._page_dirty = False
+            except BroadcastCancelled:
+                raise
+            except Exception as e:
+                return delivery_outcome(OUTCOME_FAILED, "Sayfa yeniden yüklenemedi (yeniden denenebilir).", e,
+                                        retryable=True)
+        try:
+            if self._run(self._engine.open_chat(recipient['phone_clean'])) == 'invalid':
+                return self._invalid_outcome()
+
+            self._run(self._engine.insert_text(text))
+            self._before_send()
+
+            confirm_latency = self._run(self._engine.send())
+            if confirm_latency is not None:
+                return delivery_outcome(OUTCOME_SENT, confirm_latency=confirm_latency)
+            return delivery_outcome(OUTCOME_UNCONFIRMED)
+
+        except BroadcastCancelled:
+            if self._engine.enter_pressed:
+                return delivery_outcome(OUTCOME_UNCONFIRMED)
+            raise
+        except Exception as e:
+            if self._engine.enter_pressed:
+                self._log(f"Enter'a basıldıktan sonra hata: {e}", "error")
+                return delivery_outcome(OUTCOME_UNCONFIRMED)
+            try:
+                invalid = self._run(self._engine.is_number_invalid())
+            except Exception:
+                invalid = False
+            if invalid:
+                return self._invalid_outcome()
+            if isinstance(e, TimeoutError):
+                return delivery_outcome(OUTCOME_FAILED, "Zaman aşımı: tarayıcı yanıt vermedi (yeniden denenebilir).",
+                                        e, retryable=True)
+            return delivery_outcome(OUTCOME_FAILED, f"Mesaj kutusu bulunamadı/Gönderim hatası: {e}")
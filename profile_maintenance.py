@@ -0,0 +1,76 @@
+import os
+import shutil
+
+# --- Global Yapılandırma ve Sabitler ---
+# Profil klasörü bu boyutu (MB) aşarsa tarayıcı başlatılmadan önce önbellekler temizlenir.
+PROFILE_SIZE_LIMIT_MB = 1024
+
+# Her Chrome profil alt klasöründe (Default, Profile 1, ...) silinebilecek önbellekler.
+# Eşleştirilmiş WhatsApp oturumunu tutan IndexedDB, Local Storage, Session Storage ve
+# çerezler bu listede yoktur ve asla silinmez.
+PROFILE_CACHE_DIRS = [
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "DawnCache",
+    "DawnGraphiteCache",
+    "Media Cache",
+    os.path.join("Service Worker", "CacheStorage"),
+    os.path.join("Service Worker", "ScriptCache"),
+]
+# Profil kök klasöründe silinebilecek önbellekler.
+ROOT_CACHE_DIRS = [
+    "ShaderCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "component_crx_cache",
+    os.path.join("Crashpad", "completed"),
+]
+
+
+def directory_size_mb(path):
+    """Klasörün toplam boyutunu (MB) döndürür; okunamayan dosyalar atlanır."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file_name))
+            except OSError:
+                continue
+    return round(total / (1024 * 1024), 1)
+
+
+def _profile_subdirs(profile_path):
+    """Chrome kullanıcı verisi klasöründeki profil alt klasörlerini döndürür."""
+    try:
+        names = os.listdir(profile_path)
+    except OSError:
+        return []
+    return [os.path.join(profile_path, name) for name in names
+            if name == "Default" or name.startswith("Profile ")]
+
+
+def trim_profile(profile_path):
+    """
+    Profildeki HTTP, kod, GPU ve service worker önbelleklerini siler; oturumu tutan
+    depolama alanlarına dokunmaz. Tarayıcı bu profili kullanırken çağrılmamalıdır.
+    Öncesi/sonrası boyut ve silinen klasörleri içeren bir sözlük döndürür.
+    """
+    size_before = directory_size_mb(profile_path)
+    targets = [os.path.join(profile_path, name) for name in ROOT_CACHE_DIRS]
+    for subdir in _profile_subdirs(profile_path):
+        targets.extend(os.path.join(subdir, name) for name in PROFILE_CACHE_DIRS)
+
+    removed = []
+    for target in targets:
+        if os.path.isdir(target):
+            shutil.rmtree(target, ignore_errors=True)
+            removed.append(os.path.relpath(target, profile_path))
+
+    size_after = directory_size_mb(profile_path)
+    return {
+        'size_before_mb': size_before,
+        'size_after_mb': size_after,
+        'freed_mb': round(size_before - size_after, 1),
+        'removed': removed,
+    }
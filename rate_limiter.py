@@ -0,0 +1,140 @@
+import os
+import re
+import json
+import time
+import hashlib
+
+# Hız modu ön ayarları arayüzle ortaktır.
+from app_config import RATE_PRESETS, DEFAULT_PRESET
+
+# --- Global Yapılandırma ve Sabitler ---
+# Kova durumlarının profil başına saklandığı klasör (aynı numaranın sınırı çalıştırmalar arasında sürer).
+RATE_STATE_DIR = os.path.join(os.path.expanduser("~"), ".whatsapp_broadcaster", "rate_limits")
+
+# Kovalar: (ad, sınır anahtarı, süre sn)
+BUCKET_PERIODS = (('minute', 'per_minute', 60), ('hour', 'per_hour', 3600), ('day', 'per_day', 86400))
+
+
+def rate_state_path(profile_path):
+    """Chrome profil klasörüne özgü kova durumu dosyasının yolunu döndürür."""
+    profile_path = os.path.abspath(os.path.expanduser(profile_path))
+    digest = hashlib.sha1(profile_path.encode('utf-8')).hexdigest()[:10]
+    name = re.sub(r'[^A-Za-z0-9_.-]', '_', os.path.basename(profile_path)) or "profile"
+    return os.path.join(RATE_STATE_DIR, f"{name}_{digest}.json")
+
+
+class RateLimiter:
+    """
+    Dakika, saat ve gün için ayrı jeton kovaları. Her gönderim her kovadan bir jeton harcar ve
+    kovalar sürekli dolar (ör. saatte 400 -> 9 sn'de bir jeton). Dakika kovasının kapasitesi
+    'burst', saat ve gün kovalarınınki kendi sınırlarıdır. 'state_path' verilirse kovalar her
+    gönderimden sonra diske yazılır ve aynı profilin sonraki çalıştırmalarında kaldığı yerden sürer.
+    """
+    def __init__(self, limits, state_path=None):
+        self.limits = dict(limits)
+        self.state_path = state_path
+        self._buckets = {}             # Kova adı -> {'capacity', 'rate' (jeton/sn), 'tokens'}
+        for name, key, period in BUCKET_PERIODS:
+            limit = self.limits.get(key)
+            if not limit:
+                continue
+            capacity = max(1.0, float(self.limits.get('burst') or 1)) if name == 'minute' else float(limit)
+            self._buckets[name] = {'capacity': capacity, 'rate': limit / period, 'tokens': capacity}
+        self._updated_at = time.time()  # Kovaların en son doldurulduğu an (duvar saati; dosyada saklanır)
+        self._load_state()
+
+    @classmethod
+    def from_preset(cls, mode, state_path=None):
+        """Hız modu (SAFE/FAST/TURBO) ön ayarından sınırlayıcı oluşturur."""
+        return cls(RATE_PRESETS.get(mode, RATE_PRESETS[DEFAULT_PRESET]), state_path)
+
+    @property
+    def effective_per_minute(self):
+        """Uzun vadede sürdürülebilen hız (mesaj/dk): en kısıtlayıcı kovanın dolma hızı."""
+        if not self._buckets:
+            return None
+        return min(bucket['rate'] for bucket in self._buckets.values()) * 60
+
+    # --- Kova Durumu ---
+
+    def _load_state(self):
+        """Profilin kayıtlı kova durumunu okur; dosya yoksa veya bozuksa kovalar dolu başlar."""
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+            tokens = state['tokens']
+            updated_at = float(state['updated_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        for name, bucket in self._buckets.items():
+            if isinstance(tokens.get(name), (int, float)):
+                bucket['tokens'] = min(bucket['capacity'], float(tokens[name]))
+        # Saat geri alınmışsa kayıtlı an geleceğe düşmesin.
+        self._updated_at = min(updated_at, time.time())
+
+    def _save_state(self):
+        """Kova durumunu atomik olarak yazar (yarım kalan yazma önceki durumu bozmaz)."""
+        if not self.state_path:
+            return
+        state = {'updated_at': self._updated_at,
+                 'tokens': {name: round(bucket['tokens'], 4) for name, bucket in self._buckets.items()},
+                 'limits': self.limits}
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError:
+            pass
+
+    def _refill(self):
+        """Son dolumdan bu yana geçen süre kadar kovalara jeton ekler."""
+        now = time.time()
+        elapsed = max(0.0, now - self._updated_at)
+        for bucket in self._buckets.values():
+            bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + elapsed * bucket['rate'])
+        self._updated_at = now
+
+    def _next_slot(self):
+        """(bir sonraki gönderime kalan sn, bekleten kova adı) döndürür; hemen gönderilebiliyorsa (0, '')."""
+        self._refill()
+        wait, limited_by = 0.0, ''
+        for name, bucket in self._buckets.items():
+            bucket_wait = (1 - bucket['tokens']) / bucket['rate'] if bucket['tokens'] < 1 else 0.0
+            if bucket_wait > wait:
+                wait, limited_by = bucket_wait, name
+        return wait, limited_by
+
+    # --- Gönderim ---
+
+    def wait(self, sleep):
+        """
+        Tüm kovalarda jeton olana kadar bekler, jeton harcamaz. Bekleme için 'sleep(saniye)'
+        kullanılır (durdurma sinyaliyle kesilebilen bekleme verilmelidir).
+        """
+        while True:
+            wait, _ = self._next_slot()
+            if wait <= 0:
+                return
+            sleep(wait)
+
+    def acquire(self, sleep):
+        """Tüm kovalarda jeton olana kadar bekler (bkz. wait) ve her kovadan bir jeton harcar."""
+        self.wait(sleep)
+        for bucket in self._buckets.values():
+            bucket['tokens'] -= 1
+        self._save_state()
+
+    def status(self):
+        """
+        Arayüz için anlık durum: uzun vadeli ortalama hız, kova başına dolma hızı (mesaj/dk),
+        bir sonraki gönderim anı (unix) ve şu an bekleten kova ('' ise hiçbiri).
+        """
+        wait, limited_by = self._next_slot()
+        return {'effective_per_minute': self.effective_per_minute,
+                'bucket_rates': {name: bucket['rate'] * 60 for name, bucket in self._buckets.items()},
+                'next_slot_at': time.time() + wait,
+                'limited_by': limited_by}
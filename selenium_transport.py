@@ -0,0 +1,470 @@
+import re
+import time
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+from session_manager import SessionCancelled
+from operation_watchdog import OperationWatchdog, OperationTimeout
+from transport import (Transport, BroadcastCancelled, delivery_outcome, OUTCOME_SENT, OUTCOME_UNCONFIRMED,
+                       OUTCOME_INVALID, OUTCOME_FAILED, INVALID_NUMBER_REASON, STOP_POLL_INTERVAL)
+from whatsapp_selectors import (MESSAGE_BOX_XPATH, INVALID_NUMBER_XPATH, INVALID_DIALOG_BUTTON_XPATH, IN_APP_NAV_SCRIPT,
+                                PASTE_MESSAGE_SCRIPT, OUTGOING_BUBBLE_XPATH, PENDING_ICON_CSS, SENT_ICON_CSS)
+
+# --- Global Yapılandırma ve Sabitler ---
+
+# Sohbetin etkileşime hazır hale gelmesi için azami bekleme süresi (sn) ve kontrol sıklığı.
+CHAT_READY_TIMEOUT = 20
+CHAT_READY_POLL_INTERVAL = 0.2
+
+# Sohbet açma yöntemi: "inapp" yüklü WhatsApp Web içinde sohbet değiştirir,
+# "reload" her alıcı için send?phone= adresini baştan yükler (eski davranış, yedek yöntem).
+NAVIGATION_MODE = "inapp"
+# Uygulama içi geçişin gerçekleşmesi için beklenen süre (sn); aşılırsa driver.get'e düşülür.
+IN_APP_NAV_TIMEOUT = 5
+# Üst üste bu kadar uygulama içi geçiş başarısız olursa çalıştırma boyunca "reload" kullanılır.
+IN_APP_NAV_MAX_FAILURES = 3
+# Geçersiz numara uyarısının kapatıldıktan sonra ekrandan kalkması için beklenen süre (sn).
+INVALID_DIALOG_DISMISS_TIMEOUT = 3
+
+# Mesaj kutusuna metni tek seferde yerleştirme yöntemi: "paste" (tek WebDriver çağrısı,
+# emoji ve BMP dışı karakterleri destekler) veya "typing" (satır satır send_keys, yedek yöntem).
+INSERT_MODE = "paste"
+
+# Mesajın saat simgesinden tek tik durumuna geçmesi için azami bekleme süresi (sn).
+SEND_CONFIRM_TIMEOUT = 30
+SEND_CONFIRM_POLL_INTERVAL = 0.1
+
+# Tarayıcı geri dönüşümü: Chrome süreç ağacının belleği bu sınırı (MB) aşarsa veya son yeniden
+# başlatmadan beri bu kadar alıcı işlendiyse tarayıcı bir alıcı sınırında yeniden başlatılır (0 = kapalı).
+RECYCLE_RSS_LIMIT_MB = 1500
+RECYCLE_EVERY_N_RECIPIENTS = 1000
+# Bellek ölçümünün kaç alıcıda bir yapılacağı.
+MEMORY_SAMPLE_EVERY = 25
+
+# Watchdog: her WebDriver işleminin kendi zaman aşımına eklenen ek süre (sn). Bu da aşılırsa
+# tarayıcı öldürülüp yeniden başlatılır ve alıcı en fazla WATCHDOG_MAX_ATTEMPTS kez denenir.
+WATCHDOG_GRACE = 15
+WATCHDOG_MAX_ATTEMPTS = 2
+
+
+class SeleniumTransport(Transport):
+    """
+    WhatsApp Web'i Selenium ile süren iletim. Tarayıcı oturumu SessionManager'a aittir ve
+    gönderim sonunda kapatılmaz; takılan WebDriver çağrıları watchdog ile sonlandırılır.
+    """
+    name = "selenium"
+    uses_profile = True
+
+    def __init__(self, log_callback, session):
+        super().__init__(log_callback, session)
+        self.driver = None             # Bu gönderim için oturum yöneticisinden alınan WebDriver
+        # Askıda kalan WebDriver çağrılarını tarayıcıyı öldürerek sonlandıran bekçi.
+        self.watchdog = OperationWatchdog(self._on_watchdog_breach)
+        self._enter_pressed = False    # Mevcut alıcı için Enter'a basıldı mı (tekrar göndermeyi önler)
+        self.navigation_mode = NAVIGATION_MODE  # Sohbet açma yöntemi ("inapp" / "reload")
+        self._in_app_nav_failures = 0  # Üst üste başarısız uygulama içi geçiş sayısı
+        self._stale_invalid_dialogs = []  # Gezinmeden önce ekranda kalan uyarı öğeleri (geçersiz sayılmaz)
+        self._recipients_since_recycle = 0  # Son tarayıcı başlatmasından beri işlenen alıcı sayısı
+
+    # --- Oturum ---
+
+    def open_session(self, stop_event):
+        """
+        Oturum yöneticisinden gönderime hazır bir sürücü alır. Açık ve sağlıklı bir oturum
+        varsa yeniden kullanılır; yoksa Chrome başlatılır ve WhatsApp Web oturumu kontrol edilir.
+        """
+        self.stop_event = stop_event
+        self.navigation_mode = NAVIGATION_MODE
+        self._in_app_nav_failures = 0
+        self._recipients_since_recycle = 0
+        self.recycle_log = []
+        try:
+            self.driver = self.session.acquire(stop_event)
+            self._log("WhatsApp Web oturumu başarıyla açıldı. Gönderim başlıyor...", "success")
+            return True
+
+        except SessionCancelled:
+            self.driver = None
+            return False
+
+        except Exception as e:
+            self.session.shutdown()
+            self.driver = None
+            self._log(f"WhatsApp Web oturumu açılamadı. Hata: {e}", "error")
+            return False
+
+    def close(self):
+        """Tarayıcı kapatılmaz; oturum yöneticisinde bir sonraki gönderim için açık tutulur."""
+        self.watchdog.stop()
+        self.driver = None
+
+    def collect_metrics(self):
+        return self.session.collect_resource_metrics()
+
+    # --- Yardımcı Fonksiyonlar ---
+
+    def _wait(self, timeout, condition, poll_frequency=STOP_POLL_INTERVAL, ignored_exceptions=None):
+        """
+        WebDriverWait'i durdurma sinyaliyle kesilebilir hale getirir.
+        Koşul her denetlendiğinde sinyale bakılır; iptalde BroadcastCancelled fırlatılır.
+        """
+        def _interruptible(driver):
+            if self.stop_event.is_set():
+                raise BroadcastCancelled()
+            return condition(driver)
+
+        return WebDriverWait(self.driver, timeout, poll_frequency=min(poll_frequency, STOP_POLL_INTERVAL),
+                             ignored_exceptions=ignored_exceptions).until(_interruptible)
+
+    def _fresh_invalid_dialogs(self, driver):
+        """Mevcut gezinmeden sonra beliren geçersiz numara uyarısı öğelerini döndürür."""
+        return [element for element in driver.find_elements(By.XPATH, INVALID_NUMBER_XPATH)
+                if element not in self._stale_invalid_dialogs]
+
+    def _check_number_invalid(self):
+        """Geçersiz numara pop-up'ının şu anda ekranda olup olmadığını beklemeden kontrol eder."""
+        try:
+            return bool(self._fresh_invalid_dialogs(self.driver))
+        except Exception:
+            return False
+
+    def _dismiss_invalid_dialog(self):
+        """
+        Geçersiz numara uyarısını OK düğmesiyle (yoksa Escape ile) kapatır. Uyarı ekranda
+        değilse veya kapandıysa True, kapatılamadıysa False döndürür.
+        """
+        try:
+            if not self.driver.find_elements(By.XPATH, INVALID_NUMBER_XPATH):
+                return True
+            buttons = self.driver.find_elements(By.XPATH, INVALID_DIALOG_BUTTON_XPATH)
+            if buttons:
+                buttons[-1].click()
+            else:
+                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+            self._wait(INVALID_DIALOG_DISMISS_TIMEOUT,
+                       lambda driver: not driver.find_elements(By.XPATH, INVALID_NUMBER_XPATH),
+                       ignored_exceptions=(StaleElementReferenceException,))
+            return True
+        except (BroadcastCancelled, OperationTimeout):
+            raise
+        except Exception:
+            return False
+
+    def _invalid_outcome(self):
+        """Alıcıyı geçersiz sayar ve uyarıyı kapatır; sonraki alıcı eski uyarıya takılmaz."""
+        with self.watchdog.guard("uyarı kapatma", INVALID_DIALOG_DISMISS_TIMEOUT + WATCHDOG_GRACE):
+            self._dismiss_invalid_dialog()
+        return delivery_outcome(OUTCOME_INVALID, INVALID_NUMBER_REASON)
+
+    def _wait_for_chat_or_invalid(self):
+        """
+        Mesaj kutusu ile geçersiz numara pop-up'ını tek bir bekleme içinde yarıştırır.
+        Hangisi önce görünürse hemen döner:
+        ('ready', mesaj_kutusu) veya ('invalid', None). Hiçbiri gelmezse TimeoutException fırlatır.
+        """
+        def _chat_or_invalid(driver):
+            if self._fresh_invalid_dialogs(driver):
+                return 'invalid', None
+            boxes = driver.find_elements(By.XPATH, MESSAGE_BOX_XPATH)
+            if boxes and boxes[0].is_displayed() and boxes[0].is_enabled():
+                return 'ready', boxes[0]
+            return False
+
+        return self._wait(CHAT_READY_TIMEOUT, _chat_or_invalid, poll_frequency=CHAT_READY_POLL_INTERVAL,
+                          ignored_exceptions=(StaleElementReferenceException,))
+
+    def _open_chat_in_app(self, phone_clean):
+        """
+        Sayfayı yeniden yüklemeden, açık WhatsApp Web uygulaması içinde sohbeti açmayı dener.
+        Sohbet paneli değişirse (veya geçersiz numara uyarısı çıkarsa) True döndürür.
+        """
+        if not self.driver.current_url.startswith("https://web.whatsapp.com"):
+            return False
+        if not self.driver.find_elements(By.ID, "side"):
+            return False
+        # Önceki alıcıdan kalan uyarı kapatılamazsa sayfa yenilemeye düşülür (yenileme uyarıyı temizler).
+        if not self._dismiss_invalid_dialog():
+            return False
+
+        old_main = self.driver.find_elements(By.ID, "main")
+        handles_before = set(self.driver.window_handles)
+        self.driver.execute_script(IN_APP_NAV_SCRIPT, f"https://wa.me/{phone_clean}")
+
+        # Bağlantı yeni bir sekmede açıldıysa sekme kapatılır ve yedek yönteme geçilir.
+        new_handles = set(self.driver.window_handles) - handles_before
+        if new_handles:
+            current = self.driver.current_window_handle
+            for handle in new_handles:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(current if current not in new_handles else next(iter(handles_before)))
+            return False
+
+        def _chat_switched(driver):
+            if self._fresh_invalid_dialogs(driver):
+                return True
+            mains = driver.find_elements(By.ID, "main")
+            if not mains:
+                return False
+            return not old_main or mains[0] != old_main[0]
+
+        try:
+            self._wait(IN_APP_NAV_TIMEOUT, _chat_switched, poll_frequency=CHAT_READY_POLL_INTERVAL,
+                       ignored_exceptions=(StaleElementReferenceException,))
+            return True
+        except TimeoutException:
+            return False
+
+    def _open_chat(self, phone_clean):
+        """
+        Alıcının sohbetini açar. Önce uygulama içi geçiş denenir; başarısız olursa
+        send?phone= adresi oturum yöneticisinin zaman aşımlı gezinmesiyle yüklenir.
+        Kullanılan yöntemi döndürür.
+        """
+        # Gezinmeden önce ekranda olan uyarılar bu alıcının sonucu sayılmaz.
+        try:
+            self._stale_invalid_dialogs = self.driver.find_elements(By.XPATH, INVALID_NUMBER_XPATH)
+        except Exception:
+            self._stale_invalid_dialogs = []
+        if self.navigation_mode == "inapp":
+            try:
+                opened = self._open_chat_in_app(phone_clean)
+            except (BroadcastCancelled, OperationTimeout):
+                raise
+            except Exception:
+                opened = False
+
+            if opened:
+                self._in_app_nav_failures = 0
+                return "inapp"
+
+            self._in_app_nav_failures += 1
+            if self._in_app_nav_failures >= IN_APP_NAV_MAX_FAILURES:
+                self.navigation_mode = "reload"
+                self._log("Uygulama içi sohbet geçişi çalışmıyor; bu gönderim için sayfa yenileme yöntemine geçildi.", "error")
+
+        try:
+            self.session.navigate(f"https://web.whatsapp.com/send?phone={phone_clean}", self.stop_event)
+        except SessionCancelled:
+            raise BroadcastCancelled()
+        return "reload"
+
+    def _paste_message(self, message_box, message_content):
+        """
+        Mesajın tamamını tek bir WebDriver çağrısıyla kutuya yerleştirir.
+        Kutudaki metin beklenen içerikle eşleşirse True döndürür.
+        """
+        try:
+            box_text = self.driver.execute_async_script(PASTE_MESSAGE_SCRIPT, message_box, message_content)
+        except Exception:
+            return False
+        # Editörün satır sonu/boşluk gösterimi farklı olabileceğinden boşluklar yok sayılarak karşılaştırılır.
+        return re.sub(r'\s+', '', box_text or '') == re.sub(r'\s+', '', message_content)
+
+    def _type_message(self, message_box, message_content):
+        """Kutuyu temizler ve mesajı satır satır yazar (Çift yazma sorununu çözer)."""
+        message_box.click()
+        message_box.send_keys(Keys.CONTROL, 'a')
+        message_box.send_keys(Keys.BACKSPACE)
+
+        lines = message_content.split('\n')
+        for i, line in enumerate(lines):
+            message_box.send_keys(line)
+            if i < len(lines) - 1:
+                message_box.send_keys(Keys.SHIFT, Keys.ENTER)
+
+    def _insert_message(self, message_box, message_content):
+        """Mesajı kutuya yerleştirir; hızlı yapıştırma başarısız olursa satır satır yazmaya düşer."""
+        if INSERT_MODE == "paste" and self._paste_message(message_box, message_content):
+            return
+        self._type_message(message_box, message_content)
+
+    def _count_outgoing_bubbles(self):
+        """Açık sohbetteki giden mesaj balonlarının sayısını döndürür."""
+        return len(self.driver.find_elements(By.XPATH, OUTGOING_BUBBLE_XPATH))
+
+    def _wait_for_send_confirmation(self, bubbles_before):
+        """
+        Enter'a basıldıktan sonra yeni giden balonun saat (bekliyor) simgesinden
+        tik (gönderildi) simgesine geçmesini izler.
+        Onaylanırsa geçen süreyi (sn), zaman aşımında None döndürür.
+        """
+        sent_at = time.monotonic()
+
+        def _confirmed(driver):
+            bubbles = driver.find_elements(By.XPATH, OUTGOING_BUBBLE_XPATH)
+            if len(bubbles) <= bubbles_before:
+                return False
+            last_bubble = bubbles[-1]
+            if last_bubble.find_elements(By.CSS_SELECTOR, PENDING_ICON_CSS):
+                return False
+            return bool(last_bubble.find_elements(By.CSS_SELECTOR, SENT_ICON_CSS))
+
+        try:
+            self._wait(SEND_CONFIRM_TIMEOUT, _confirmed, poll_frequency=SEND_CONFIRM_POLL_INTERVAL,
+                       ignored_exceptions=(StaleElementReferenceException,))
+            return time.monotonic() - sent_at
+        except TimeoutException:
+            return None
+
+    # --- Gönderim ---
+
+    def _send_message(self, phone_clean, message_content):
+        """
+        Açık tarayıcıda bir kişiye mesajı gönderir ve sonucu döndürür.
+        Her WebDriver adımı watchdog son tarihiyle korunur; aşılırsa OperationTimeout fırlatılır.
+        """
+        self._enter_pressed = False
+        page_load_timeout = self.session.settings['page_load_timeout']
+
+        try:
+            # Uygulama içi deneme + yedek gezinme + DOM hazır olma beklemesi için toplam süre.
+            with self.watchdog.guard("sohbet açma", IN_APP_NAV_TIMEOUT + 2 * page_load_timeout + WATCHDOG_GRACE):
+                self._open_chat(phone_clean)
+
+            try:
+                # Mesaj kutusu veya geçersiz numara uyarısı; hangisi önce gelirse.
+                with self.watchdog.guard("sohbet bekleme", CHAT_READY_TIMEOUT + WATCHDOG_GRACE):
+                    chat_state, message_box = self._wait_for_chat_or_invalid()
+
+                if chat_state == 'invalid':
+                    return self._invalid_outcome()
+
+                # 1-2. Kutuyu temizle, mesajı yerleştir ve gönder
+                with self.watchdog.guard("mesaj yazma", self.session.settings['script_timeout'] + WATCHDOG_GRACE):
+                    self._insert_message(message_box, message_content)
+
+                # Sohbet hazır ve mesaj yazılmış halde, yalnızca Enter tempo için bekletilir.
+                self._before_send()
+
+                with self.watchdog.guard("gönderme", WATCHDOG_GRACE):
+                    bubbles_before = self._count_outgoing_bubbles()
+                    message_box.send_keys(Keys.ENTER)
+                    self._enter_pressed = True
+
+                # 3. Mesajın tek tik durumuna geçmesini bekle (gerçek 'SENT' anlamı)
+                with self.watchdog.guard("gönderim onayı", SEND_CONFIRM_TIMEOUT + WATCHDOG_GRACE):
+                    confirm_latency = self._wait_for_send_confirmation(bubbles_before)
+                if confirm_latency is not None:
+                    return delivery_outcome(OUTCOME_SENT, confirm_latency=confirm_latency)
+                return delivery_outcome(OUTCOME_UNCONFIRMED)
+
+            except (BroadcastCancelled, OperationTimeout):
+                raise
+            except Exception as e:
+                # Pop-up bekleme süresi dolduktan hemen sonra belirmiş olabilir; beklemeden bir kez daha bakılır.
+                if self._check_number_invalid():
+                    return self._invalid_outcome()
+                return delivery_outcome(OUTCOME_FAILED, f"Mesaj kutusu bulunamadı/Gönderim hatası: {e}")
+
+        except (BroadcastCancelled, OperationTimeout):
+            raise
+        except Exception as e:
+            return delivery_outcome(OUTCOME_FAILED, f"Genel Gönderim Hatası: {e}", e)
+
+    def deliver(self, recipient, text):
+        """
+        Alıcıyı watchdog koruması altında işler. Bir WebDriver işlemi askıda kalırsa tarayıcı
+        öldürülüp yeniden başlatılır ve alıcı yeniden denenir. Enter'a basıldıktan sonra oluşan
+        takılmalarda mesaj tekrar gönderilmez, 'UNCONFIRMED' olarak döndürülür.
+        """
+        index = recipient['index']
+        try:
+            if self.driver is None:
+                # Önceki yeniden başlatma başarısız oldu; alıcıdan önce tarayıcı tekrar açılmaya çalışılır.
+                self._restart_browser()
+            # Bellek büyümesi veya mesaj sayısı eşiği aşıldıysa tarayıcı burada yenilenir.
+            self._maybe_recycle_browser(index)
+        except BroadcastCancelled:
+            raise
+        except Exception as e:
+            return self._relaunch_failed(e)
+        self._recipients_since_recycle += 1
+
+        for attempt in range(1, WATCHDOG_MAX_ATTEMPTS + 1):
+            try:
+                return self._send_message(recipient['phone_clean'], text)
+            except OperationTimeout as e:
+                self._log(f"Takılma algılandı: {e} Tarayıcı yeniden başlatılıyor...", "error")
+                enter_pressed = self._enter_pressed
+                try:
+                    self._restart_browser()
+                except BroadcastCancelled:
+                    raise
+                except Exception as relaunch_error:
+                    if enter_pressed:
+                        self._log(f"Tarayıcı yeniden başlatılamadı: {relaunch_error}", "error")
+                        return delivery_outcome(OUTCOME_UNCONFIRMED)
+                    return self._relaunch_failed(relaunch_error)
+
+                if enter_pressed:
+                    return delivery_outcome(OUTCOME_UNCONFIRMED)
+                if attempt == WATCHDOG_MAX_ATTEMPTS:
+                    return delivery_outcome(OUTCOME_FAILED, "Zaman aşımı: tarayıcı yanıt vermedi (yeniden denenebilir).",
+                                            e, retryable=True)
+                self._log(f"{index + 1}. kişi yeniden deneniyor ({attempt + 1}/{WATCHDOG_MAX_ATTEMPTS})...", "info")
+
+    def _relaunch_failed(self, exception):
+        """
+        Tarayıcı yeniden başlatılamadığında alıcıyı yeniden denenebilir hata olarak döndürür. Gönderim
+        sürer; sonraki alıcıda tarayıcı tekrar açılmaya çalışılır.
+        """
+        self._log(f"Tarayıcı yeniden başlatılamadı: {exception}", "error")
+        return delivery_outcome(OUTCOME_FAILED, "Tarayıcı yeniden başlatılamadı (yeniden denenebilir).",
+                                exception, retryable=True)
+
+    def _on_watchdog_breach(self, label):
+        """Watchdog iş parçacığından çağrılır: askıda kalan tarayıcıyı zorla sonlandırır."""
+        self._log(f"'{label}' işlemi askıda kaldı. Tarayıcı sonlandırılıyor...", "error")
+        self.session.kill()
+
+    # --- Tarayıcı Yenileme ---
+
+    def _restart_browser(self):
+        """Tarayıcıyı yeniden başlatır ve tarayıcıya bağlı sayaçları sıfırlar."""
+        try:
+            self.driver = self.session.restart(self.stop_event)
+        except SessionCancelled:
+            raise BroadcastCancelled()
+        except Exception:
+            self.driver = None
+            raise
+        self._recipients_since_recycle = 0
+        self._in_app_nav_failures = 0
+
+    def _maybe_recycle_browser(self, index):
+        """
+        Tarayıcı belleğini periyodik olarak ölçer ve eşik aşıldığında tarayıcıyı alıcı sınırında
+        şeffaf biçimde yeniden başlatır. Döngü aynı 'index'ten devam eder.
+        """
+        reason = None
+        rss_before = None
+        if RECYCLE_EVERY_N_RECIPIENTS and self._recipients_since_recycle >= RECYCLE_EVERY_N_RECIPIENTS:
+            reason = f"{self._recipients_since_recycle} alıcı işlendi"
+        elif RECYCLE_RSS_LIMIT_MB and index > 0 and index % MEMORY_SAMPLE_EVERY == 0:
+            rss_before = self.session.browser_rss_mb()
+            if rss_before is not None and rss_before >= RECYCLE_RSS_LIMIT_MB:
+                reason = f"bellek {rss_before} MB >= {RECYCLE_RSS_LIMIT_MB} MB"
+        if reason is None:
+            return
+
+        if rss_before is None:
+            rss_before = self.session.browser_rss_mb()
+        self._log(f"Tarayıcı yenileniyor ({reason}). Gönderim {index + 1}. kişiden devam edecek...", "info")
+        started = time.monotonic()
+        self._restart_browser()
+        rss_after = self.session.browser_rss_mb()
+
+        self.recycle_log.append({
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'index': index,
+            'reason': reason,
+            'rss_before_mb': rss_before,
+            'rss_after_mb': rss_after,
+            'restart_seconds': round(time.monotonic() - started, 1)
+        })
+        self._log(f"Tarayıcı yenilendi. Bellek: {rss_before} MB -> {rss_after} MB", "success")
@@ -0,0 +1,537 @@
+import os
+import time
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException, TimeoutException
+
+from driver_resolver import resolve_chromedriver
+from profile_maintenance import PROFILE_SIZE_LIMIT_MB, directory_size_mb, trim_profile
+# Durdurma sinyali kontrol edilirken kullanılan bekleme aralığı tek yerde tanımlıdır.
+from transport import STOP_POLL_INTERVAL
+
+try:
+    import psutil # Tarayıcı süreç ağacının bellek ölçümü için (opsiyonel)
+except ImportError:
+    psutil = None
+
+# Profil yolu, tarayıcı ayarlarının varsayılanları ve oturum durumları arayüzle ortaktır.
+from app_config import (CHROME_PROFILE_PATH, DEFAULT_BROWSER_SETTINGS, PAGE_LOAD_STRATEGIES, STATE_CLOSED,
+                        STATE_LAUNCHING, STATE_QR_REQUIRED, STATE_READY, STATE_FAILED)
+
+# --- Global Yapılandırma ve Sabitler ---
+WHATSAPP_WEB_URL = "https://web.whatsapp.com"
+# Başarılı giriş kontrolü için beklenen sol paneldeki arama kutusu.
+SEARCH_INPUT_XPATH = '//*[@id="side"]//div[@role="textbox"]'
+# Giriş için okutulması gereken QR kodu (tuvali).
+QR_CANVAS_CSS = 'div[data-ref] canvas, canvas[aria-label*="QR"], canvas[aria-label*="Scan"]'
+# Oturumun eşitlenmesi (QR gerekmeden açılması) için azami bekleme süresi (sn).
+LOGIN_TIMEOUT = 60
+# QR kodu gösterilirken kullanıcının okutması için beklenen azami süre (sn).
+QR_SCAN_TIMEOUT = 300
+# Giriş durumunun yoklanma aralığı (sn).
+LOGIN_PROBE_INTERVAL = 0.5
+
+# Giriş yoklamasının sonuçları.
+LOGIN_READY = "ready"      # Oturum açık, sohbet listesi yüklü
+LOGIN_QR = "qr"            # QR kodu okutulmalı
+LOGIN_SYNCING = "syncing"  # Sayfa/oturum hâlâ yükleniyor veya eşitleniyor
+
+# Hafif modda eklenen düşük maliyetli Chrome bayrakları.
+LEAN_CHROME_FLAGS = [
+    "--blink-settings=imagesEnabled=false",   # <img> görsellerini hiç çözme/çizme (QR tuvali etkilenmez)
+    "--disable-extensions",                   # Eklenti süreçlerini başlatma
+    "--disable-background-networking",        # Arka plan güncelleme/ön getirme isteklerini kapat
+    "--disable-component-update",             # Bileşen güncelleyicisini kapat
+    "--disable-sync",                         # Google hesabı eşitlemesini kapat
+    "--disable-default-apps",                 # Varsayılan uygulamaları yükleme
+    "--no-first-run",                         # İlk çalıştırma sihirbazını atla
+    "--mute-audio",                           # Ses çıkışını ve ses işleme hattını kapat
+    "--autoplay-policy=user-gesture-required",  # Medyanın kendiliğinden oynatılmasını engelle
+    "--disable-features=Translate,MediaRouter,OptimizationHints",  # Çeviri, yayın ve ipucu hizmetleri
+]
+# Hafif modda CDP (Network.setBlockedURLs) ile hiç indirilmeyen kaynaklar:
+# profil fotoğrafları, medya/çıkartma sunucuları, görseller ve web yazı tipleri.
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*pps.whatsapp.net*",
+    "*mmg.whatsapp.net*",
+    "*media*.whatsapp.net*",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.mp4", "*.ogg", "*.opus", "*.mp3",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+]
+
+# Sayfanın aktardığı toplam bayt ve DOM büyüklüğünü ölçen betik.
+# Kaynak zamanlama tamponu, uzun çalıştırmalarda sayım kesilmesin diye büyütülür.
+RESOURCE_METRICS_SCRIPT = """
+performance.setResourceTimingBufferSize(100000);
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+const transferred = entries.reduce((total, e) => total + (e.transferSize || 0), 0);
+return {transferred: transferred, resources: entries.length, nodes: document.getElementsByTagName('*').length};
+"""
+
+
+class SessionCancelled(Exception):
+    """Oturum açma beklemesi durdurma sinyali ile kesildiğinde fırlatılır."""
+
+
+class SessionManager:
+    """
+    Chrome/WhatsApp Web oturumunun sahibidir. Tek bir gönderime değil uygulamaya aittir:
+    gönderimler arasında tarayıcı açık tutulur ve bir sonraki gönderime, ucuz bir sağlık
+    kontrolünden sonra zaten oturum açmış sürücü verilir. Tarayıcı yalnızca oturum gerçekten
+    ölmüşse yeniden başlatılır.
+    """
+    def __init__(self, log_callback, profile_path=CHROME_PROFILE_PATH, state_callback=None, qr_callback=None,
+                 settings=None):
+        self._log = log_callback           # (mesaj, etiket) alan loglama fonksiyonu
+        self._state_callback = state_callback  # Durum değiştiğinde çağrılır (arayüz göstergesi için)
+        self._qr_callback = qr_callback    # QR görüntüsü (PNG bayt) ile, giriş tamamlanınca None ile çağrılır
+        self.profile_path = profile_path   # Kullanılan Chrome profil klasörü
+        self.settings = dict(DEFAULT_BROWSER_SETTINGS, **(settings or {}))  # Tarayıcı ayarları
+        self.driver = None                 # Selenium WebDriver nesnesi
+        self.state = STATE_CLOSED          # Oturumun mevcut durumu
+        self._lock = threading.RLock()     # Aynı anda tek başlatma/devir işlemi
+        self._warmup_thread = None         # Arka planda ön başlatma yapan iş parçacığı
+        self._warmup_cancel = threading.Event()  # Süren ön başlatmayı (ör. QR beklemesini) keser
+        self._closing = threading.Event()  # Uygulama kapanırken ön başlatmayı keser
+        self.last_startup_seconds = None   # Son başlatmanın oturum hazır olana kadar süresi (QR hariç)
+
+    def _set_state(self, state):
+        """Oturum durumunu günceller ve arayüzü bilgilendirir."""
+        self.state = state
+        if self._state_callback:
+            self._state_callback(state)
+
+    # --- Sağlık Kontrolleri ---
+
+    def _driver_responsive(self):
+        """Sürücünün ve tarayıcının komutlara hâlâ yanıt verip vermediğini kontrol eder."""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def is_logged_in(self):
+        """WhatsApp Web'in açık ve oturumun hazır olup olmadığını beklemeden kontrol eder."""
+        try:
+            return (self.driver.current_url.startswith(WHATSAPP_WEB_URL)
+                    and bool(self.driver.find_elements(By.XPATH, SEARCH_INPUT_XPATH)))
+        except WebDriverException:
+            return False
+
+    def is_alive(self):
+        """Oturum sürücüsü yanıt veriyor ve WhatsApp Web'de oturum açıksa True döndürür."""
+        return self._driver_responsive() and self.is_logged_in()
+
+    # --- Oturum Yönetimi ---
+
+    def probe_login_state(self):
+        """
+        WhatsApp Web giriş durumunu beklemeden yoklar:
+        LOGIN_READY (oturum açık), LOGIN_QR (QR okutulmalı) veya LOGIN_SYNCING (yükleniyor).
+        """
+        if self.driver.find_elements(By.XPATH, SEARCH_INPUT_XPATH):
+            return LOGIN_READY
+        if self.driver.find_elements(By.CSS_SELECTOR, QR_CANVAS_CSS):
+            return LOGIN_QR
+        return LOGIN_SYNCING
+
+    def _capture_qr(self):
+        """Ekrandaki QR kodunun kimliğini (data-ref) ve PNG görüntüsünü döndürür."""
+        canvas = self.driver.find_element(By.CSS_SELECTOR, QR_CANVAS_CSS)
+        qr_ref = self.driver.execute_script(
+            "const el = arguments[0].closest('[data-ref]'); return el ? el.getAttribute('data-ref') : null;", canvas)
+        return qr_ref, canvas.screenshot_as_png
+
+    def _notify_qr(self, png_bytes):
+        """QR görüntüsünü (veya girişin tamamlandığını belirten None) arayüze iletir."""
+        if self._qr_callback:
+            self._qr_callback(png_bytes)
+
+    def _wait_for_login(self, stop_event=None):
+        """
+        Giriş durumunu olay güdümlü olarak izler ve oturum hazır olduğu anda döner.
+        QR gerekiyorsa görüntü yakalanıp arayüze gönderilir (WhatsApp kodu yeniledikçe güncellenir)
+        ve QR_SCAN_TIMEOUT boyunca beklenir; eşitleme için LOGIN_TIMEOUT uygulanır.
+        Durdurma sinyali gelirse SessionCancelled, süre dolarsa TimeoutException fırlatılır.
+        QR kodu gösterildiyse True döndürür.
+        """
+        last_state = None
+        last_qr_ref = None
+        state_since = time.monotonic()
+        try:
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    raise SessionCancelled()
+
+                try:
+                    login_state = self.probe_login_state()
+                except WebDriverException:
+                    login_state = LOGIN_SYNCING
+
+                if login_state != last_state:
+                    state_since = time.monotonic()
+                    if login_state == LOGIN_READY:
+                        self._log("WhatsApp Web oturumu hazır.", "success")
+                        return last_qr_ref is not None
+                    if login_state == LOGIN_QR:
+                        self._set_state(STATE_QR_REQUIRED)
+                        self._log("Oturum açık değil: QR kodunu telefonunuzdaki WhatsApp ile okutun (uygulama penceresinde gösteriliyor).", "info")
+                    else:
+                        self._set_state(STATE_LAUNCHING)
+                        self._log("WhatsApp Web yükleniyor/eşitleniyor...", "info")
+                    last_state = login_state
+
+                if login_state == LOGIN_QR:
+                    try:
+                        qr_ref, png_bytes = self._capture_qr()
+                        if qr_ref != last_qr_ref:
+                            last_qr_ref = qr_ref
+                            self._notify_qr(png_bytes)
+                    except WebDriverException:
+                        pass
+
+                timeout = QR_SCAN_TIMEOUT if login_state == LOGIN_QR else LOGIN_TIMEOUT
+                if time.monotonic() - state_since > timeout:
+                    raise TimeoutException(f"WhatsApp Web oturumu {timeout} sn içinde açılmadı.")
+
+                wait = stop_event.wait if stop_event is not None else time.sleep
+                wait(LOGIN_PROBE_INTERVAL)
+        finally:
+            if last_qr_ref is not None:
+                self._notify_qr(None)
+
+    def _launch(self, stop_event=None):
+        """Chrome tarayıcısını başlatır ve WhatsApp Web oturumunun açılmasını bekler."""
+        self._trim_profile_if_oversized()
+        started = time.monotonic()
+
+        options = webdriver.ChromeOptions()
+        options.add_argument(f"user-data-dir={self.profile_path}")
+        if self.settings['headless']:
+            width, height = self.settings['window_size']
+            options.add_argument("--headless=new")
+            options.add_argument(f"--window-size={width},{height}")
+        else:
+            options.add_argument("--start-maximized")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        if self.settings['page_load_strategy'] in PAGE_LOAD_STRATEGIES:
+            options.page_load_strategy = self.settings['page_load_strategy']
+        if self.settings['lean_mode']:
+            for flag in LEAN_CHROME_FLAGS:
+                options.add_argument(flag)
+
+        # Sürücü yolu yerel önbellekten çözümlenir; ağ erişimi yalnızca Chrome sürümü değiştiğinde gerekir.
+        driver_path = resolve_chromedriver(self._log)
+        self._log("Chrome başlatılıyor...", "info")
+        service = Service(driver_path) if driver_path else Service()
+        self.driver = webdriver.Chrome(service=service, options=options)
+        self.driver.set_page_load_timeout(self.settings['page_load_timeout'])
+        self.driver.set_script_timeout(self.settings['script_timeout'])
+        if self.settings['headless']:
+            self._prepare_headless()
+        if self.settings['lean_mode']:
+            self._apply_lean_blocking()
+        self.navigate(WHATSAPP_WEB_URL, stop_event)
+
+        self._log("Tarayıcı başlatıldı. Oturum durumu kontrol ediliyor...")
+        qr_shown = self._wait_for_login(stop_event)
+
+        # QR okutma süresi kullanıcıya bağlı olduğundan başlatma süresine dahil edilmez.
+        self.last_startup_seconds = None if qr_shown else round(time.monotonic() - started, 1)
+        if self.last_startup_seconds is not None:
+            self._log(f"Tarayıcı ve WhatsApp Web {self.last_startup_seconds} sn'de hazır oldu.", "info")
+
+    # --- Profil Bakımı ---
+
+    def _trim_profile_if_oversized(self):
+        """Başlatmadan önce profil klasörü PROFILE_SIZE_LIMIT_MB'yi aşıyorsa önbellekleri temizler."""
+        if not os.path.isdir(self.profile_path):
+            return
+        size_mb = directory_size_mb(self.profile_path)
+        if size_mb <= PROFILE_SIZE_LIMIT_MB:
+            return
+        self._log(f"Profil klasörü {size_mb} MB (sınır {PROFILE_SIZE_LIMIT_MB} MB). Önbellekler temizleniyor...", "info")
+        result = trim_profile(self.profile_path)
+        self._log(f"Profil temizlendi: {result['size_before_mb']} MB -> {result['size_after_mb']} MB. "
+                  f"Önceki başlatma süresi: {self.last_startup_seconds} sn.", "success")
+
+    def maintain_profile(self, stop_event=None):
+        """
+        İsteğe bağlı profil bakımı: tarayıcı açıksa kapatılır, önbellekler temizlenir ve tarayıcı
+        açıksa yeniden başlatılır. Öncesi/sonrası boyut ve başlatma süresini içeren sözlük döndürür.
+        """
+        self._acquire_lock(stop_event)
+        try:
+            was_open = self._driver_responsive()
+            startup_before = self.last_startup_seconds
+            self.shutdown()
+            result = trim_profile(self.profile_path)
+            result['startup_before_s'] = startup_before
+            result['startup_after_s'] = None
+            if was_open:
+                self._set_state(STATE_LAUNCHING)
+                try:
+                    self._launch(stop_event)
+                except Exception:
+                    self._set_state(STATE_FAILED)
+                    raise
+                self._set_state(STATE_READY)
+                result['startup_after_s'] = self.last_startup_seconds
+            return result
+        finally:
+            self._lock.release()
+
+    def _wait_dom_ready(self, stop_event=None):
+        """
+        Belgenin DOM'u kullanılabilir hale gelene kadar ('interactive' veya 'complete') bekler.
+        Süre page_load_timeout ile sınırlıdır; aşılırsa sayfanın kendi kontrollerine bırakılır.
+        """
+        deadline = time.monotonic() + self.settings['page_load_timeout']
+        while time.monotonic() < deadline:
+            if stop_event is not None and stop_event.is_set():
+                raise SessionCancelled()
+            try:
+                if self.driver.execute_script("return document.readyState") in ("interactive", "complete"):
+                    return True
+            except WebDriverException:
+                pass
+            time.sleep(0.1)
+        return False
+
+    def navigate(self, url, stop_event=None):
+        """
+        Adrese gider ve güvenli olan en erken anda döner. Seçilen yükleme stratejisi
+        driver.get'in ne kadar bloklayacağını belirler; takılan bir yükleme page_load_timeout
+        sonunda durdurulur ve çalıştırma asla askıda kalmaz.
+        """
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            self._log(f"Sayfa yüklemesi {self.settings['page_load_timeout']} sn'yi aştı; yükleme durdurulup devam ediliyor.", "info")
+            try:
+                self.driver.execute_script("window.stop();")
+            except WebDriverException:
+                pass
+        return self._wait_dom_ready(stop_event)
+
+    def _prepare_headless(self):
+        """
+        Görünmez modda görünüm alanını sabitler ve tarayıcı kimliğindeki 'HeadlessChrome'
+        ifadesini kaldırır (WhatsApp Web bu kimlikle desteklenmeyen tarayıcı uyarısı gösterir).
+        """
+        width, height = self.settings['window_size']
+        try:
+            self.driver.set_window_size(width, height)
+            user_agent = self.driver.execute_script("return navigator.userAgent")
+            self.driver.execute_cdp_cmd("Network.setUserAgentOverride",
+                                        {"userAgent": user_agent.replace("HeadlessChrome", "Chrome")})
+            self._log(f"Görünmez mod etkin ({width}x{height}).", "info")
+        except WebDriverException as e:
+            self._log(f"Görünmez mod ayarları uygulanamadı: {e}", "error")
+
+    def _apply_lean_blocking(self):
+        """Ağır kaynak isteklerini Chrome DevTools Protocol üzerinden engeller."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URL_PATTERNS})
+            self._log(f"Hafif mod etkin: {len(LEAN_BLOCKED_URL_PATTERNS)} kaynak kalıbı engelleniyor.", "info")
+        except WebDriverException as e:
+            self._log(f"Hafif mod CDP engellemesi uygulanamadı: {e}", "error")
+
+    # --- Kaynak Ölçümü ---
+
+    def browser_rss_mb(self):
+        """Chromedriver ve tüm Chrome alt süreçlerinin toplam bellek kullanımını (MB) döndürür."""
+        if psutil is None or self.driver is None:
+            return None
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+        except (psutil.Error, AttributeError):
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return round(total / (1024 * 1024), 1)
+
+    def collect_resource_metrics(self):
+        """
+        Tarayıcının anlık kaynak kullanımını ölçer: süreç ağacı belleği, JS yığını,
+        DOM düğüm sayısı ve sayfa yüklendiğinden beri aktarılan veri miktarı.
+        Ölçülemeyen değerler None olarak döner.
+        """
+        metrics = {'rss_mb': self.browser_rss_mb(), 'js_heap_mb': None, 'dom_nodes': None,
+                   'transferred_kb': None, 'resources': None}
+        if self.driver is None:
+            return metrics
+        try:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            perf = {m['name']: m['value'] for m in self.driver.execute_cdp_cmd("Performance.getMetrics", {})['metrics']}
+            metrics['js_heap_mb'] = round(perf.get('JSHeapUsedSize', 0) / (1024 * 1024), 1)
+        except (WebDriverException, KeyError):
+            pass
+        try:
+            page = self.driver.execute_script(RESOURCE_METRICS_SCRIPT)
+            metrics['transferred_kb'] = round(page['transferred'] / 1024, 1)
+            metrics['resources'] = page['resources']
+            metrics['dom_nodes'] = page['nodes']
+        except (WebDriverException, KeyError, TypeError):
+            pass
+        return metrics
+
+    def acquire(self, stop_event=None):
+        """
+        Gönderime hazır, oturum açmış bir sürücü döndürür.
+        Açık ve sağlıklı bir oturum varsa yeniden kullanılır; tarayıcı yanıt veriyor fakat
+        WhatsApp Web hazır değilse yalnızca sayfa yenilenir; aksi halde tarayıcı yeniden başlatılır.
+        """
+        self._acquire_lock(stop_event)
+        try:
+            try:
+                if self._driver_responsive():
+                    if self.is_logged_in():
+                        self._log("Açık WhatsApp Web oturumu yeniden kullanılıyor.", "info")
+                        self._set_state(STATE_READY)
+                        return self.driver
+                    self._set_state(STATE_LAUNCHING)
+                    self._log("Tarayıcı açık ancak WhatsApp Web hazır değil. Sayfa yenileniyor...", "info")
+                    self.navigate(WHATSAPP_WEB_URL, stop_event)
+                    self._wait_for_login(stop_event)
+                else:
+                    self.shutdown()
+                    self._set_state(STATE_LAUNCHING)
+                    self._launch(stop_event)
+            except SessionCancelled:
+                self._set_state(STATE_CLOSED if self.driver is None else STATE_FAILED)
+                raise
+            except Exception:
+                self._set_state(STATE_FAILED)
+                raise
+
+            self._set_state(STATE_READY)
+            return self.driver
+        finally:
+            self._lock.release()
+
+    def _acquire_lock(self, stop_event=None):
+        """
+        Oturum kilidini alır. Ön başlatma sürerken kilit beklenir; bu bekleme durdurma
+        sinyaliyle kesilebilir (SessionCancelled).
+        """
+        while not self._lock.acquire(timeout=STOP_POLL_INTERVAL):
+            if stop_event is not None and stop_event.is_set():
+                raise SessionCancelled()
+
+    def warm_up(self):
+        """
+        Tarayıcıyı ve WhatsApp Web oturumunu arka planda önceden başlatır (spekülatif ön ısıtma).
+        Oturum zaten hazırsa veya ön başlatma sürüyorsa bir şey yapmaz. Gönderim başladığında
+        acquire() devam eden ön başlatmanın bitmesini bekler ve hazır sürücüyü devralır.
+        """
+        if self.state in (STATE_READY, STATE_LAUNCHING, STATE_QR_REQUIRED):
+            return
+        if self._closing.is_set():
+            return
+        if self._warmup_thread and self._warmup_thread.is_alive():
+            return
+        cancel = self._warmup_cancel = threading.Event()
+
+        def _run():
+            try:
+                self.acquire(cancel)
+                self._log("Tarayıcı önceden başlatıldı; gönderim hemen başlayabilir.", "success")
+            except SessionCancelled:
+                pass
+            except Exception as e:
+                self._log(f"Tarayıcı ön başlatması başarısız oldu: {e}", "error")
+
+        self._warmup_thread = threading.Thread(target=_run, daemon=True)
+        self._warmup_thread.start()
+
+    def cancel_warm_up(self):
+        """
+        Süren ön başlatmayı keser. Ön başlatma QR okutulmasını beklerken kilidi tutar; tarayıcıyı
+        devralmak yerine kapatacak olan (ör. Playwright motoru) önce bunu çağırır.
+        """
+        self._warmup_cancel.set()
+
+    def restart(self, stop_event=None):
+        """Tarayıcıyı kapatıp yeniden başlatır ve yeni sürücüyü döndürür."""
+        self._acquire_lock(stop_event)
+        try:
+            self.shutdown()
+            self._set_state(STATE_LAUNCHING)
+            try:
+                self._launch(stop_event)
+            except Exception:
+                self._set_state(STATE_FAILED)
+                raise
+            self._set_state(STATE_READY)
+            return self.driver
+        finally:
+            self._lock.release()
+
+    def shutdown(self, stop_event=None):
+        """
+        Tarayıcıyı hatalara aldırmadan kapatır (uygulama kapanırken veya oturum öldüğünde).
+        Kilit beklemesi durdurma sinyaliyle kesilebilir (SessionCancelled).
+        """
+        self._acquire_lock(stop_event)
+        try:
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+            if self.state != STATE_LAUNCHING:
+                self._set_state(STATE_CLOSED)
+        finally:
+            self._lock.release()
+
+    def kill(self):
+        """
+        Askıda kalan tarayıcıyı zorla sonlandırır (watchdog tarafından başka bir iş parçacığından çağrılır).
+        Kilit alınmaz; bekleyen WebDriver çağrısı bağlantı hatasıyla döner. Sürücü nesnesi
+        yerinde bırakılır; bir sonraki acquire()/restart() onu ölü bulup yeniden başlatır.
+        """
+        driver = self.driver
+        if driver is None:
+            return
+        try:
+            process = driver.service.process
+        except AttributeError:
+            return
+        if process is None:
+            return
+        if psutil is not None:
+            try:
+                root = psutil.Process(process.pid)
+                for child in root.children(recursive=True):
+                    try:
+                        child.kill()
+                    except psutil.Error:
+                        pass
+            except psutil.Error:
+                pass
+        try:
+            process.kill()
+        except OSError:
+            pass
+        self._set_state(STATE_FAILED)
+
+    def close(self):
+        """Uygulama kapanırken çağrılır: devam eden ön başlatmayı keser ve tarayıcıyı kapatır."""
+        self._closing.set()
+        self.cancel_warm_up()
+        self.shutdown()
+        self._set_state(STATE_CLOSED)
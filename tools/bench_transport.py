@@ -0,0 +1,105 @@
+"""
+İletimleri (Transport) arayüz olmadan, BroadcasterLogic'in gerçek döngüsü ve raporlamasıyla ölçer.
+
+Kullanım:
+    python tools/bench_transport.py --transport fake --count 500 --no-pacing
+    python tools/bench_transport.py --transport cloud_api --count 2000 \\
+        --api-base http://127.0.0.1:8089/v19.0 --concurrency 16
+
+Alıcılar '--excel' ile verilen dosyadan okunur; verilmezse sentetik numaralar üretilir.
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from broadcaster_logic import BroadcasterLogic  # noqa: E402
+from transport import FakeTransport  # noqa: E402
+from cloud_api_transport import CloudApiTransport  # noqa: E402
+
+
+class ConsoleApp:
+    """BroadcasterLogic'in beklediği arayüz metotlarını konsola yönlendirir."""
+    def __init__(self, verbose=False):
+        self.verbose = verbose
+
+    def _log_to_terminal(self, message, tag="info"):
+        if self.verbose or tag != "success":
+            print(f"[{tag}] {message}")
+
+    def _update_list_status(self, index, status, tag):
+        pass
+
+    def _reset_list_colors(self):
+        pass
+
+    def update_progress(self):
+        pass
+
+    def update_rate_status(self, status):
+        pass
+
+    def cancel_broadcast(self, hard_stop=False):
+        pass
+
+    def _finish_broadcast(self, cancelled=False):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İletim ölçümü")
+    parser.add_argument('--transport', choices=['fake', 'cloud_api'], default='fake')
+    parser.add_argument('--count', type=int, default=500, help="Sentetik alıcı sayısı")
+    parser.add_argument('--excel', help="Alıcıların okunacağı Excel dosyası")
+    parser.add_argument('--template', default="Merhaba {name}, bu bir ölçüm mesajıdır.")
+    parser.add_argument('--speed', default='TURBO', choices=['SAFE', 'FAST', 'TURBO'])
+    parser.add_argument('--no-pacing', action='store_true', help="Hız sınırlayıcıyı devre dışı bırakır")
+    parser.add_argument('--latency', type=float, default=0.0, help="Sahte iletim gecikmesi (sn)")
+    parser.add_argument('--api-base', default=None)
+    parser.add_argument('--token', default='test')
+    parser.add_argument('--phone-number-id', default='123456')
+    parser.add_argument('--concurrency', type=int, default=None)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    app = ConsoleApp(args.verbose)
+    logic = BroadcasterLogic(app)
+    if args.excel:
+        ok, error = logic.load_data(args.excel)
+        if not ok:
+            sys.exit(error)
+    else:
+        logic.df_data = pd.DataFrame({
+            'phone': [f"555{i:07d}" for i in range(args.count)],
+            'name': [f"Kişi {i}" for i in range(args.count)],
+        })
+        logic.total_recipients = len(logic.df_data)
+    if args.no_pacing:
+        logic._create_rate_limiter = lambda mode: None
+
+    if args.transport == 'fake':
+        transport = FakeTransport(logic._log_to_gui, latency=args.latency)
+    else:
+        transport = CloudApiTransport(logic._log_to_gui, api_base=args.api_base, token=args.token,
+                                      phone_number_id=args.phone_number_id, concurrency=args.concurrency)
+
+    started = time.monotonic()
+    logic.start_broadcast(args.template, args.speed, transport=transport)
+    elapsed = time.monotonic() - started
+
+    processed = len(logic.sent_log) + len(logic.failed_log)
+    print(f"İletim: {transport.name} | alıcı: {processed} | gönderildi: {len(logic.sent_log)} | "
+          f"başarısız: {len(logic.failed_log)} | süre: {elapsed:.2f} sn | "
+          f"hız: {processed / elapsed if elapsed else 0:.1f} mesaj/sn")
+    print(f"Metrikler: {logic.run_metrics}")
+    result = logic.generate_reports()
+    if result:
+        print(f"Rapor: {result[1]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+WhatsApp Business Cloud API'nin yerel sahte sunucusu (çevrimdışı test ve ölçüm için).
+
+Kullanım:
+    python tools/mock_cloud_api.py --port 8089 --rate 80 --latency 0.05
+    WA_CLOUD_API_BASE=http://127.0.0.1:8089/v19.0 WA_CLOUD_TOKEN=test WA_CLOUD_PHONE_NUMBER_ID=123 python main.py
+
+Desteklenen uç noktalar:
+    GET  /{sürüm}/{numara_kimliği}            Numara bilgisi
+    POST /{sürüm}/{numara_kimliği}/messages   Metin mesajı gönderimi ('wamid' döner)
+
+Hız sınırı aşıldığında 429 (kod 130429), '--invalid-suffix' ile biten numaralarda 400 (kod 131026),
+'--error-rate' olasılığıyla 503 döner.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from aiohttp import web
+
+
+def _error(status, code, message, headers=None):
+    """Graph API biçiminde hata yanıtı oluşturur."""
+    return web.json_response({'error': {'message': message, 'type': 'OAuthException', 'code': code}},
+                             status=status, headers=headers)
+
+
+class MockCloudApi:
+    """Gelen istekleri sayar, yapay gecikme ve hız sınırı uygular."""
+    def __init__(self, rate, burst, latency, jitter, invalid_suffix, error_rate):
+        self.rate = rate                    # Saniyede kabul edilen mesaj (0 = sınırsız)
+        self.burst = burst or max(rate, 1)  # Kova kapasitesi
+        self.latency = latency
+        self.jitter = jitter
+        self.invalid_suffix = invalid_suffix
+        self.error_rate = error_rate
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self.stats = {'accepted': 0, 'rate_limited': 0, 'invalid': 0, 'errors': 0}
+
+    def _take_token(self):
+        """Hız sınırı kovasından bir jeton almaya çalışır."""
+        if not self.rate:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _authorized(self, request):
+        return request.headers.get('Authorization', '').startswith('Bearer ')
+
+    async def phone_number(self, request):
+        if not self._authorized(request):
+            return _error(401, 190, "Invalid OAuth access token.")
+        phone_id = request.match_info['phone_id']
+        return web.json_response({'id': phone_id, 'display_phone_number': '+90 555 000 00 00',
+                                  'verified_name': 'Mock Business'})
+
+    async def messages(self, request):
+        if not self._authorized(request):
+            return _error(401, 190, "Invalid OAuth access token.")
+        try:
+            body = await request.json()
+        except ValueError:
+            return _error(400, 100, "Invalid JSON body.")
+        to = str(body.get('to', ''))
+        if body.get('messaging_product') != 'whatsapp' or not to or body.get('type') != 'text':
+            return _error(400, 100, "Invalid parameter.")
+
+        await asyncio.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+        if not self._take_token():
+            self.stats['rate_limited'] += 1
+            return _error(429, 130429, "Rate limit hit.", headers={'Retry-After': '1'})
+        if self.invalid_suffix and to.endswith(self.invalid_suffix):
+            self.stats['invalid'] += 1
+            return _error(400, 131026, "Message undeliverable.")
+        if self.error_rate and random.random() < self.error_rate:
+            self.stats['errors'] += 1
+            return _error(503, 2, "Service temporarily unavailable.")
+
+        self.stats['accepted'] += 1
+        return web.json_response({
+            'messaging_product': 'whatsapp',
+            'contacts': [{'input': to, 'wa_id': to}],
+            'messages': [{'id': f"wamid.{uuid.uuid4().hex}"}],
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WhatsApp Business Cloud API sahte sunucusu")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--rate', type=float, default=80, help="Saniyede kabul edilen mesaj (0 = sınırsız)")
+    parser.add_argument('--burst', type=int, default=0, help="Hız sınırı kovası kapasitesi (varsayılan: rate)")
+    parser.add_argument('--latency', type=float, default=0.05, help="Yanıt gecikmesi (sn)")
+    parser.add_argument('--jitter', type=float, default=0.02, help="Gecikme sapması (sn)")
+    parser.add_argument('--invalid-suffix', default='0000', help="Bu sonekle biten numaralar geçersiz sayılır")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="503 dönme olasılığı (0-1)")
+    args = parser.parse_args()
+
+    api = MockCloudApi(args.rate, args.burst, args.latency, args.jitter, args.invalid_suffix, args.error_rate)
+    app = web.Application()
+    app.router.add_get('/{version}/{phone_id}', api.phone_number)
+    app.router.add_post('/{version}/{phone_id}/messages', api.messages)
+    try:
+        web.run_app(app, host=args.host, port=args.port)
+    finally:
+        print(f"İstatistikler: {api.stats}")
+
+
+if __name__ == '__main__':
+    main()
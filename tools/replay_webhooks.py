@@ -0,0 +1,106 @@
+"""
+Webhook alıcısına yük testi için sentetik Cloud API durum bildirimleri gönderir.
+
+Kullanım:
+    python tools/replay_webhooks.py --count 5000 --concurrency 32
+    python tools/replay_webhooks.py --ids-from ~/Documents/WhatsAppBroadcastRuns/run_.../sent_log.csv
+
+'--ids-from' verilirse mesaj kimlikleri bir çalıştırmanın sent_log.csv / progress_log.csv dosyasından
+okunur; böylece arayüzdeki satırlar ve results.xlsx gerçekten güncellenir. Her mesaj için
+'--sequence' sırasıyla (varsayılan sent, delivered, read) birer durum gönderilir.
+"""
+import argparse
+import asyncio
+import csv
+import hashlib
+import hmac
+import json
+import time
+import uuid
+
+import aiohttp
+
+
+def _status_payload(statuses):
+    """Cloud API webhook gövdesi biçiminde bir istek gövdesi oluşturur."""
+    return {
+        'object': 'whatsapp_business_account',
+        'entry': [{
+            'id': 'WABA_ID',
+            'changes': [{
+                'field': 'messages',
+                'value': {
+                    'messaging_product': 'whatsapp',
+                    'metadata': {'display_phone_number': '905550000000', 'phone_number_id': '123456'},
+                    'statuses': statuses,
+                },
+            }],
+        }],
+    }
+
+
+def _load_message_ids(path):
+    """CSV dosyasındaki 'message_id' sütununu okur."""
+    with open(path, encoding='utf-8') as f:
+        return [row['message_id'] for row in csv.DictReader(f) if row.get('message_id')]
+
+
+def _build_statuses(message_ids, sequence):
+    """Her mesaj için sıradaki durumları üretir; önce tüm 'sent', sonra tüm 'delivered' vb."""
+    now = int(time.time())
+    statuses = []
+    for step, status in enumerate(sequence):
+        for message_id in message_ids:
+            statuses.append({'id': message_id, 'status': status, 'timestamp': str(now + step),
+                             'recipient_id': '905550000000'})
+    return statuses
+
+
+async def _replay(args, statuses):
+    bodies = [json.dumps(_status_payload(statuses[i:i + args.per_request])).encode()
+              for i in range(0, len(statuses), args.per_request)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    results = {'ok': 0, 'failed': 0}
+
+    async def _post(session, body):
+        headers = {'Content-Type': 'application/json'}
+        if args.app_secret:
+            headers['X-Hub-Signature-256'] = "sha256=" + hmac.new(args.app_secret.encode(), body, hashlib.sha256).hexdigest()
+        async with semaphore:
+            try:
+                async with session.post(args.url, data=body, headers=headers) as response:
+                    results['ok' if response.status == 200 else 'failed'] += 1
+            except aiohttp.ClientError:
+                results['failed'] += 1
+
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        started = time.monotonic()
+        await asyncio.gather(*(_post(session, body) for body in bodies))
+        elapsed = time.monotonic() - started
+    print(f"İstek: {len(bodies)} (başarılı {results['ok']}, başarısız {results['failed']}) | "
+          f"durum: {len(statuses)} | süre: {elapsed:.2f} sn | "
+          f"hız: {len(statuses) / elapsed if elapsed else 0:.0f} durum/sn")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Webhook yük testi")
+    parser.add_argument('--url', default='http://127.0.0.1:8090/webhook')
+    parser.add_argument('--count', type=int, default=1000, help="Sentetik mesaj sayısı (--ids-from yoksa)")
+    parser.add_argument('--ids-from', help="message_id sütunu içeren CSV (sent_log.csv / progress_log.csv)")
+    parser.add_argument('--sequence', default='sent,delivered,read')
+    parser.add_argument('--per-request', type=int, default=1, help="Bir istekteki durum sayısı")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--app-secret', default='', help="X-Hub-Signature-256 imzası için uygulama sırrı")
+    args = parser.parse_args()
+
+    if args.ids_from:
+        message_ids = _load_message_ids(args.ids_from)
+    else:
+        message_ids = [f"wamid.{uuid.uuid4().hex}" for _ in range(args.count)]
+    statuses = _build_statuses(message_ids, [s.strip() for s in args.sequence.split(',') if s.strip()])
+    asyncio.run(_replay(args, statuses))
+
+
+if __name__ == '__main__':
+    main()
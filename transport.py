@@ -0,0 +1,145 @@
+import time
+import asyncio
+import threading
+
+# --- Global Yapılandırma ve Sabitler ---
+# deliver() sonucundaki durum değerleri. SENT ve UNCONFIRMED başarılı, INVALID ve FAILED başarısız sayılır.
+OUTCOME_SENT = "SENT"                  # Mesaj gönderildi ve onaylandı
+OUTCOME_UNCONFIRMED = "UNCONFIRMED"    # Mesaj gönderildi ancak onay zamanında gelmedi
+OUTCOME_INVALID = "INVALID"            # Numara WhatsApp kullanıcısı değil veya geçersiz
+OUTCOME_FAILED = "FAILED"              # Gönderim hatası
+DELIVERED_OUTCOMES = (OUTCOME_SENT, OUTCOME_UNCONFIRMED)
+
+INVALID_NUMBER_REASON = "Numara WhatsApp kullanıcısı değil veya geçersiz."
+
+# Durdurma sinyali kontrol edilirken tüm beklemelerde kullanılan en uzun aralık (sn).
+STOP_POLL_INTERVAL = 0.25
+
+
+class BroadcastCancelled(Exception):
+    """Gönderim, bir bekleme sırasında durdurma sinyali ile kesildiğinde fırlatılır."""
+
+
+def delivery_outcome(status, reason='', exception=None, confirm_latency=None, retryable=False, message_id=None):
+    """Transport.deliver() tarafından döndürülen sonuç sözlüğünü oluşturur."""
+    return {
+        'status': status,
+        'reason': reason,
+        'exception': exception,
+        'confirm_latency': confirm_latency,   # Gönderimden onaya geçen süre (sn) veya None
+        'retryable': retryable,               # Sonraki bir çalıştırmada yeniden denenebilir mi
+        'message_id': message_id              # İletimin verdiği mesaj kimliği (ör. Cloud API 'wamid'), yoksa None
+    }
+
+
+class AsyncLoopRunner:
+    """
+    Async iletimleri senkron gönderim döngüsünden çağırmak için kendi olay döngüsünü
+    ayrı bir iş parçacığında çalıştırır. Async nesneler (tarayıcı, HTTP oturumu) bu döngüye bağlıdır.
+    """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def run(self, coro, timeout=None):
+        """Coroutine'i döngüde çalıştırır ve sonucunu bekler."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def submit(self, coro):
+        """Coroutine'i döngüde başlatır ve beklemeden concurrent.futures.Future döndürür."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        """Olay döngüsünü durdurur."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+class Transport:
+    """
+    Mesaj iletim katmanının ortak arayüzü. BroadcasterLogic yalnızca bu arayüze bağlıdır;
+    Excel okuma, şablon, tempo, duraklatma ve raporlama her iletim yöntemi için aynıdır.
+
+    open_session(stop_event) -> bool    Oturumu gönderime hazırlar; başarısızsa False döner.
+    deliver(recipient, text) -> dict    Tek bir alıcıya gönderir ve delivery_outcome() döndürür.
+    close()                             Gönderim sonunda çağrılır.
+
+    'recipient' sözlüğü: index, phone (Excel'deki ham değer), name, phone_clean.
+    Geri alınamaz gönderim adımından hemen önce 'before_send' çağrılır (tempo beklemesi burada yapılır).
+
+    'concurrent' True olan iletimler ayrıca eşzamanlı gönderim sunar:
+    submit(recipient, text, on_done)    Gönderimi başlatır; eşzamanlılık sınırı doluysa yer açılana kadar bekler.
+                                        Sonuç hazır olunca on_done(recipient, text, outcome) çağrılır.
+    drain()                             Başlatılmış tüm gönderimlerin bitmesini bekler.
+
+    'status_webhooks' True olan iletimlerde sonuçtaki 'message_id', webhook ile gelen teslim ve
+    okunma durumlarını alıcıyla eşleştirmek için kullanılır.
+    """
+    name = "base"
+    concurrent = False
+    status_webhooks = False        # Teslim/okunma durumları sonradan webhook ile gelir mi (Cloud API)
+    uses_profile = False           # Chrome profilindeki numarayla mı gönderir (hız sınırı durumu profile bağlanır)
+
+    def __init__(self, log_callback, session=None):
+        self._log = log_callback
+        self.session = session         # Tarayıcı tabanlı iletimlerin kullandığı oturum yöneticisi
+        self.stop_event = None         # open_session ile verilen ortak durdurma sinyali
+        self.before_send = None        # Gönderimden hemen önce çağrılır (BroadcasterLogic tempo beklemesi)
+        self.recycle_log = []          # Oturum yenileme kayıtları (rapordaki 'Tarayıcı Yenileme' sayfası)
+
+    def open_session(self, stop_event):
+        raise NotImplementedError
+
+    def deliver(self, recipient, text):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def collect_metrics(self):
+        """Anlık kaynak kullanımı ölçümlerini döndürür (rapordaki 'Metrikler' sayfası)."""
+        return {}
+
+    def _sleep(self, seconds):
+        """Durdurma sinyaliyle kesilebilen bekleme. İptal edilirse BroadcastCancelled fırlatır."""
+        if seconds > 0 and self.stop_event.wait(seconds):
+            raise BroadcastCancelled()
+        if self.stop_event.is_set():
+            raise BroadcastCancelled()
+
+    def _before_send(self):
+        """Geri alınamaz gönderim adımından hemen önce tempo kancasını çalıştırır."""
+        if self.before_send is not None:
+            self.before_send()
+
+
+class FakeTransport(Transport):
+    """
+    Tarayıcı olmadan çalışan bellek içi iletim. Gönderim döngüsünü, şablonları, tempoyu ve
+    raporlamayı gerçek bir WhatsApp oturumu gerektirmeden denemek ve ölçmek için kullanılır.
+    """
+    name = "fake"
+
+    def __init__(self, log_callback, session=None, latency=0.0, invalid_numbers=(), unconfirmed_numbers=()):
+        super().__init__(log_callback, session)
+        self.latency = latency                         # Her gönderime eklenen yapay gecikme (sn)
+        self.invalid_numbers = set(invalid_numbers)    # Geçersiz sayılacak temiz numaralar
+        self.unconfirmed_numbers = set(unconfirmed_numbers)  # Onayı gelmeyecek temiz numaralar
+        self.delivered = []                            # Gönderilen (phone_clean, text) kayıtları
+
+    def open_session(self, stop_event):
+        self.stop_event = stop_event
+        self.delivered = []
+        self._log("Sahte iletim oturumu açıldı (gerçek mesaj gönderilmez).", "info")
+        return True
+
+    def deliver(self, recipient, text):
+        if recipient['phone_clean'] in self.invalid_numbers:
+            return delivery_outcome(OUTCOME_INVALID, INVALID_NUMBER_REASON)
+        self._before_send()
+        started = time.monotonic()
+        self._sleep(self.latency)
+        self.delivered.append((recipient['phone_clean'], text))
+        if recipient['phone_clean'] in self.unconfirmed_numbers:
+            return delivery_outcome(OUTCOME_UNCONFIRMED)
+        return delivery_outcome(OUTCOME_SENT, confirm_latency=time.monotonic() - started)
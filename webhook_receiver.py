@@ -0,0 +1,189 @@
+import os
+import json
+import hmac
+import hashlib
+import asyncio
+from collections import deque
+
+try:
+    from aiohttp import web
+except ImportError: # aiohttp opsiyoneldir: pip install aiohttp
+    web = None
+
+from transport import AsyncLoopRunner
+
+# --- Global Yapılandırma ve Sabitler ---
+# Cloud API durum bildirimlerinin (webhook) dinlendiği adres. Meta'nın erişebilmesi için bu adres
+# bir tünel veya ters vekil sunucu ile dışarı açılmalıdır (ör. https://alan-adi/webhook -> 127.0.0.1:8090).
+WEBHOOK_HOST = os.environ.get("WA_WEBHOOK_HOST", "127.0.0.1")
+WEBHOOK_PORT = int(os.environ.get("WA_WEBHOOK_PORT", "8090"))
+WEBHOOK_PATH = "/webhook"
+# Meta uygulama panelinde girilen doğrulama anahtarı ve (isteğe bağlı) imza doğrulaması için uygulama sırrı.
+WEBHOOK_VERIFY_TOKEN = os.environ.get("WA_WEBHOOK_VERIFY_TOKEN", "")
+WEBHOOK_APP_SECRET = os.environ.get("WA_WEBHOOK_APP_SECRET", "")
+
+# Gelen durumlar bu aralıkta (sn) veya tampon bu boyuta ulaştığında toplu olarak işlenir.
+FLUSH_INTERVAL = 0.5
+BATCH_SIZE = 500
+
+# Durumların ilerleme sırası; daha geride kalan (geç gelen) bir durum ileridekinin üzerine yazılmaz.
+STATUS_RANK = {'sent': 1, 'delivered': 2, 'read': 3, 'failed': 4}
+
+
+def parse_statuses(payload):
+    """Cloud API webhook gövdesindeki mesaj durumlarını düz bir listeye çevirir."""
+    statuses = []
+    for entry in payload.get('entry', []) or []:
+        for change in entry.get('changes', []) or []:
+            value = change.get('value', {}) or {}
+            for status in value.get('statuses', []) or []:
+                errors = status.get('errors') or []
+                statuses.append({
+                    'message_id': status.get('id'),
+                    'status': status.get('status'),
+                    'timestamp': status.get('timestamp'),
+                    'recipient_id': status.get('recipient_id'),
+                    'error': errors[0].get('title', '') if errors else '',
+                })
+    return [s for s in statuses if s['message_id'] and s['status'] in STATUS_RANK]
+
+
+class WebhookReceiver:
+    """
+    Cloud API durum bildirimlerini alan gömülü HTTP sunucusu. İstek işleyici yalnızca gövdeyi
+    ayrıştırıp tampona ekler ve hemen 200 döner; durumlar arka planda FLUSH_INTERVAL aralıklarla
+    toplu olarak 'on_batch(durum_listesi)' fonksiyonuna iletilir (olay döngüsü iş parçacığından).
+    """
+    def __init__(self, on_batch, log_callback, host=WEBHOOK_HOST, port=WEBHOOK_PORT,
+                 verify_token=WEBHOOK_VERIFY_TOKEN, app_secret=WEBHOOK_APP_SECRET):
+        if web is None:
+            raise RuntimeError("Webhook alıcısı için 'aiohttp' paketi gerekli: pip install aiohttp")
+        self._on_batch = on_batch
+        self._log = log_callback
+        self.host = host
+        self.port = port
+        self.verify_token = verify_token
+        self.app_secret = app_secret
+        self._runner = None            # Sunucunun çalıştığı olay döngüsü iş parçacığı
+        self._web_runner = None        # aiohttp.web.AppRunner
+        self._flush_task = None
+        self._buffer = deque()         # Henüz işlenmemiş durumlar
+        self._flush_now = None         # Tampon BATCH_SIZE'a ulaşınca kurulan asyncio.Event
+        self.stats = {'requests': 0, 'statuses': 0, 'batches': 0, 'rejected': 0}
+
+    @property
+    def is_running(self):
+        return self._web_runner is not None
+
+    # --- Sunucu ---
+
+    def start(self):
+        """Sunucuyu arka planda başlatır."""
+        if self.is_running:
+            return
+        self._runner = AsyncLoopRunner()
+        try:
+            self._runner.run(self._start())
+        except Exception:
+            self._runner.stop()
+            self._runner = None
+            raise
+        self._log(f"Webhook alıcısı dinlemede: http://{self.host}:{self.port}{WEBHOOK_PATH}", "info")
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get(WEBHOOK_PATH, self._handle_verify)
+        app.router.add_post(WEBHOOK_PATH, self._handle_event)
+        self._web_runner = web.AppRunner(app, access_log=None)
+        await self._web_runner.setup()
+        await web.TCPSite(self._web_runner, self.host, self.port).start()
+        self._flush_now = asyncio.Event()
+        self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    def stop(self):
+        """Kalan durumları işler ve sunucuyu kapatır."""
+        if not self.is_running:
+            return
+        try:
+            self._runner.run(self._stop(), timeout=10)
+        except Exception:
+            pass
+        finally:
+            self._runner.stop()
+            self._runner = None
+            self._web_runner = None
+
+    async def _stop(self):
+        self._flush_task.cancel()
+        await self._web_runner.cleanup()
+        self._flush()
+
+    # --- İstek İşleyiciler ---
+
+    async def _handle_verify(self, request):
+        """Meta'nın abonelik doğrulaması: hub.verify_token eşleşirse hub.challenge geri döndürülür."""
+        query = request.query
+        if query.get('hub.mode') == 'subscribe' and self.verify_token and query.get('hub.verify_token') == self.verify_token:
+            return web.Response(text=query.get('hub.challenge', ''))
+        return web.Response(status=403)
+
+    def _signature_valid(self, body, header):
+        """X-Hub-Signature-256 başlığını uygulama sırrıyla doğrular (sır tanımlı değilse atlanır)."""
+        if not self.app_secret:
+            return True
+        expected = "sha256=" + hmac.new(self.app_secret.encode(), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, header or '')
+
+    async def _handle_event(self, request):
+        """Durum bildirimini tampona ekler; ağır işlem yapılmaz."""
+        self.stats['requests'] += 1
+        body = await request.read()
+        if not self._signature_valid(body, request.headers.get('X-Hub-Signature-256')):
+            self.stats['rejected'] += 1
+            return web.Response(status=401)
+        try:
+            statuses = parse_statuses(json.loads(body))
+        except (ValueError, AttributeError):
+            self.stats['rejected'] += 1
+            return web.Response(status=400)
+        if statuses:
+            self._buffer.extend(statuses)
+            self.stats['statuses'] += len(statuses)
+            if len(self._buffer) >= BATCH_SIZE:
+                self._flush_now.set()
+        return web.Response(text="OK")
+
+    # --- Toplu İşleme ---
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            self._flush()
+
+    def _flush(self):
+        """
+        Tampondaki durumları mesaj başına birleştirip iletir. Her öğe en ileri durumu ve
+        görülen tüm durumların zaman damgalarını ('timestamps': {durum: unix_zamanı}) taşır.
+        """
+        if not self._buffer:
+            return
+        merged = {}
+        while self._buffer:
+            status = self._buffer.popleft()
+            item = merged.setdefault(status['message_id'], {
+                'message_id': status['message_id'], 'status': status['status'],
+                'recipient_id': status['recipient_id'], 'error': '', 'timestamps': {}})
+            item['timestamps'][status['status']] = status['timestamp']
+            if STATUS_RANK[status['status']] >= STATUS_RANK[item['status']]:
+                item['status'] = status['status']
+            if status['error']:
+                item['error'] = status['error']
+        self.stats['batches'] += 1
+        try:
+            self._on_batch(list(merged.values()))
+        except Exception as e:
+            self._log(f"Webhook durumları işlenemedi: {e}", "error")
@@ -0,0 +1,45 @@
+# WhatsApp Web DOM seçicileri ve sayfaya enjekte edilen betikler.
+# Selenium ve Playwright motorları tarafından ortak kullanılır; WhatsApp Web arayüzü
+# değiştiğinde yalnızca bu dosyanın güncellenmesi yeterlidir.
+
+# Sohbetin mesaj yazmaya hazır olduğunu anlamak için beklenen mesaj kutusu.
+MESSAGE_BOX_XPATH = '//*[@id="main"]//footer//*[@contenteditable="true"]'
+# WhatsApp Web'in kayıtlı olmayan/geçersiz numaralar için gösterdiği uyarı metni.
+INVALID_NUMBER_XPATH = ('//*[contains(text(), "telefon numarası geçersiz")] | //*[contains(text(), "WhatsApp kullanıcısı değil")]'
+                        ' | //*[contains(text(), "phone number shared via url is invalid")]')
+# Geçersiz numara uyarısını kapatan düğme (OK/Tamam). Sayfa yenilenmeyen uygulama içi geçişte
+# uyarı kendiliğinden kapanmaz; kapatılmazsa sonraki alıcılar da geçersiz sanılır.
+INVALID_DIALOG_BUTTON_XPATH = '//*[@role="dialog"]//button | //*[@data-animate-modal-popup="true"]//button'
+
+# WhatsApp Web'in kendi bağlantı işleyicisini tetikleyen geçici bir wa.me bağlantısı oluşturup tıklar.
+_IN_APP_NAV_BODY = """
+const link = document.createElement('a');
+link.href = url;
+link.rel = 'noopener';
+link.style.display = 'none';
+(document.getElementById('app') || document.body).appendChild(link);
+link.click();
+link.remove();
+"""
+IN_APP_NAV_SCRIPT = "const url = arguments[0];" + _IN_APP_NAV_BODY               # Selenium execute_script
+IN_APP_NAV_FUNCTION = "(url) => {" + _IN_APP_NAV_BODY + "}"                        # Playwright evaluate
+
+# Kutuyu temizler, metni sentetik bir yapıştırma olayıyla ekler ve editör güncellendikten
+# sonra kutunun metnini döndürür (doğrulama için).
+_PASTE_MESSAGE_BODY = """
+box.focus();
+document.execCommand('selectAll', false, null);
+document.execCommand('delete', false, null);
+const data = new DataTransfer();
+data.setData('text/plain', text);
+box.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+requestAnimationFrame(() => setTimeout(() => done(box.innerText), 0));
+"""
+PASTE_MESSAGE_SCRIPT = ("const box = arguments[0], text = arguments[1], done = arguments[arguments.length - 1];"
+                        + _PASTE_MESSAGE_BODY)                                    # Selenium execute_async_script
+PASTE_MESSAGE_FUNCTION = "(box, text) => new Promise((done) => {" + _PASTE_MESSAGE_BODY + "})"  # Playwright evaluate
+
+# Gönderilen (giden) mesaj balonları ve üzerlerindeki durum simgeleri.
+OUTGOING_BUBBLE_XPATH = '//*[@id="main"]//div[contains(@class, "message-out")]'
+PENDING_ICON_CSS = 'span[data-icon="msg-time"]'
+SENT_ICON_CSS = 'span[data-icon="msg-check"], span[data-icon="msg-dblcheck"], span[data-icon="msg-dblcheck-ack"]'
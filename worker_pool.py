@@ -0,0 +1,255 @@
+import os
+import json
+import queue
+import threading
+
+from session_manager import SessionManager
+from app_config import CHROME_PROFILE_PATH
+from selenium_transport import SeleniumTransport
+from transport import (Transport, BroadcastCancelled, delivery_outcome, OUTCOME_FAILED, DELIVERED_OUTCOMES,
+                       STOP_POLL_INTERVAL)
+from rate_limiter import RateLimiter, rate_state_path
+
+# --- Global Yapılandırma ve Sabitler ---
+# Her biri ayrı bir WhatsApp numarasıyla eşleştirilmiş Chrome profillerinin listesi. Örnek:
+# [{"name": "Hat 1", "profile_path": "~/whatsapp_profile", "max_per_minute": 6, "max_per_day": 800},
+#  {"name": "Hat 2", "profile_path": "~/whatsapp_profile_2", "max_per_minute": 4}]
+# 'max_per_hour' ve 'max_per_day' isteğe bağlıdır (verilmezse o süre için sınır uygulanmaz).
+PROFILES_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".whatsapp_broadcaster", "profiles.json")
+# Yapılandırmada belirtilmezse bir profilin dakikada gönderebileceği en fazla mesaj.
+DEFAULT_MAX_PER_MINUTE = 6
+# Bekleyen iş kuyruğunun profil başına boyutu; gönderim döngüsü işçilerden fazla öne geçmez.
+QUEUE_SLOTS_PER_WORKER = 1
+# Bir profil art arda bu kadar yeniden denenebilir hata (tarayıcı takılması, yeniden başlatılamama)
+# verirse devreden çıkarılır ve son işi diğer profiller için kuyruğa geri konur.
+WORKER_MAX_CONSECUTIVE_FAILURES = 3
+# Kapanışta bir işçinin elindeki gönderimi bitirmesi için beklenen azami süre (sn).
+WORKER_JOIN_TIMEOUT = 30
+
+
+def load_profiles(path=PROFILES_CONFIG_PATH):
+    """
+    Profil yapılandırmasını okur. Dosya yoksa veya bozuksa varsayılan profil tek başına döner.
+    Her öğe: name, profile_path, max_per_minute, max_per_hour, max_per_day.
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = []
+    profiles = []
+    for i, entry in enumerate(entries if isinstance(entries, list) else []):
+        if not isinstance(entry, dict) or not entry.get('profile_path'):
+            continue
+        profiles.append({
+            'name': entry.get('name') or f"Profil {i + 1}",
+            'profile_path': os.path.expanduser(entry['profile_path']),
+            'max_per_minute': float(entry.get('max_per_minute') or DEFAULT_MAX_PER_MINUTE),
+            'max_per_hour': entry.get('max_per_hour'),
+            'max_per_day': entry.get('max_per_day'),
+        })
+    if not profiles:
+        profiles.append({'name': "Profil 1", 'profile_path': CHROME_PROFILE_PATH,
+                         'max_per_minute': DEFAULT_MAX_PER_MINUTE, 'max_per_hour': None, 'max_per_day': None})
+    return profiles
+
+
+class ProfileWorker:
+    """Tek bir profilin oturumu, iletimi ve kendi gönderim hızı sınırı."""
+    def __init__(self, profile, session, log_callback):
+        self.name = profile['name']
+        self.max_per_minute = profile['max_per_minute']
+        self.session = session
+        self.owns_session = False      # Oturum bu havuz için mi açıldı (kapanışta kapatılır)
+        # Profilin numarasına ait kovalar; durum profile özgü dosyada çalıştırmalar arasında sürer.
+        self.rate_limiter = RateLimiter({'per_minute': profile['max_per_minute'], 'per_hour': profile.get('max_per_hour'),
+                                         'per_day': profile.get('max_per_day'), 'burst': 1},
+                                        rate_state_path(profile['profile_path']))
+        self.transport = SeleniumTransport(log_callback, session)
+        self.transport.before_send = self._pace
+        self.thread = None
+        self.processed = 0
+        self.delivered = 0
+        self.consecutive_failures = 0  # Art arda yeniden denenebilir hata sayısı
+        self.retired = False           # Tarayıcısı sürekli hata verdiği için devreden çıkarıldı mı
+
+    def _pace(self):
+        """Profilin hız sınırı: kovalarda gönderim hakkı olana kadar bekler."""
+        self.rate_limiter.acquire(self.transport._sleep)
+
+
+class ProfileWorkerPool(Transport):
+    """
+    Yapılandırılmış her profil için bir oturum açar ve alıcıları tek bir ortak kuyruktan dağıtır.
+    Her profil kendi hız sınırını (dakikada en fazla mesaj) bağımsız uygular; boşta olan profil
+    sıradaki alıcıyı alır. Sonuçlar on_done ile BroadcasterLogic'in ortak kayıtlarına işlenir.
+    """
+    name = "multi_profile"
+    concurrent = True
+
+    def __init__(self, log_callback, session=None, profiles=None):
+        super().__init__(log_callback, session)
+        self.profiles = profiles if profiles is not None else load_profiles()
+        self.workers = []
+        self._jobs = None              # Ortak iş kuyruğu: (recipient, text, on_done)
+        self._retry_jobs = queue.Queue()  # Devreden çıkan profillerden geri konan işler (önce alınır)
+        self._in_flight = 0            # Kuyrukta veya işlenmekte olan iş sayısı
+        self._in_flight_lock = threading.Lock()
+        self._closing = threading.Event()  # close() ile kurulur; işçiler normal bitişte de durur
+
+    # --- Oturum ---
+
+    def _session_for(self, profile):
+        """Profil için oturum yöneticisi döndürür; uygulamanın kendi profili ise açık oturumu kullanır."""
+        if self.session is not None and os.path.abspath(profile['profile_path']) == os.path.abspath(self.session.profile_path):
+            return self.session, False
+        qr_callback = self.session._notify_qr if self.session is not None else None
+        settings = self.session.settings if self.session is not None else None
+        return SessionManager(self._prefixed_log(profile['name']), profile_path=profile['profile_path'],
+                              qr_callback=qr_callback, settings=settings), True
+
+    def _prefixed_log(self, name):
+        return lambda message, tag="info": self._log(f"[{name}] {message}", tag)
+
+    def open_session(self, stop_event):
+        """Profillerin oturumlarını sırayla açar (QR gerekirse tek tek okutulur) ve işçileri başlatır."""
+        self.stop_event = stop_event
+        self.workers = []
+        for profile in self.profiles:
+            if stop_event.is_set():
+                break
+            session, owns_session = self._session_for(profile)
+            worker = ProfileWorker(profile, session, self._prefixed_log(profile['name']))
+            worker.owns_session = owns_session
+            if worker.transport.open_session(stop_event):
+                # Tarayıcı yenileme kayıtları tüm profiller için tek listede toplanır.
+                worker.transport.recycle_log = self.recycle_log
+                self.workers.append(worker)
+            elif owns_session:
+                session.close()
+
+        if not self.workers:
+            self._log("Hiçbir profil için oturum açılamadı.", "error")
+            return False
+
+        total_rate = sum(worker.max_per_minute for worker in self.workers)
+        self._log(f"{len(self.workers)} profil hazır (toplam en fazla {total_rate:g} mesaj/dk).", "success")
+        self._jobs = queue.Queue(maxsize=len(self.workers) * QUEUE_SLOTS_PER_WORKER)
+        self._retry_jobs = queue.Queue()
+        self._in_flight = 0
+        self._closing.clear()
+        for worker in self.workers:
+            worker.thread = threading.Thread(target=self._work, args=(worker,), daemon=True)
+            worker.thread.start()
+        return True
+
+    def close(self):
+        """İşçileri durdurup bitmelerini bekler; havuzun açtığı tarayıcıları kapatır, uygulamanın oturumunu açık bırakır."""
+        self._closing.set()
+        for worker in self.workers:
+            if worker.thread is not None:
+                worker.thread.join(timeout=WORKER_JOIN_TIMEOUT)
+                if worker.thread.is_alive():
+                    self._log(f"[{worker.name}] İşçi zamanında durmadı; oturumu açık bırakılıyor.", "error")
+                    continue
+            worker.transport.close()
+            if worker.owns_session:
+                worker.session.close()
+
+    def collect_metrics(self):
+        metrics = {}
+        for worker in self.workers:
+            metrics[f"{worker.name}_processed"] = worker.processed
+            metrics[f"{worker.name}_delivered"] = worker.delivered
+            metrics[f"{worker.name}_max_per_minute"] = worker.max_per_minute
+            metrics[f"{worker.name}_retired"] = worker.retired
+        return metrics
+
+    # --- Gönderim ---
+
+    def _active_workers(self):
+        return [worker for worker in self.workers if not worker.retired]
+
+    def _next_job(self):
+        """Önce geri konan işleri, sonra ortak kuyruğu dener; iş yoksa None döner."""
+        try:
+            return self._retry_jobs.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._jobs.get(timeout=STOP_POLL_INTERVAL)
+        except queue.Empty:
+            return None
+
+    def _should_retire(self, worker, outcome):
+        """
+        Art arda yeniden denenebilir hatalarda profili devreden çıkarır. Son etkin profil çıkarılmaz;
+        her alıcıda tarayıcıyı yeniden açmayı denemeye devam eder.
+        """
+        if outcome['status'] == OUTCOME_FAILED and outcome['retryable']:
+            worker.consecutive_failures += 1
+        else:
+            worker.consecutive_failures = 0
+        if worker.consecutive_failures < WORKER_MAX_CONSECUTIVE_FAILURES or len(self._active_workers()) <= 1:
+            return False
+        worker.retired = True
+        self._log(f"[{worker.name}] Art arda {worker.consecutive_failures} hata; profil devreden çıkarıldı. "
+                  f"Alıcılar diğer profillerle gönderilecek.", "error")
+        return True
+
+    def _work(self, worker):
+        """İşçi döngüsü: ortak kuyruktan alıcı alır, profilin iletimiyle gönderir ve sonucu bildirir."""
+        while not self.stop_event.is_set() and not self._closing.is_set():
+            job = self._next_job()
+            if job is None:
+                continue
+            recipient, text, on_done = job
+            try:
+                outcome = worker.transport.deliver(recipient, text)
+            except BroadcastCancelled:
+                with self._in_flight_lock:
+                    self._in_flight -= 1
+                return
+            except Exception as e:
+                outcome = delivery_outcome(OUTCOME_FAILED, f"Genel Gönderim Hatası: {e}", e, retryable=True)
+
+            if self._should_retire(worker, outcome):
+                # İş kayda geçmeden diğer profiller için geri konur (uçuştaki iş sayısı değişmez).
+                self._retry_jobs.put(job)
+                return
+
+            with self._in_flight_lock:
+                self._in_flight -= 1
+            worker.processed += 1
+            if outcome['status'] in DELIVERED_OUTCOMES:
+                worker.delivered += 1
+            on_done(recipient, text, outcome)
+
+    def deliver(self, recipient, text):
+        """Alıcıyı ilk profilin iletimiyle doğrudan gönderir (kuyruk kullanılmaz)."""
+        return self.workers[0].transport.deliver(recipient, text)
+
+    def submit(self, recipient, text, on_done):
+        """Alıcıyı ortak kuyruğa ekler; kuyruk doluysa (tüm profiller meşgul) yer açılana kadar bekler."""
+        with self._in_flight_lock:
+            self._in_flight += 1
+        while True:
+            try:
+                self._jobs.put((recipient, text, on_done), timeout=STOP_POLL_INTERVAL)
+                return
+            except queue.Full:
+                if self.stop_event.is_set():
+                    with self._in_flight_lock:
+                        self._in_flight -= 1
+                    raise BroadcastCancelled()
+
+    def drain(self):
+        """Kuyruktaki ve işlenmekte olan tüm alıcıların bitmesini bekler."""
+        while True:
+            with self._in_flight_lock:
+                if self._in_flight <= 0:
+                    return
+            if not any(worker.thread.is_alive() for worker in self._active_workers()):
+                return
+            if self.stop_event.wait(STOP_POLL_INTERVAL):
+                raise BroadcastCancelled()